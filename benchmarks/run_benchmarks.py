@@ -0,0 +1,360 @@
+import numpy as np
+import argparse
+import tempfile
+import tracemalloc
+import fnmatch
+import json
+import sys
+import os
+
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from libraries             import grid, utils
+from libraries.convex_hull import TernaryHull
+from libraries.stability   import StabilityHull, get_amounts
+from libraries.models      import SurrogateModel, initialize_model
+from libraries.vasp_io     import read_outcar_phonons, read_outcar_elapsed_time, read_oszicar_energies, \
+                                  read_doscar, get_band_gap
+
+
+"""
+python3 benchmarks/run_benchmarks.py [--quick] [--only pattern] [--output file.json] [--compare file.json]
+
+Measures the time, throughput (points/s or MB/s) and peak memory of the hot paths of the library, on synthetic inputs.
+With --compare, benchmarks slower or more memory-demanding than a previous --output beyond the tolerance are
+reported as regressions, and the exit code is 1.
+"""
+
+
+# Pure elements and phases of the Sb-Se-I ternary of convex-hull plot.ipynb (eV/atom)
+pure_elements = {
+    'Se': [0, 0],
+    'Sb': [1, 0],
+    'I':  [1 / 2, np.sqrt(3) / 2]
+}
+formation_energies = {
+    'Se':     0,
+    'Sb':     0,
+    'I':      0,
+    'SbSeI':  -0.32,
+    'Sb2Se3': -0.27,
+    'SbI3':   -0.21
+}
+
+# Reference energies (eV/fu) of the Bi_x Sb_{1-x} S_y Se_{1-y} I_z Br_{1-z} convex hull of solid-solutions.ipynb (PS)
+reference_energies = {
+    'Bi': -4.289179,
+    'Sb': -4.559573,
+    'S':  -4.383646,
+    'Se': -3.850400,
+    'I':  -1.730931,
+    'Br': -1.870427,
+    'Bi2S3':  -23.684051,
+    'Bi2Se3': -22.044146,
+    'Sb2S3':  -23.721411,
+    'Sb2Se3': -21.962036,
+    'BiI3':   -11.337934,
+    'BiBr3':  -12.765129,
+    'SbI3':   -11.155779,
+    'SbBr3':  -12.345123
+}
+
+
+def measure(function, n_items, unit, n_bytes=None, repeat=3):
+    """Measures the best time of several executions of a function, and its peak memory in a separate execution
+    (as tracing the allocations slows it down).
+
+    Args:
+        function (callable): Function without arguments.
+        n_items  (int):      Number of items (e.g. points) processed by each execution.
+        unit     (str):      Name of the items.
+        n_bytes  (int):      Number of bytes read by each execution (for the MB/s of parsers).
+        repeat   (int):      Number of timed executions.
+
+    Returns:
+        dict: Time (s), throughput (items/s), MB/s (if n_bytes is given) and peak memory (MB).
+    """
+
+    times = []
+    for _ in range(repeat):
+        start = perf_counter()
+        function()
+        times.append(perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best_time = min(times)
+    return {
+        'time':       best_time,
+        'throughput': n_items / best_time,
+        'unit':       unit,
+        'MB/s':       n_bytes / best_time / 1e6 if n_bytes is not None else None,
+        'peak_MB':    peak_memory / 1e6
+    }
+
+
+def benchmark_surfaces(precisions):
+    """Ternary convex-hull surfaces, from the scan of the triangles and from the indexed hull.
+
+    Args:
+        precisions (list): Steps of the grid of the plane (precision_search).
+
+    Yields:
+        tuple: Name of the benchmark and its measures.
+    """
+
+    names       = list(formation_energies)
+    _, amounts  = utils.get_composition_matrix(names, list(pure_elements))
+    positions   = np.array(list(pure_elements.values()), dtype=float)
+    coordinates = amounts @ positions / np.sum(amounts, axis=1)[:, np.newaxis]
+    energies    = np.array(list(formation_energies.values()), dtype=float)
+
+    hull = TernaryHull(pure_elements, names, formation_energies)
+    for precision in precisions:
+        xy_grid = grid.get_grid(2, precision, lower=-1, upper=1)
+
+        yield f'surface_triangles_{precision}', measure(lambda: utils.get_convex_hull_energies(xy_grid, coordinates,
+                                                                                                energies),
+                                                        len(xy_grid), 'points')
+        yield f'surface_hull_{precision}', measure(lambda: hull.get_energy(xy_grid), len(xy_grid), 'points')
+
+
+def benchmark_predictions(precision, n_samples=300):
+    """Predictions of fitted surrogate models over the three-dimensional composition grid, chunk by chunk.
+
+    Args:
+        precision (float): Step of the grid.
+        n_samples (int):   Number of synthetic training samples.
+
+    Yields:
+        tuple: Name of the benchmark and its measures.
+    """
+
+    rng = np.random.default_rng(0)
+    X = rng.random((n_samples, 3))
+    y = np.sin(3 * X[:, 0]) + X[:, 1] * X[:, 2] + 0.01 * rng.standard_normal(n_samples)
+
+    n_points = grid.count_grid_points(3, precision)
+    for model_type, name in [('Random Forest', 'RF'), ('Convolutional Neural Network', 'MLP')]:
+        surrogate = SurrogateModel(initialize_model(model_type, random_state=0)).fit(X, y)
+
+        def predict():
+            for chunk in grid.iterate_grid(3, precision):
+                surrogate.predict(chunk)
+
+        yield f'prediction_{name}_{precision}', measure(predict, n_points, 'points', repeat=1)
+
+
+def benchmark_stability(precision):
+    """Energies above the hull of the Bi/Sb-S/Se-I/Br solid solutions over the three-dimensional grid.
+
+    Args:
+        precision (float): Step of the grid.
+
+    Yields:
+        tuple: Name of the benchmark and its measures.
+    """
+
+    xyz_grid = grid.get_grid(3, precision)
+    hull     = StabilityHull(reference_energies)
+    amounts  = get_amounts(xyz_grid, elements=hull.elements)
+    energies = hull.get_hull_energies(amounts) * np.sum(amounts, axis=1) + 0.05
+
+    yield f'e_above_hull_{precision}', measure(lambda: hull.get_e_above_hull(amounts, energies),
+                                               len(xyz_grid), 'points')
+
+
+def _write_outcar(file_name, size_MB, n_modes=300):
+    """Writes a synthetic OUTCAR of a finite-differences calculation, with filler lines before the dynamical matrix.
+
+    Args:
+        file_name (str):   Path of the OUTCAR.
+        size_MB   (float): Approximate size of the filler (MB).
+        n_modes   (int):   Number of phonon modes.
+    """
+
+    filler = ' POSITION                                       TOTAL-FORCE (eV/Angst)\n' \
+             '      0.50000      0.00000      0.87500         0.012345     -0.023456      0.034567\n' * 50
+    with open(file_name, 'w') as outcar_file:
+        for _ in range(int(size_MB * 1e6 / len(filler))):
+            outcar_file.write(filler)
+
+        outcar_file.write(' Eigenvectors and eigenvalues of the dynamical matrix\n')
+        for mode in range(1, n_modes + 1):
+            kind = 'f/i=' if mode > n_modes - 3 else 'f  ='
+            outcar_file.write(f'{mode:4d} {kind}    3.456789 THz    21.719800 2PiTHz  115.305000 cm-1    '
+                              f'{14.2963 + mode:.6f} meV\n')
+            outcar_file.write('      0.000000  0.000000  0.000000     0.707107    0.000000    0.000000\n\n')
+        outcar_file.write('                         Elapsed time (sec):     1250.125\n')
+
+
+def _write_oszicar(file_name, n_steps):
+    """Writes a synthetic OSZICAR of a long relaxation.
+
+    Args:
+        file_name (str): Path of the OSZICAR.
+        n_steps   (int): Number of ionic steps.
+    """
+
+    with open(file_name, 'w') as oszicar_file:
+        for step in range(1, n_steps + 1):
+            oszicar_file.write('DAV:   1    -0.350000000000E+03   -0.35000E+03   -0.10000E+04  3600   0.100E+03\n' * 20)
+            oszicar_file.write(f'{step:4d} F= -.35010306E+03 E0= -.35009999E+03  d E =-.350103E+03  mag=     0.0000\n')
+
+
+def _write_doscar(file_name, NEDOS, n_atoms):
+    """Writes a synthetic spin-polarized DOSCAR with projected densities of states (s, p and d for each spin).
+
+    Args:
+        file_name (str): Path of the DOSCAR.
+        NEDOS     (int): Number of energies.
+        n_atoms   (int): Number of atoms.
+    """
+
+    energies = np.linspace(-10, 10, NEDOS)
+    dos      = np.where(np.abs(energies - 0.5) < 0.8, 0, 1.0)
+    block_header = f'     10.00000000    -10.00000000    {NEDOS}      0.10000000      1.00000000\n'
+
+    with open(file_name, 'w') as DOSCAR_file:
+        DOSCAR_file.write(f'  {n_atoms}  {n_atoms}   1   0\n')
+        DOSCAR_file.write('  0.1E+02  0.1E+02  0.1E+02  0.1E+02  0.5E-15\n  1.0E-04\n  CAR\n unknown system\n')
+        DOSCAR_file.write(block_header)
+        np.savetxt(DOSCAR_file, np.column_stack([energies, dos, dos, np.cumsum(dos), np.cumsum(dos)]), fmt='%12.4E')
+        for _ in range(n_atoms):
+            DOSCAR_file.write(block_header)
+            np.savetxt(DOSCAR_file, np.column_stack([energies] + [dos / 3] * 6), fmt='%12.4E')
+
+
+def benchmark_parsers(size_MB, NEDOS, n_atoms):
+    """Readers of the outputs of the calculations, on large synthetic files.
+
+    Args:
+        size_MB (float): Approximate size of the OUTCAR and OSZICAR files (MB).
+        NEDOS   (int):   Number of energies of the DOSCAR.
+        n_atoms (int):   Number of atoms of the DOSCAR.
+
+    Yields:
+        tuple: Name of the benchmark and its measures.
+    """
+
+    with tempfile.TemporaryDirectory() as folder:
+        outcar  = os.path.join(folder, 'OUTCAR')
+        oszicar = os.path.join(folder, 'OSZICAR')
+        doscar  = os.path.join(folder, 'DOSCAR')
+
+        _write_outcar(outcar, size_MB)
+        _write_oszicar(oszicar, int(size_MB * 1e6 / 1700))
+        _write_doscar(doscar, NEDOS, n_atoms)
+
+        for name, function, file_name in [
+            ('outcar_phonons',  lambda: read_outcar_phonons(outcar),      outcar),
+            ('outcar_time',     lambda: read_outcar_elapsed_time(outcar), outcar),
+            ('oszicar_energies', lambda: read_oszicar_energies(oszicar),  oszicar)
+        ]:
+            n_bytes = os.path.getsize(file_name)
+            yield name, measure(function, n_bytes, 'bytes', n_bytes=n_bytes)
+
+        def read_band_gap():
+            dos = read_doscar(doscar, projected=True)
+            get_band_gap(dos['energies'], dos['integrated_dos'], dos['fermi_energy'])
+
+        n_bytes = os.path.getsize(doscar)
+        yield 'doscar_band_gap', measure(read_band_gap, n_bytes, 'bytes', n_bytes=n_bytes)
+
+
+def run_benchmarks(quick=False, pattern='*'):
+    """Runs the benchmarks whose names match a pattern.
+
+    Args:
+        quick   (bool): Whether to use small inputs (for checking that the benchmarks work).
+        pattern (str):  Glob pattern of the names of the benchmarks.
+
+    Returns:
+        dict: Measures of each benchmark.
+    """
+
+    if quick:
+        benchmarks = [benchmark_surfaces([0.05, 0.02]), benchmark_predictions(0.1), benchmark_stability(0.05),
+                      benchmark_parsers(5, 2001, 4)]
+    else:
+        benchmarks = [benchmark_surfaces([0.02, 0.01, 0.005]), benchmark_predictions(0.02), benchmark_stability(0.01),
+                      benchmark_parsers(200, 20001, 64)]
+
+    results = {}
+    for benchmark in benchmarks:
+        for name, measures in benchmark:
+            if fnmatch.fnmatch(name, pattern):
+                results[name] = measures
+                print_measures(name, measures)
+    return results
+
+
+def print_measures(name, measures):
+    """Prints the measures of a benchmark in one line.
+
+    Args:
+        name     (str):  Name of the benchmark.
+        measures (dict): Measures of the benchmark (from measure).
+    """
+
+    if measures['MB/s'] is not None:
+        throughput = f'{measures["MB/s"]:12.1f} MB/s    '
+    else:
+        throughput = f'{measures["throughput"]:12.4g} {measures["unit"]}/s'
+    print(f'{name:32s} {measures["time"]:10.4f} s {throughput} {measures["peak_MB"]:10.1f} MB peak', flush=True)
+
+
+def find_regressions(results, baseline, tolerance):
+    """Compares the measures with those of a baseline.
+
+    Args:
+        results   (dict):  Measures of each benchmark.
+        baseline  (dict):  Previous measures of each benchmark.
+        tolerance (float): Relative loss of throughput or increase of peak memory that is accepted.
+
+    Returns:
+        list: Descriptions of the regressions.
+    """
+
+    regressions = []
+    for name, measures in results.items():
+        if name not in baseline:
+            continue
+
+        reference = baseline[name]
+        if measures['throughput'] < (1 - tolerance) * reference['throughput']:
+            regressions.append(f'{name}: throughput {measures["throughput"]:.4g} vs {reference["throughput"]:.4g} '
+                               f'{measures["unit"]}/s')
+        if measures['peak_MB'] > (1 + tolerance) * reference['peak_MB'] + 1:  # Small peaks fluctuate
+            regressions.append(f'{name}: peak memory {measures["peak_MB"]:.1f} vs {reference["peak_MB"]:.1f} MB')
+    return regressions
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks of the hot paths of the library.')
+    parser.add_argument('--quick',     action='store_true', help='use small inputs')
+    parser.add_argument('--only',      default='*',         help='glob pattern of the benchmarks to run')
+    parser.add_argument('--output',    default=None,        help='JSON file where the measures are written')
+    parser.add_argument('--compare',   default=None,        help='JSON file with the measures of a baseline')
+    parser.add_argument('--tolerance', default=0.25,        type=float,
+                        help='relative loss of throughput or increase of memory accepted (default 0.25)')
+    args = parser.parse_args()
+
+    results = run_benchmarks(quick=args.quick, pattern=args.only)
+
+    if args.output is not None:
+        with open(args.output, 'w') as output_file:
+            json.dump(results, output_file, indent=1)
+
+    if args.compare is not None:
+        with open(args.compare, 'r') as baseline_file:
+            regressions = find_regressions(results, json.load(baseline_file), args.tolerance)
+
+        for regression in regressions:
+            print(f'### Regression in {regression}')
+        sys.exit(int(len(regressions) > 0))
@@ -0,0 +1,147 @@
+import numpy as np
+
+from scipy.spatial   import cKDTree
+from scipy.special   import ndtr
+from libraries.grid  import get_boundaries
+from libraries.utils import geometric_tolerance
+
+
+def predict_distributions(surrogate, chunks):
+    """Predicts the mean and spread of a target over a stream of chunks of compositions.
+
+    Args:
+        surrogate (SurrogateModel): Fitted model with an ensemble estimator (Random Forest or Bootstrap Ensemble).
+        chunks    (iterable):       Chunks of compositions, e.g. from grid.iterate_grid.
+
+    Yields:
+        tuple: Compositions of the chunk, mean and standard deviation of the predictions.
+    """
+
+    for chunk in chunks:
+        mean, std = surrogate.predict_distribution(chunk)
+        yield chunk, mean, std
+
+
+def expected_improvement(mean, std, best, maximize=True, xi=0):
+    """Expected improvement over the best value found so far, for normally distributed predictions.
+
+    Args:
+        mean     (ndarray): Mean of the predictions.
+        std      (ndarray): Standard deviation of the predictions.
+        best     (float):   Best value of the target found so far.
+        maximize (bool):    Whether the target is maximized (e.g. absorption) or minimized (e.g. energy).
+        xi       (float):   Minimum improvement, favouring exploration.
+
+    Returns:
+        ndarray: Expected improvement of each composition.
+    """
+
+    improvement = (mean - best - xi) if maximize else (best - mean - xi)
+    std = np.maximum(std, geometric_tolerance)  # Certain predictions only improve by their mean
+
+    z = improvement / std
+    return improvement * ndtr(z) + std * np.exp(-0.5 * z**2) / np.sqrt(2 * np.pi)
+
+
+def boundary_uncertainty(mean, std, limits=None, thresholds=(), beta=1.96):
+    """Straddle score of the compositions, which is positive when a boundary of the property (limits or thresholds)
+    lies within beta standard deviations of the prediction, i.e. when its classification is uncertain.
+
+    Args:
+        mean       (ndarray):  Mean of the predictions.
+        std        (ndarray):  Standard deviation of the predictions.
+        limits     (Limits):   Limits of the property.
+        thresholds (iterable): Additional thresholds of the property.
+        beta       (float):    Width of the confidence interval, in standard deviations.
+
+    Returns:
+        ndarray: Score of each composition (the largest the most uncertain).
+    """
+
+    boundaries = get_boundaries(limits, thresholds)
+    if not len(boundaries):
+        raise ValueError('At least one limit or threshold is needed.')
+
+    distances = np.min(np.abs(np.subtract.outer(mean, boundaries)), axis=-1)
+    return beta * std - distances
+
+
+def exclude_tried(compositions, tried, tolerance=1e-6):
+    """Determines which compositions have not been tried yet (e.g. already computed with DFT).
+
+    Args:
+        compositions (ndarray):    Candidate compositions, of shape (n_points, n_dimensions).
+        tried        (array-like): Compositions already tried, of shape (n_tried, n_dimensions), or their cKDTree
+                                   (built once when many chunks are checked).
+        tolerance    (float):      Distance below which two compositions are the same.
+
+    Returns:
+        ndarray: Boolean mask of the untried compositions.
+    """
+
+    if not isinstance(tried, cKDTree):
+        if (tried is None) or (not len(tried)):
+            return np.ones(len(compositions), dtype=bool)
+        tried = cKDTree(np.asarray(tried, dtype=float))
+
+    distances, _ = tried.query(compositions, distance_upper_bound=tolerance)
+    return np.isinf(distances)
+
+
+def select_compositions(surrogate, chunks, n_select, acquisition='boundary', limits=None, thresholds=(), best=None,
+                        maximize=True, tried=None, beta=1.96, xi=0, tolerance=1e-6):
+    """Ranks the untried compositions of a stream of chunks by an acquisition function, keeping the best n_select
+    (the whole grid is never held in memory).
+
+    Args:
+        surrogate   (SurrogateModel): Fitted model with an ensemble estimator (Random Forest or Bootstrap Ensemble).
+        chunks      (iterable):       Chunks of compositions, e.g. from grid.iterate_grid.
+        n_select    (int):            Number of compositions to be selected.
+        acquisition (str):            'boundary' (uncertainty near the limits) or 'ei' (expected improvement).
+        limits      (Limits):         Limits of the property (for 'boundary').
+        thresholds  (iterable):       Additional thresholds of the property (for 'boundary').
+        best        (float):          Best value found so far (for 'ei').
+        maximize    (bool):           Whether the target is maximized (for 'ei').
+        tried       (array-like):     Compositions already tried, which are not selected.
+        beta        (float):          Width of the confidence interval, in standard deviations (for 'boundary').
+        xi          (float):          Minimum improvement (for 'ei').
+        tolerance   (float):          Distance below which two compositions are the same.
+
+    Returns:
+        dict: Selected compositions, their scores, means and standard deviations, from the best one.
+    """
+
+    if acquisition == 'boundary':
+        def score_function(mean, std):
+            return boundary_uncertainty(mean, std, limits=limits, thresholds=thresholds, beta=beta)
+    elif acquisition == 'ei':
+        if best is None:
+            raise ValueError('The best value found so far is needed for the expected improvement.')
+
+        def score_function(mean, std):
+            return expected_improvement(mean, std, best, maximize=maximize, xi=xi)
+    else:
+        raise ValueError(f'Acquisition function not defined: {acquisition}.')
+
+    if (tried is not None) and len(tried):
+        tried = cKDTree(np.asarray(tried, dtype=float))  # Built once for every chunk
+
+    selection = None
+    for chunk, mean, std in predict_distributions(surrogate, chunks):
+        untried = exclude_tried(chunk, tried, tolerance=tolerance)
+        candidates = (chunk[untried], score_function(mean, std)[untried], mean[untried], std[untried])
+
+        # Merging with the previous selection and keeping the best n_select
+
+        if selection is not None:
+            candidates = [np.concatenate([previous, new]) for previous, new in zip(selection, candidates)]
+        if len(candidates[1]) > n_select:
+            best_indexes = np.argpartition(-candidates[1], n_select - 1)[:n_select]
+            candidates = [array[best_indexes] for array in candidates]
+        selection = candidates
+
+    if selection is None:
+        selection = (np.empty((0, 0)), np.empty(0), np.empty(0), np.empty(0))
+
+    order = np.argsort(-selection[1], kind='stable')
+    return {name: array[order] for name, array in zip(('compositions', 'score', 'mean', 'std'), selection)}
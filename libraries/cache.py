@@ -0,0 +1,190 @@
+import numpy as np
+import hashlib
+import os
+
+
+def _update_hash(hasher, item):
+    """Feeds an object into a hash, recursively and independently of the order of dictionaries.
+
+    Args:
+        hasher (hashlib object): Hash being computed.
+        item   (object):         Object to be hashed.
+    """
+
+    if isinstance(item, dict):
+        hasher.update(b'dict')
+        for key in sorted(item, key=str):
+            _update_hash(hasher, key)
+            _update_hash(hasher, item[key])
+    elif isinstance(item, (list, tuple)):
+        hasher.update(type(item).__name__.encode())
+        for element in item:
+            _update_hash(hasher, element)
+    elif isinstance(item, np.ndarray):
+        item = np.ascontiguousarray(item)
+        hasher.update(f'ndarray {item.dtype} {item.shape}'.encode())
+        hasher.update(item.tobytes() if item.dtype != object else repr(item.tolist()).encode())
+    elif hasattr(item, 'to_numpy') and hasattr(item, 'index'):  # pandas DataFrame or Series
+        hasher.update(type(item).__name__.encode())
+        _update_hash(hasher, list(item.index))
+        _update_hash(hasher, list(getattr(item, 'columns', [])))
+        _update_hash(hasher, item.to_numpy())
+    elif hasattr(item, 'get_params'):  # sklearn estimator: its class and hyperparameters
+        hasher.update(type(item).__name__.encode())
+        _update_hash(hasher, item.get_params(deep=False))
+    else:
+        hasher.update(f'{type(item).__name__} {item!r}'.encode())
+    hasher.update(b';')
+
+
+def get_fingerprint(*items):
+    """Computes a content hash of the given objects (arrays, DataFrames, estimators, dictionaries...).
+
+    Args:
+        *items (object): Objects to be hashed.
+
+    Returns:
+        str: Hexadecimal SHA-256 digest.
+    """
+
+    hasher = hashlib.sha256()
+    _update_hash(hasher, list(items))
+    return hasher.hexdigest()
+
+
+class ResultCache:
+    """Content-addressed cache of arrays on disk. Each entry is a .npz file named after the hash of
+    the inputs that produced it, so entries computed from different inputs are never reused.
+    The least recently used entries are removed when the cache exceeds its maximum size.
+    """
+
+    def __init__(self, directory, max_size=None):
+        """Initializes the cache in a directory, which is created if needed.
+
+        Args:
+            directory (str): Folder containing the entries.
+            max_size  (int): Maximum size (in bytes) of all the entries (unlimited if None).
+        """
+
+        self.directory = directory
+        self.max_size  = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, **inputs):
+        """Computes the key of an entry from the inputs that determine it.
+
+        Args:
+            **inputs (object): Inputs of the computation (e.g. reference energies, grid, model, flag).
+
+        Returns:
+            str: Key of the entry.
+        """
+
+        return get_fingerprint(inputs)
+
+    def _get_path(self, key):
+        """Path of the file of an entry.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            str: Path of the entry.
+        """
+
+        return os.path.join(self.directory, f'{key}.npz')
+
+    def load(self, key):
+        """Loads an entry, marking it as recently used.
+
+        Args:
+            key (str): Key of the entry.
+
+        Returns:
+            dict: Arrays of the entry, or None if it is not cached.
+        """
+
+        entry_path = self._get_path(key)
+        try:
+            with np.load(entry_path) as data:
+                arrays = {name: data[name] for name in data.files}
+        except (FileNotFoundError, OSError, ValueError):
+            return None
+
+        os.utime(entry_path)
+        return arrays
+
+    def save(self, key, **arrays):
+        """Saves the arrays of an entry and evicts old entries if needed.
+
+        Args:
+            key      (str):     Key of the entry.
+            **arrays (ndarray): Arrays to be stored.
+        """
+
+        entry_path = self._get_path(key)
+        temp_path  = f'{entry_path}.{os.getpid()}.tmp'
+
+        # Writing to a temporary file first, so interrupted writes never leave corrupt entries
+
+        with open(temp_path, 'wb') as temp_file:
+            np.savez(temp_file, **arrays)
+        os.replace(temp_path, entry_path)
+
+        self.evict(keep=key)
+
+    def get_or_compute(self, function, inputs, *args, **kwargs):
+        """Loads the entry of some inputs, or computes it and stores it if it is not cached.
+
+        Args:
+            function (callable): Function returning a dictionary of arrays.
+            inputs   (dict):     Inputs determining the result, used for the key.
+            *args    (object):   Positional arguments of the function.
+            **kwargs (object):   Keyword arguments of the function.
+
+        Returns:
+            dict: Arrays of the entry.
+        """
+
+        key    = self.get_key(**inputs)
+        arrays = self.load(key)
+        if arrays is None:
+            arrays = function(*args, **kwargs)
+            self.save(key, **arrays)
+        return arrays
+
+    def invalidate(self, key):
+        """Removes an entry, if it exists.
+
+        Args:
+            key (str): Key of the entry.
+        """
+
+        try:
+            os.remove(self._get_path(key))
+        except FileNotFoundError:
+            pass
+
+    def evict(self, keep=None):
+        """Removes the least recently used entries until the cache fits in its maximum size.
+
+        Args:
+            keep (str): Key of an entry that must not be removed.
+        """
+
+        if self.max_size is None:
+            return
+
+        entries = []
+        for file_name in os.listdir(self.directory):
+            if file_name.endswith('.npz'):
+                stat = os.stat(os.path.join(self.directory, file_name))
+                entries.append((stat.st_mtime, stat.st_size, file_name[:-4]))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if key != keep:
+                self.invalidate(key)
+                total_size -= size
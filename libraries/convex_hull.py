@@ -0,0 +1,149 @@
+import numpy          as np
+import pandas         as pd
+import matplotlib.tri as mtri
+
+from scipy.spatial   import ConvexHull, Delaunay, QhullError
+from libraries.utils import get_composition_matrix, geometric_tolerance
+
+
+def load_formation_energies(file_name, flag):
+    """Loads the total energies of a functional from a table of phases (e.g. chemical_potentials.txt, with columns
+    element, nfu and total_energy_{flag}) and computes the formation energy (eV/atom) of every phase at once,
+    referred to the elemental phases of the same table.
+
+    Args:
+        file_name (str): Path of the whitespace-separated table.
+        flag      (str): Functional and correction of the energies (e.g. 'PS_D3').
+
+    Returns:
+        DataFrame: Number of formula units, total energy, energy (eV/fu) and formation energy (eV/atom) of each phase,
+            indexed by formula.
+    """
+
+    total_energy_flag = f'total_energy_{flag}'
+
+    energies = pd.read_csv(file_name, sep=r'\s+', usecols=['element', 'nfu', total_energy_flag],
+                           dtype={'element': str, 'nfu': float, total_energy_flag: float})
+    energies = energies.dropna(subset=['element']).set_index('element', drop=True)
+
+    # Getting energy by formula unit
+
+    energies['energy'] = energies[total_energy_flag] / energies['nfu']
+
+    # Subtracting the elemental references of every phase at once
+
+    elements, amounts = get_composition_matrix(energies.index)
+    missing = [element for element in elements if element not in energies.index]
+    if len(missing):
+        raise ValueError(f'No reference energy for {missing} in {file_name}.')
+
+    references = energies.loc[elements, 'energy'].to_numpy()
+    energies['formation_energy'] = (energies['energy'].to_numpy() - amounts @ references) / np.sum(amounts, axis=1)
+    return energies
+
+
+class TernaryHull:
+    """Lower convex hull of the formation energies of a ternary system, projected on the plane of the pure elements.
+    The hull is built once, and its facets are indexed for fast point location.
+    """
+
+    def __init__(self, pure_elements, phases, formation_energies):
+        """Places every phase in the plane and builds the lower hull of the (a, b, formation_energy) points.
+
+        Args:
+            pure_elements      (dict):            Positions [a, b] of the pure elements in the plane.
+            phases             (list):            Names of the pure and secondary phases.
+            formation_energies (dict or Series):  Formation energies (eV/atom) of the elements and phases.
+        """
+
+        self.names = list(pure_elements) + [phase for phase in phases if phase not in pure_elements]
+
+        _, amounts = get_composition_matrix(self.names, list(pure_elements))
+        positions  = np.array(list(pure_elements.values()), dtype=float)
+        self.coordinates = amounts @ positions / np.sum(amounts, axis=1)[:, np.newaxis]
+        self.energies    = np.array([formation_energies[name] for name in self.names], dtype=float)
+
+        # Facets of the hull facing downwards (vertical ones are discarded)
+
+        try:
+            hull = ConvexHull(np.column_stack([self.coordinates, self.energies]))
+            facets = hull.simplices[hull.equations[:, 2] < -geometric_tolerance]
+        except QhullError:  # All the points are coplanar
+            facets = Delaunay(self.coordinates).simplices
+
+        edges_1 = self.coordinates[facets[:, 1]] - self.coordinates[facets[:, 0]]
+        edges_2 = self.coordinates[facets[:, 2]] - self.coordinates[facets[:, 0]]
+        areas   = edges_1[:, 0] * edges_2[:, 1] - edges_1[:, 1] * edges_2[:, 0]
+        self.facets = facets[np.abs(areas) > geometric_tolerance]
+
+        # Planes E = c_0 a + c_1 b + c_2 of each facet
+
+        matrices    = np.concatenate([self.coordinates[self.facets], np.ones((len(self.facets), 3, 1))], axis=2)
+        self.planes = np.linalg.solve(matrices, self.energies[self.facets][:, :, np.newaxis])[:, :, 0]
+
+        # Point-location index over the projected facets
+
+        triangulation = mtri.Triangulation(self.coordinates[:, 0], self.coordinates[:, 1], self.facets)
+        self._trifinder = triangulation.get_trifinder()
+        self._domain    = Delaunay(self.coordinates)
+
+    @property
+    def stable_phases(self):
+        """Names of the phases lying on the lower hull.
+        """
+
+        return [self.names[index] for index in np.unique(self.facets)]
+
+    def find_facet(self, points):
+        """Locates the facet of the hull containing each point.
+
+        Args:
+            points (array-like): Points in the plane, of shape (n_points, 2).
+
+        Returns:
+            ndarray: Index of the facet for each point (-1 for those outside the hull).
+        """
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        facets = np.asarray(self._trifinder(points[:, 0], points[:, 1]), dtype=int)
+
+        # Points at the border within tolerance: the hull is the maximum of the planes of its facets
+
+        outside = np.where(facets < 0)[0]
+        border  = outside[self._domain.find_simplex(points[outside], tol=geometric_tolerance) >= 0]
+        if len(border):
+            planes = points[border, 0, np.newaxis] * self.planes[:, 0] + points[border, 1, np.newaxis] * self.planes[:, 1] + self.planes[:, 2]
+            facets[border] = np.argmax(planes, axis=1)
+        return facets
+
+    def get_facet_phases(self, points):
+        """Gives the phases at the vertices of the facet containing each point.
+
+        Args:
+            points (array-like): Points in the plane, of shape (n_points, 2).
+
+        Returns:
+            list: Tuple with the names of the three phases for each point (None for those outside the hull).
+        """
+
+        return [tuple(self.names[index] for index in self.facets[facet]) if facet >= 0 else None
+                for facet in self.find_facet(points)]
+
+    def get_energy(self, points):
+        """Computes the hull formation energy at each point.
+
+        Args:
+            points (array-like): Points in the plane, of shape (n_points, 2).
+
+        Returns:
+            ndarray: Formation energy of the hull at each point (NaN for those outside the hull).
+        """
+
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        facets = self.find_facet(points)
+        inside = facets >= 0
+
+        energies = np.full(len(points), np.nan)
+        planes   = self.planes[facets[inside]]
+        energies[inside] = points[inside, 0] * planes[:, 0] + points[inside, 1] * planes[:, 1] + planes[:, 2]
+        return energies
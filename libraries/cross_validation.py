@@ -0,0 +1,127 @@
+import numpy           as np
+import multiprocessing as mp
+
+from threadpoolctl      import threadpool_limits
+from libraries.utils    import xy_scaler, y_descaler
+from libraries.models   import initialize_model
+from libraries.parallel import parallel_map
+
+
+def run_fold(split, X, y, model_type, parameters, n_threads):
+    """Fits and evaluates one fold, using at most n_threads threads.
+
+    Args:
+        split      (tuple):   Indexes of the train and test sets.
+        X          (ndarray): Input samples.
+        y          (ndarray): Target values.
+        model_type (str):     Type of model (see models.initialize_model).
+        parameters (dict):    Hyperparameters overriding the defaults.
+        n_threads  (int):     Number of threads of the fold (BLAS and Random Forest jobs).
+
+    Returns:
+        tuple: De-scaled train predictions, train targets and test predictions.
+    """
+
+    train_index, test_index = split
+
+    if model_type == 'Random Forest':
+        parameters = {**parameters, 'n_jobs': n_threads}
+
+    with threadpool_limits(limits=n_threads):
+        # Scaling
+
+        X_train, X_test, y_train, y_scaler = xy_scaler(X[train_index], X[test_index], y[train_index])
+
+        # Fitting the model
+
+        model = initialize_model(model_type, **parameters)
+        model.fit(X_train, y_train)
+
+        # Making predictions
+
+        y_temp = model.predict(X_train)
+        y_pred = model.predict(X_test)
+
+    # De-scaling
+
+    return tuple(y_descaler([y_temp, y_train, y_pred], y_scaler))
+
+
+def cross_validate(model_type, X, y, cv, n_jobs=None, threads_per_fold=None, **parameters):
+    """Fits and evaluates the folds of a cross-validation splitter in parallel, one process per fold.
+    The cores are shared among folds, so that folds do not spawn more threads than available cores.
+
+    The errors are computed as in the notebooks: the norm of the residuals of each fold divided
+    by its number of test samples, averaged over the folds.
+
+    Args:
+        model_type       (str):        Type of model (see models.initialize_model).
+        X                (array-like): Input samples.
+        y                (array-like): Target values.
+        cv               (object):     Cross-validation splitter (e.g. ShuffleSplit).
+        n_jobs           (int):        Number of folds run at once (all the cores if None).
+        threads_per_fold (int):        Threads of each fold (the remaining cores are shared if None).
+        **parameters     (object):     Hyperparameters overriding the defaults.
+
+    Returns:
+        dict: train_MAE and test_MAE, and the concatenated train predictions (y_temp), train targets (y_train),
+            test predictions (y_pred) and test targets (y_test) of all the folds.
+    """
+
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    splits   = list(cv.split(X))
+    n_splits = len(splits)
+    n_cores  = mp.cpu_count()
+
+    n_jobs = min(n_cores if n_jobs is None else n_jobs, n_splits)
+    if threads_per_fold is None:
+        threads_per_fold = max(1, n_cores // n_jobs)
+
+    shared_data = {
+        'X':          X,
+        'y':          y,
+        'model_type': model_type,
+        'parameters': parameters,
+        'n_threads':  threads_per_fold
+    }
+    folds = parallel_map(run_fold, splits, shared=shared_data, n_jobs=n_jobs, chunksize=1)
+
+    # Filling preallocated arrays, fold after fold
+
+    n_train = sum(len(train_index) for train_index, _ in splits)
+    n_test  = sum(len(test_index)  for _, test_index  in splits)
+
+    y_temp_cv  = np.empty(n_train)
+    y_train_cv = np.empty(n_train)
+    y_pred_cv  = np.empty(n_test)
+    y_test_cv  = np.empty(n_test)
+
+    train_MAE   = 0
+    test_MAE    = 0
+    train_start = 0
+    test_start  = 0
+    for (train_index, test_index), (y_temp, y_train, y_pred) in zip(splits, folds):
+        train_stop = train_start + len(train_index)
+        test_stop  = test_start  + len(test_index)
+
+        y_temp_cv[train_start:train_stop]  = y_temp
+        y_train_cv[train_start:train_stop] = y_train
+        y_pred_cv[test_start:test_stop]    = y_pred
+        y_test_cv[test_start:test_stop]    = y[test_index]
+
+        train_MAE += np.linalg.norm(y_train - y_temp) / len(test_index)
+        test_MAE  += np.linalg.norm(y_pred - y[test_index]) / len(test_index)
+
+        train_start = train_stop
+        test_start  = test_stop
+
+    return {
+        'train_MAE': train_MAE / n_splits,
+        'test_MAE':  test_MAE  / n_splits,
+        'y_temp':    y_temp_cv,
+        'y_train':   y_train_cv,
+        'y_pred':    y_pred_cv,
+        'y_test':    y_test_cv
+    }
@@ -0,0 +1,234 @@
+import numpy as np
+
+from itertools       import product
+
+from libraries.utils import within_limits, geometric_tolerance
+
+
+def get_axis(precision, lower=0, upper=1):
+    """Values of one mixing fraction, as np.arange(lower, upper+precision, precision).
+
+    Args:
+        precision (float): Step between consecutive values.
+        lower     (float): First value.
+        upper     (float): Last value.
+
+    Returns:
+        ndarray: Values of the axis.
+    """
+
+    return np.arange(lower, upper+precision, precision)
+
+
+def count_grid_points(n_dimensions, precision, lower=0, upper=1):
+    """Number of points of the full grid (without the simplex restriction).
+
+    Args:
+        n_dimensions (int):   Number of mixing sublattices.
+        precision    (float): Step between consecutive values.
+        lower        (float): First value of each axis.
+        upper        (float): Last value of each axis.
+
+    Returns:
+        int: Number of points.
+    """
+
+    return len(get_axis(precision, lower, upper)) ** n_dimensions
+
+
+def iterate_grid(n_dimensions, precision, lower=0, upper=1, chunk_size=2**16, simplex=False):
+    """Generates the grid of compositions by chunks, in the same order as nested loops over the axes
+    (the last fraction varying fastest), so that only one chunk is in memory at a time.
+
+    Args:
+        n_dimensions (int):   Number of mixing sublattices.
+        precision    (float): Step between consecutive values.
+        lower        (float): First value of each axis.
+        upper        (float): Last value of each axis.
+        chunk_size   (int):   Number of grid points generated at once (before the simplex restriction).
+        simplex      (bool):  Whether to keep only the points whose fractions add up to, at most, upper.
+
+    Yields:
+        ndarray: Contiguous chunk of compositions, of shape (n_points, n_dimensions).
+    """
+
+    axis    = get_axis(precision, lower, upper)
+    shape   = (len(axis),) * n_dimensions
+    n_total = len(axis) ** n_dimensions
+
+    for start in range(0, n_total, chunk_size):
+        indexes = np.unravel_index(np.arange(start, min(start+chunk_size, n_total)), shape)
+        chunk   = np.column_stack([axis[index] for index in indexes])
+
+        if simplex:
+            chunk = chunk[np.sum(chunk, axis=1) <= upper + geometric_tolerance]
+        if len(chunk):
+            yield chunk
+
+
+def get_grid(n_dimensions, precision, lower=0, upper=1, simplex=False):
+    """Generates the whole grid of compositions at once.
+
+    Args:
+        n_dimensions (int):   Number of mixing sublattices.
+        precision    (float): Step between consecutive values.
+        lower        (float): First value of each axis.
+        upper        (float): Last value of each axis.
+        simplex      (bool):  Whether to keep only the points whose fractions add up to, at most, upper.
+
+    Returns:
+        ndarray: Compositions of shape (n_points, n_dimensions).
+    """
+
+    chunks = list(iterate_grid(n_dimensions, precision, lower, upper, simplex=simplex))
+    if not len(chunks):
+        return np.empty((0, n_dimensions))
+    return np.concatenate(chunks)
+
+
+def evaluate_chunks(chunks, function, limits=None):
+    """Evaluates a property over a stream of chunks, keeping only the points within the limits.
+
+    Args:
+        chunks   (iterable): Chunks of compositions, e.g. from iterate_grid.
+        function (callable): Function returning the property for a chunk of compositions (e.g. a model prediction).
+        limits   (Limits):   Limits of the property (all points are kept if None).
+
+    Yields:
+        tuple: Valid compositions and their values, for each chunk.
+    """
+
+    for chunk in chunks:
+        values = np.ravel(function(chunk))
+        if limits is not None:
+            mask   = within_limits(values, limits)
+            chunk  = chunk[mask]
+            values = values[mask]
+        yield chunk, values
+
+
+def save_chunks(evaluated_chunks, file_name):
+    """Writes a stream of evaluated chunks into a text file, with the format of np.savetxt
+    (one row per composition and its value), without keeping them in memory.
+
+    Args:
+        evaluated_chunks (iterable): Pairs of compositions and values, e.g. from evaluate_chunks.
+        file_name        (str):      Path of the output file.
+
+    Returns:
+        int: Number of rows written.
+    """
+
+    n_rows = 0
+    with open(file_name, 'w') as output_file:
+        for chunk, values in evaluated_chunks:
+            np.savetxt(output_file, np.column_stack([chunk, values]))
+            n_rows += len(chunk)
+    return n_rows
+
+
+def get_boundaries(limits=None, thresholds=()):
+    """Values of a property where the classification of the compositions changes.
+
+    Args:
+        limits     (Limits):   Limits of the property.
+        thresholds (iterable): Additional thresholds of the property.
+
+    Returns:
+        ndarray: Values of the boundaries.
+    """
+
+    boundaries = list(thresholds)
+    if limits is not None:
+        boundaries += [bound for bound in (limits.lower, limits.upper) if bound is not None]
+    return np.array(boundaries, dtype=float)
+
+
+def _straddle_boundaries(corner_values, boundaries):
+    """Determines which cells are crossed by a boundary, i.e. their corners have values at both sides of it
+    (or on it), or only some of their corners are defined (e.g. outside of a convex hull).
+
+    Args:
+        corner_values (ndarray): Values at the corners of each cell, of shape (n_cells, n_corners).
+        boundaries    (ndarray): Values of the boundaries.
+
+    Returns:
+        ndarray: Boolean mask of the cells to be refined.
+    """
+
+    undefined = np.isnan(corner_values)
+    minimum   = np.min(np.where(undefined, np.inf,  corner_values), axis=1)
+    maximum   = np.max(np.where(undefined, -np.inf, corner_values), axis=1)
+
+    straddle = np.any(undefined, axis=1) & ~np.all(undefined, axis=1)
+    for boundary in boundaries:
+        straddle |= (minimum <= boundary) & (maximum >= boundary) & (minimum < maximum)
+    return straddle
+
+
+def refine_grid(function, n_dimensions, precision, n_levels, limits=None, thresholds=(), lower=0, upper=1,
+                chunk_size=2**16):
+    """Evaluates a property on a grid that starts with a step of precision * 2**n_levels and is recursively halved
+    only in the cells crossed by the limits or thresholds of the property, down to the given precision.
+    The boundaries are resolved as with a uniform grid of that precision, with a fraction of the evaluations,
+    as long as the accepted regions are not smaller than the coarse cells.
+
+    Args:
+        function     (callable): Function returning the property for a chunk of compositions (e.g. a model prediction).
+        n_dimensions (int):      Number of mixing sublattices.
+        precision    (float):    Step of the finest grid.
+        n_levels     (int):      Number of halvings of the coarse grid.
+        limits       (Limits):   Limits of the property.
+        thresholds   (iterable): Additional thresholds of the property (e.g. redox potentials).
+        lower        (float):    First value of each axis.
+        upper        (float):    Last value of each axis.
+        chunk_size   (int):      Number of compositions evaluated at once.
+
+    Returns:
+        tuple: Evaluated compositions, of shape (n_points, n_dimensions), and their values.
+    """
+
+    boundaries = get_boundaries(limits, thresholds)
+
+    # Points are indexed on the integer lattice of the finest grid
+    n_steps   = int(round((upper - lower) / precision))
+    shape     = (n_steps + 1,) * n_dimensions
+    cell_size = 2 ** n_levels
+    vertices  = np.array(list(product([0, 1], repeat=n_dimensions)))
+
+    axis_origins = np.arange(0, n_steps, cell_size)
+    origins = np.stack(np.meshgrid(*[axis_origins] * n_dimensions, indexing='ij'), axis=-1).reshape(-1, n_dimensions)
+
+    evaluated_indexes = np.empty(0, dtype=np.int64)
+    evaluated_values  = np.empty(0)
+    while len(origins):
+        # Evaluating the corners not evaluated in previous levels (cells at the upper end are truncated)
+
+        corners = np.minimum(origins[:, np.newaxis] + cell_size * vertices, n_steps)
+        corner_indexes = np.ravel_multi_index(corners.reshape(-1, n_dimensions).T, shape).reshape(len(origins), -1)
+
+        new_indexes = np.setdiff1d(corner_indexes, evaluated_indexes)
+        new_points  = lower + np.column_stack(np.unravel_index(new_indexes, shape)) * precision
+        new_values  = [np.ravel(function(new_points[start:start+chunk_size]))
+                       for start in range(0, len(new_points), chunk_size)]
+
+        evaluated_indexes = np.concatenate([evaluated_indexes, new_indexes])
+        evaluated_values  = np.concatenate([evaluated_values] + new_values)
+        order = np.argsort(evaluated_indexes, kind='stable')
+        evaluated_indexes = evaluated_indexes[order]
+        evaluated_values  = evaluated_values[order]
+
+        if cell_size == 1:
+            break
+
+        # Halving the cells crossed by any boundary
+
+        corner_values = evaluated_values[np.searchsorted(evaluated_indexes, corner_indexes)]
+        origins = origins[_straddle_boundaries(corner_values, boundaries)]
+
+        cell_size //= 2
+        origins = (origins[:, np.newaxis] + cell_size * vertices).reshape(-1, n_dimensions)
+        origins = origins[np.all(origins < n_steps, axis=1)]
+
+    points = lower + np.column_stack(np.unravel_index(evaluated_indexes, shape)) * precision
+    return points, evaluated_values
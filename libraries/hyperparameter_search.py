@@ -0,0 +1,321 @@
+import numpy           as np
+import multiprocessing as mp
+import sklearn
+
+from sklearn.model_selection    import KFold
+from threadpoolctl              import threadpool_limits
+from libraries.cache            import ResultCache, get_fingerprint
+from libraries.cross_validation import run_fold
+from libraries.models           import get_model_parameters, initialize_model, load_target
+from libraries.parallel         import parallel_map
+from libraries.utils            import xy_scaler, y_descaler
+
+# Candidate values of the hyperparameters explored for each type of model
+search_spaces = {
+    'Random Forest': {
+        'max_depth':         [None, 8, 16, 32],
+        'min_samples_leaf':  [1, 2, 4],
+        'min_samples_split': [2, 4, 8],
+        'max_features':      [1.0, 0.5],
+        'bootstrap':         [True, False]
+    },
+    'Convolutional Neural Network': {
+        'hidden_layer_sizes': [(16,), (32,), (16, 16), (32, 32), (64, 64), (32, 32, 32)],
+        'activation':         ['relu', 'tanh'],
+        'alpha':              [1e-4, 1e-3, 1e-2, 0.05, 0.1],
+        'learning_rate_init': [1e-3, 3e-3, 1e-2]
+    }
+}
+
+# Hyperparameter used as budget of the trials, with its minimum and maximum values
+search_budgets = {
+    'Random Forest':                ('n_estimators', 30,  300),
+    'Convolutional Neural Network': ('max_iter',     100, 2700)
+}
+
+
+def sample_configurations(model_type, n_configurations, random_state=None):
+    """Draws different configurations of hyperparameters at random from the search space of a model.
+
+    Args:
+        model_type       (str): 'Random Forest' or 'Convolutional Neural Network'.
+        n_configurations (int): Number of configurations (limited to the size of the search space).
+        random_state     (int): Seed of the sampling.
+
+    Returns:
+        list: Configurations, as dictionaries of hyperparameters.
+    """
+
+    if model_type not in search_spaces:
+        raise ValueError(f'Search space not defined for model: {model_type}.')
+
+    space   = search_spaces[model_type]
+    n_total = int(np.prod([len(values) for values in space.values()]))
+
+    rng = np.random.default_rng(random_state)
+    configurations = {}
+    while len(configurations) < min(n_configurations, n_total):
+        configuration = {name: values[rng.integers(len(values))] for name, values in space.items()}
+        configurations.setdefault(get_fingerprint(configuration), configuration)
+    return list(configurations.values())
+
+
+def _get_default_parameters(model_type):
+    """Default hyperparameters of a model that are not explored, without the execution ones.
+
+    Args:
+        model_type (str): Type of model.
+
+    Returns:
+        dict: Hyperparameters.
+    """
+
+    parameters = get_model_parameters(model_type)
+    parameters.pop('n_jobs', None)
+    return parameters
+
+
+def _run_network_fold(split, X, y, parameters, budget, check_every, patience, validation_fraction=0.2,
+                      random_state=None):
+    """Fits a neural network one epoch at a time on one fold. A validation split held out from the train set
+    chooses the stopping epoch (training stops when its error has not improved in patience consecutive checks),
+    and the test set is only scored at that epoch, so that it does not bias the score.
+
+    Args:
+        split               (tuple):   Indexes of the train and test sets.
+        X                   (ndarray): Input samples.
+        y                   (ndarray): Target values.
+        parameters          (dict):    Hyperparameters of the network.
+        budget              (int):     Maximum number of epochs.
+        check_every         (int):     Number of epochs between evaluations of the validation error.
+        patience            (int):     Number of evaluations without improvement before stopping.
+        validation_fraction (float):   Fraction of the train set held out for choosing the stopping epoch.
+        random_state        (int):     Seed of the validation split.
+
+    Returns:
+        tuple: Test error at the chosen epoch and the number of epochs at which it was chosen.
+    """
+
+    train_index, test_index = split
+
+    # Holding out the validation split from the train set
+
+    train_index = np.random.default_rng(random_state).permutation(train_index)
+    n_validation = max(1, int(round(validation_fraction * len(train_index))))
+    validation_index, train_index = train_index[:n_validation], train_index[n_validation:]
+
+    evaluation_index = np.concatenate([validation_index, test_index])
+    X_train, X_evaluation, y_train, y_scaler = xy_scaler(X[train_index], X[evaluation_index], y[train_index])
+    X_validation, X_test = X_evaluation[:n_validation], X_evaluation[n_validation:]
+
+    model = initialize_model('Convolutional Neural Network', **parameters)
+
+    best_error = np.inf
+    best_epoch = 0
+    test_error = np.inf
+    n_stale    = 0
+    for epoch in range(1, budget + 1):
+        model.partial_fit(X_train, y_train)
+        if (epoch % check_every) and (epoch < budget):
+            continue
+
+        y_pred = y_descaler([model.predict(X_validation)], y_scaler)[0]
+        error  = np.linalg.norm(y_pred - y[validation_index]) / len(validation_index)
+        if error < best_error:
+            best_error, best_epoch, n_stale = error, epoch, 0
+
+            # Scoring the test set at the chosen epoch
+
+            y_pred     = y_descaler([model.predict(X_test)], y_scaler)[0]
+            test_error = np.linalg.norm(y_pred - y[test_index]) / len(test_index)
+        else:
+            n_stale += 1
+            if n_stale >= patience:
+                break
+    return test_error, best_epoch
+
+
+def _evaluate_trial(trial, X, y, model_type, splits, check_every, patience, validation_fraction, random_state,
+                    n_threads):
+    """Cross-validates a configuration with a given budget, as in cross_validation.cross_validate.
+
+    Args:
+        trial               (tuple):   Configuration and budget of the trial.
+        X                   (ndarray): Input samples.
+        y                   (ndarray): Target values.
+        model_type          (str):     Type of model.
+        splits              (list):    Indexes of the train and test sets of each fold.
+        check_every         (int):     Number of epochs between evaluations of the networks.
+        patience            (int):     Number of evaluations without improvement before stopping a network.
+        validation_fraction (float):   Fraction of the train sets held out for stopping the networks.
+        random_state        (int):     Seed of the validation splits.
+        n_threads           (int):     Number of threads of the trial.
+
+    Returns:
+        dict: Mean test error and number of iterations of the trial: trees, or the median of the epochs chosen
+            in each fold for networks (an upper bound for max_iter, as fit also stops by its tolerance).
+    """
+
+    configuration, budget = trial
+    budget_name = search_budgets[model_type][0]
+
+    if model_type == 'Random Forest':
+        parameters = {**configuration, budget_name: budget}
+        errors = []
+        for split in splits:
+            _, _, y_pred = run_fold(split, X, y, model_type, parameters, n_threads)
+            errors.append(np.linalg.norm(y_pred - y[split[1]]) / len(split[1]))
+        return {'score': np.mean(errors), 'n_iterations': budget}
+
+    with threadpool_limits(limits=n_threads):
+        folds = [_run_network_fold(split, X, y, configuration, budget, check_every, patience,
+                                   validation_fraction=validation_fraction, random_state=random_state)
+                 for split in splits]
+    errors, epochs = zip(*folds)
+    return {'score': np.mean(errors), 'n_iterations': int(np.median(epochs))}
+
+
+def _run_trial(trial, X, y, model_type, splits, check_every, patience, validation_fraction, random_state, n_threads,
+               cache_directory):
+    """Evaluates a trial, loading it from the cache if the same configuration, budget and data were evaluated.
+
+    Args:
+        trial               (tuple):   Configuration and budget of the trial.
+        X                   (ndarray): Input samples.
+        y                   (ndarray): Target values.
+        model_type          (str):     Type of model.
+        splits              (list):    Indexes of the train and test sets of each fold.
+        check_every         (int):     Number of epochs between evaluations of the networks.
+        patience            (int):     Number of evaluations without improvement before stopping a network.
+        validation_fraction (float):   Fraction of the train sets held out for stopping the networks.
+        random_state        (int):     Seed of the validation splits.
+        n_threads           (int):     Number of threads of the trial.
+        cache_directory     (str):     Folder of the cached trials (no caching if None).
+
+    Returns:
+        dict: Mean test error and number of iterations of the trial.
+    """
+
+    arguments = (trial, X, y, model_type, splits, check_every, patience, validation_fraction, random_state,
+                 n_threads)
+    if cache_directory is None:
+        return _evaluate_trial(*arguments)
+
+    configuration, budget = trial
+    inputs = {
+        'model_type':    model_type,
+        'configuration': configuration,
+        'budget':        budget,
+        'X':             X,
+        'y':             y,
+        'splits':        splits,
+        'check_every':         check_every,
+        'patience':            patience,
+        'validation_fraction': validation_fraction,
+        'random_state':        random_state,
+        'version':             sklearn.__version__
+    }
+    result = ResultCache(cache_directory).get_or_compute(_evaluate_trial, inputs, *arguments)
+    return {'score': float(result['score']), 'n_iterations': int(result['n_iterations'])}
+
+
+def search_hyperparameters(model_type, X, y, n_configurations=27, eta=3, min_budget=None, max_budget=None,
+                           n_splits=5, n_jobs=None, cache_directory=None, check_every=10, patience=10,
+                           validation_fraction=0.2, random_state=0):
+    """Searches the hyperparameters of a model by successive halving: random configurations are cross-validated
+    with a small budget (trees or epochs), and only the best 1/eta of them are evaluated again with an eta times
+    larger budget, up to the maximum one. The trials of each round run in parallel, one process per trial,
+    and networks are stopped when the error of a validation split held out from each train set stops improving.
+
+    Args:
+        model_type          (str):        'Random Forest' or 'Convolutional Neural Network'.
+        X                   (array-like): Input samples.
+        y                   (array-like): Target values.
+        n_configurations    (int):        Number of configurations of the first round.
+        eta                 (int):        Reduction factor of the configurations between rounds.
+        min_budget          (int):        Budget of the first round (default in search_budgets if None).
+        max_budget          (int):        Budget of the last round (default in search_budgets if None).
+        n_splits            (int):        Number of folds of the cross-validation.
+        n_jobs              (int):        Number of trials run at once (all the cores if None).
+        cache_directory     (str):        Folder of the cached trials (no caching if None).
+        check_every         (int):        Number of epochs between evaluations of the networks.
+        patience            (int):        Number of evaluations without improvement before stopping a network.
+        validation_fraction (float):      Fraction of each train set held out for stopping the networks.
+        random_state        (int):        Seed of the configurations, the folds and the validation splits.
+
+    Returns:
+        dict: Best hyperparameters (ready for models.initialize_model), their score and every trial
+            (configuration, budget, score and number of iterations).
+    """
+
+    X = np.asarray(X, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    budget_name, default_min, default_max = search_budgets[model_type]
+    min_budget = default_min if min_budget is None else min_budget
+    max_budget = default_max if max_budget is None else max_budget
+
+    # Budgets of the rounds, ending at the maximum one
+
+    n_rounds = int(np.floor(np.log(max_budget / min_budget) / np.log(eta) + 1e-9)) + 1
+    budgets  = [max(1, int(round(max_budget / eta**(n_rounds - 1 - i)))) for i in range(n_rounds)]
+
+    configurations = sample_configurations(model_type, n_configurations, random_state=random_state)
+    splits = list(KFold(n_splits=n_splits, shuffle=True, random_state=random_state).split(X))
+
+    n_cores = mp.cpu_count()
+    n_jobs  = n_cores if n_jobs is None else n_jobs
+
+    trials = []
+    for budget in budgets:
+        n_parallel = min(n_jobs, len(configurations))
+        shared_data = {
+            'X':                   X,
+            'y':                   y,
+            'model_type':          model_type,
+            'splits':              splits,
+            'check_every':         check_every,
+            'patience':            patience,
+            'validation_fraction': validation_fraction,
+            'random_state':        random_state,
+            'n_threads':           max(1, n_cores // n_parallel),
+            'cache_directory':     cache_directory
+        }
+        results = parallel_map(_run_trial, [(configuration, budget) for configuration in configurations],
+                               shared=shared_data, n_jobs=n_parallel, chunksize=1)
+
+        for configuration, result in zip(configurations, results):
+            trials.append({'configuration': configuration, 'budget': budget, **result})
+
+        # Keeping the best configurations for the next round
+
+        scores = [result['score'] for result in results]
+        order  = np.argsort(scores, kind='stable')
+        best_configuration, best_result = configurations[order[0]], results[order[0]]
+        configurations = [configurations[i] for i in order[:max(1, len(configurations) // eta)]]
+
+    parameters = {**_get_default_parameters(model_type), **best_configuration,
+                  budget_name: best_result['n_iterations']}
+    return {'parameters': parameters, 'score': best_result['score'], 'trials': trials}
+
+
+def search_targets(targets, input_folder, model_type, n_fu=4, **search_parameters):
+    """Searches the hyperparameters of a model for every target, one after another (the trials of each search
+    run in parallel).
+
+    Args:
+        targets             (iterable): Names of the target properties.
+        input_folder        (str):      Folder containing the {target}.txt files.
+        model_type          (str):      'Random Forest' or 'Convolutional Neural Network'.
+        n_fu                (int):      Number of formula units of the simulated cells.
+        **search_parameters (object):   Options of search_hyperparameters.
+
+    Returns:
+        dict: Result of search_hyperparameters for each target.
+    """
+
+    results = {}
+    for target in targets:
+        X, y = load_target(input_folder, target, n_fu=n_fu)
+        results[target] = search_hyperparameters(model_type, X, y, **search_parameters)
+    return results
@@ -0,0 +1,453 @@
+import numpy           as np
+import multiprocessing as mp
+import sklearn
+import pickle
+import os
+
+from sklearn.base           import BaseEstimator, RegressorMixin
+from sklearn.ensemble       import RandomForestRegressor
+from sklearn.neural_network import MLPRegressor
+from sklearn.preprocessing  import StandardScaler
+from libraries.cache        import get_fingerprint
+
+# Default hyperparameters of each type of model
+model_parameters = {
+    'Random Forest': {
+        'n_estimators':      300,
+        'criterion':         'squared_error',
+        'max_depth':         None,
+        'min_samples_leaf':  1,
+        'min_samples_split': 2,
+        'bootstrap':         True
+    },
+    'Convolutional Neural Network': {
+        'hidden_layer_sizes': (32, 32),
+        'activation':         'relu',
+        'solver':             'adam',
+        'alpha':              0.05,
+        'batch_size':         'auto',
+        'learning_rate':      'constant',
+        'max_iter':           10000,
+        'momentum':           0.9
+    }
+}
+
+# Bootstrap ensemble of neural networks, whose spread estimates the uncertainty of the predictions
+model_parameters['Bootstrap Ensemble'] = dict(model_parameters['Convolutional Neural Network'], n_members=10)
+
+# Labels of each target property for the figures
+target_labels = {
+    'energy_HSE06+LS': r'$H_f$ (eV)',
+    'energy_PS':       r'$H_f$ (eV)',
+    'band_gap':        r'$E_g$ (eV)',
+    'vbm_011':         r'$VMB [011]$ (eV)',
+    'vbm_010':         r'$VMB [010]$ (eV)',
+    'RIGHT_abs':       r'$\alpha$ ($\mu\mathregular{m^{-1}}$)',
+    'LEFT_abs':        r'$\alpha$ ($\mu\mathregular{m^{-1}}$)'
+}
+
+# Hyperparameters that do not change the fitted model
+_execution_parameters = ('n_jobs', 'verbose')
+
+
+def _as_2d(X):
+    """Converts the input samples into a two-dimensional float array.
+
+    Args:
+        X (array-like): Input samples, one-dimensional for a single feature.
+
+    Returns:
+        ndarray: Array of shape (n_samples, n_features).
+    """
+
+    X = np.asarray(X, dtype=float)
+    if len(np.shape(X)) == 1:
+        X = X.reshape(-1, 1)
+    return X
+
+
+def load_target(input_folder, target, n_fu=4):
+    """Loads the compositions and values of a target property, converting them into the units of the models:
+    energies by formula unit and absorption coefficients in micro-m^-1.
+
+    Args:
+        input_folder (str): Folder containing the {target}.txt files.
+        target       (str): Name of the target property.
+        n_fu         (int): Number of formula units of the simulated cells.
+
+    Returns:
+        tuple: Compositions of shape (n_samples, 3) and target values.
+    """
+
+    temp_data = np.loadtxt(f'{input_folder}/{target}.txt')
+    X = temp_data[:, :3]
+    y = temp_data[:, 3]
+
+    if target in ('energy_HSE06+LS', 'energy_PS'):
+        y /= n_fu  # By formula unit
+    elif target in ('RIGHT_abs', 'LEFT_abs'):
+        y /= 1e4  # Change of units from cm to micro-m
+    return X, y
+
+
+def get_model_parameters(model_type, **parameters):
+    """Hyperparameters of a type of model, updated with the given ones.
+
+    Args:
+        model_type   (str):    'Random Forest', 'Convolutional Neural Network' or 'Bootstrap Ensemble'.
+        **parameters (object): Hyperparameters overriding the defaults.
+
+    Returns:
+        dict: Hyperparameters of the model.
+    """
+
+    if model_type not in model_parameters:
+        raise ValueError(f'Model name not defined: {model_type}.')
+
+    model_parameters_copy = dict(model_parameters[model_type])
+    if model_type == 'Random Forest':
+        model_parameters_copy['n_jobs'] = mp.cpu_count()
+    model_parameters_copy.update(parameters)
+    return model_parameters_copy
+
+
+def initialize_model(model_type, **parameters):
+    """Creates a (not fitted) model of the given type.
+
+    Args:
+        model_type   (str):    'Random Forest', 'Convolutional Neural Network' or 'Bootstrap Ensemble'.
+        **parameters (object): Hyperparameters overriding the defaults.
+
+    Returns:
+        object: RandomForestRegressor, MLPRegressor or BootstrapEnsemble.
+    """
+
+    parameters = get_model_parameters(model_type, **parameters)
+    if model_type == 'Random Forest':
+        return RandomForestRegressor(**parameters)  # random_state=0
+    if model_type == 'Bootstrap Ensemble':
+        return BootstrapEnsemble(**parameters)
+    return MLPRegressor(**parameters)  # random_state=0
+
+
+class BootstrapEnsemble(RegressorMixin, BaseEstimator):
+    """Neural networks fitted on bootstrap samples of the training set, whose spread estimates the uncertainty
+    of the mean prediction (as the trees of a random forest). The hyperparameters of the networks are those of
+    MLPRegressor, declared explicitly so that the ensemble can be cloned and hashed as any sklearn estimator.
+    """
+
+    def __init__(self, n_members=10, hidden_layer_sizes=(32, 32), activation='relu', solver='adam', alpha=0.05,
+                 batch_size='auto', learning_rate='constant', learning_rate_init=0.001, max_iter=10000,
+                 momentum=0.9, tol=1e-4, random_state=None):
+        """Initializes the ensemble, not fitted yet.
+
+        Args:
+            n_members          (int):   Number of neural networks.
+            hidden_layer_sizes (tuple): Sizes of the hidden layers of each network.
+            activation         (str):   Activation function of the hidden layers.
+            solver             (str):   Solver of the weights.
+            alpha              (float): Strength of the L2 regularization.
+            batch_size         (int):   Size of the minibatches.
+            learning_rate      (str):   Schedule of the learning rate.
+            learning_rate_init (float): Initial learning rate.
+            max_iter           (int):   Maximum number of epochs.
+            momentum           (float): Momentum of the gradient descent (sgd solver).
+            tol                (float): Tolerance of the optimization.
+            random_state       (int):   Seed of the bootstrap samples and the initialization of the networks.
+        """
+
+        self.n_members          = n_members
+        self.hidden_layer_sizes = hidden_layer_sizes
+        self.activation         = activation
+        self.solver             = solver
+        self.alpha              = alpha
+        self.batch_size         = batch_size
+        self.learning_rate      = learning_rate
+        self.learning_rate_init = learning_rate_init
+        self.max_iter           = max_iter
+        self.momentum           = momentum
+        self.tol                = tol
+        self.random_state       = random_state
+
+    def fit(self, X, y):
+        """Fits each network on a bootstrap sample (with replacement) of the training set.
+
+        Args:
+            X (array-like): Training input samples.
+            y (array-like): Target values.
+
+        Returns:
+            BootstrapEnsemble: The fitted ensemble.
+        """
+
+        X = _as_2d(X)
+        y = np.ravel(y)
+
+        parameters = self.get_params()
+        parameters.pop('n_members')
+
+        rng = np.random.default_rng(self.random_state)
+        self.estimators_ = []
+        for seed in rng.integers(2**31, size=self.n_members):
+            indexes = rng.integers(len(X), size=len(X))
+            estimator = MLPRegressor(**{**parameters, 'random_state': int(seed)})
+            self.estimators_.append(estimator.fit(X[indexes], y[indexes]))
+        return self
+
+    def predict_members(self, X):
+        """Predictions of every network.
+
+        Args:
+            X (array-like): Input samples.
+
+        Returns:
+            ndarray: Predictions of shape (n_samples, n_members).
+        """
+
+        X = _as_2d(X)
+        return np.column_stack([estimator.predict(X) for estimator in self.estimators_])
+
+    def predict(self, X):
+        """Mean prediction of the networks.
+
+        Args:
+            X (array-like): Input samples.
+
+        Returns:
+            ndarray: Predictions of shape (n_samples,).
+        """
+
+        return np.mean(self.predict_members(X), axis=1)
+
+
+def _get_leaf_table(forest):
+    """Flat table with the values of the nodes of every tree of a forest, and the offset of each tree in it.
+
+    Args:
+        forest (RandomForestRegressor): Fitted forest.
+
+    Returns:
+        tuple: Values of the nodes and offsets of the trees.
+    """
+
+    trees   = [estimator.tree_ for estimator in forest.estimators_]
+    offsets = np.concatenate([[0], np.cumsum([tree.node_count for tree in trees])[:-1]])
+    values  = np.concatenate([tree.value[:, 0, 0] for tree in trees])
+    return values, offsets
+
+
+def get_member_predictions(estimator, X):
+    """Predictions of every member of an ensemble (trees of a random forest or networks of a bootstrap ensemble).
+    The trees are evaluated at once, by gathering the values of the leaves reached by each sample from a flat table.
+
+    Args:
+        estimator (object):     Fitted RandomForestRegressor or BootstrapEnsemble.
+        X         (array-like): Input samples.
+
+    Returns:
+        ndarray: Predictions of shape (n_samples, n_members).
+    """
+
+    if isinstance(estimator, RandomForestRegressor):
+        values, offsets = _get_leaf_table(estimator)
+        return values[estimator.apply(_as_2d(X)) + offsets]
+    if isinstance(estimator, BootstrapEnsemble):
+        return estimator.predict_members(X)
+    raise ValueError(f'The spread of the predictions is not available for {type(estimator).__name__}.')
+
+
+class SurrogateModel:
+    """Estimator bundled with the scalers fitted on its training set and the metadata of its target.
+    The scalers are fitted once, with the model, so that predictions only transform the new samples.
+    """
+
+    def __init__(self, estimator, target=None, label_name=None):
+        """Initializes the model, not fitted yet.
+
+        Args:
+            estimator  (object): Regressor implementing fit and predict (e.g. from initialize_model).
+            target     (str):    Name of the target property (e.g. 'band_gap').
+            label_name (str):    Label of the target for the figures.
+        """
+
+        self.estimator  = estimator
+        self.target     = target
+        self.label_name = label_name
+        self.X_scaler   = None
+        self.y_scaler   = None
+
+        # Provenance, set when the model is stored
+        self.model_type    = None
+        self.parameters    = None
+        self.training_hash = None
+
+    def fit(self, X, y):
+        """Fits the scalers and the estimator as z = (x - u) / s, as in utils.xy_scaler.
+
+        Args:
+            X (array-like): Training input samples.
+            y (array-like): Target values.
+
+        Returns:
+            SurrogateModel: The fitted model.
+        """
+
+        X = _as_2d(X)
+        y = np.asarray(y, dtype=float).reshape(-1, 1)
+
+        self.X_scaler = StandardScaler().fit(X)
+        self.y_scaler = StandardScaler().fit(y)
+
+        self.estimator.fit(self.X_scaler.transform(X), np.ravel(self.y_scaler.transform(y)))
+        return self
+
+    def predict_scaled(self, compositions):
+        """Predicts the standardized target for a batch of compositions.
+
+        Args:
+            compositions (array-like): Input samples, of shape (n_samples, n_features).
+
+        Returns:
+            ndarray: Standardized predictions.
+        """
+
+        if self.X_scaler is None:
+            raise ValueError('The model must be fitted before predicting.')
+        return np.ravel(self.estimator.predict(self.X_scaler.transform(_as_2d(compositions))))
+
+    def predict(self, compositions):
+        """Predicts the target, in its original units, for a batch of compositions.
+
+        Args:
+            compositions (array-like): Input samples, of shape (n_samples, n_features).
+
+        Returns:
+            ndarray: Predictions of shape (n_samples,).
+        """
+
+        y_pred = self.predict_scaled(compositions)
+        return np.ravel(self.y_scaler.inverse_transform(y_pred.reshape(-1, 1)))
+
+    def predict_distribution(self, compositions):
+        """Predicts the mean and the spread (standard deviation) of the target across the members of the estimator
+        (trees of a random forest or networks of a bootstrap ensemble), in its original units.
+
+        Args:
+            compositions (array-like): Input samples, of shape (n_samples, n_features).
+
+        Returns:
+            tuple: Mean and standard deviation of the predictions, of shape (n_samples,).
+        """
+
+        if self.X_scaler is None:
+            raise ValueError('The model must be fitted before predicting.')
+
+        members = get_member_predictions(self.estimator, self.X_scaler.transform(_as_2d(compositions)))
+        mean = np.ravel(self.y_scaler.inverse_transform(np.mean(members, axis=1).reshape(-1, 1)))
+        std  = np.std(members, axis=1) * self.y_scaler.scale_[0]
+        return mean, std
+
+
+class ModelStore:
+    """Folder of fitted surrogate models, indexed by the hash of their training data and hyperparameters,
+    so that models are only refitted when any of them changes.
+    """
+
+    def __init__(self, directory):
+        """Initializes the store in a directory, which is created if needed.
+
+        Args:
+            directory (str): Folder containing the models.
+        """
+
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, model_type, parameters, X, y):
+        """Computes the key of a model from its training data and hyperparameters.
+
+        Args:
+            model_type (str):        Type of model.
+            parameters (dict):       Hyperparameters of the model.
+            X          (array-like): Training input samples.
+            y          (array-like): Target values.
+
+        Returns:
+            str: Key of the model.
+        """
+
+        parameters = {name: value for name, value in parameters.items() if name not in _execution_parameters}
+        return get_fingerprint(model_type, parameters, sklearn.__version__,
+                               np.asarray(X, dtype=float), np.asarray(y, dtype=float))
+
+    def _get_path(self, key):
+        """Path of the file of a model.
+
+        Args:
+            key (str): Key of the model.
+
+        Returns:
+            str: Path of the model.
+        """
+
+        return os.path.join(self.directory, f'{key}.pkl')
+
+    def load(self, key):
+        """Loads a stored model.
+
+        Args:
+            key (str): Key of the model.
+
+        Returns:
+            SurrogateModel: The fitted model, or None if it is not stored.
+        """
+
+        try:
+            with open(self._get_path(key), 'rb') as model_file:
+                return pickle.load(model_file)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+    def save(self, key, model):
+        """Stores a fitted model.
+
+        Args:
+            key   (str):            Key of the model.
+            model (SurrogateModel): Fitted model.
+        """
+
+        model_path = self._get_path(key)
+        temp_path  = f'{model_path}.{os.getpid()}.tmp'
+
+        with open(temp_path, 'wb') as model_file:
+            pickle.dump(model, model_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, model_path)
+
+    def load_or_fit(self, model_type, X, y, target=None, label_name=None, **parameters):
+        """Loads the model trained with the same data and hyperparameters, or fits and stores it.
+
+        Args:
+            model_type   (str):        'Random Forest', 'Convolutional Neural Network' or 'Bootstrap Ensemble'.
+            X            (array-like): Training input samples.
+            y            (array-like): Target values.
+            target       (str):        Name of the target property.
+            label_name   (str):        Label of the target for the figures.
+            **parameters (object):     Hyperparameters overriding the defaults.
+
+        Returns:
+            SurrogateModel: The fitted model.
+        """
+
+        parameters = get_model_parameters(model_type, **parameters)
+        key = self.get_key(model_type, parameters, X, y)
+
+        model = self.load(key)
+        if model is None:
+            model = SurrogateModel(initialize_model(model_type, **parameters), target=target, label_name=label_name)
+            model.fit(X, y)
+
+            model.model_type    = model_type
+            model.parameters    = parameters
+            model.training_hash = get_fingerprint(np.asarray(X, dtype=float), np.asarray(y, dtype=float))
+            self.save(key, model)
+        return model
@@ -0,0 +1,103 @@
+import numpy           as np
+import multiprocessing as mp
+import sys
+
+# State of each worker, set once by the initializer of the pool
+
+_function = None
+_shared   = {}
+
+
+def _initialize_worker(function, shared):
+    """Stores the function and the shared arguments in the worker, so they are sent only once.
+
+    Args:
+        function (callable): Function to be mapped.
+        shared   (dict):     Keyword arguments shared by every call.
+    """
+
+    global _function, _shared
+    _function = function
+    _shared   = shared
+
+
+def _call(item):
+    """Applies the stored function to one item, with the shared arguments of the worker.
+
+    Args:
+        item (object): Item to be processed.
+
+    Returns:
+        object: Result of the function.
+    """
+
+    return _function(item, **_shared)
+
+
+def _print_progress(done, total):
+    """Prints the number of processed items, overwriting the previous report.
+
+    Args:
+        done  (int): Number of processed items.
+        total (int): Total number of items.
+    """
+
+    print(f'\rProgress: {done}/{total} ({100 * done / max(total, 1):.0f}%)', end='', file=sys.stderr, flush=True)
+    if done == total:
+        print(file=sys.stderr, flush=True)
+
+
+def split_in_chunks(array, chunk_size):
+    """Splits an array into consecutive chunks (views) along its first axis.
+
+    Args:
+        array      (ndarray): Array to be split.
+        chunk_size (int):     Maximum length of each chunk.
+
+    Returns:
+        list: Chunks of the array, in order.
+    """
+
+    return [array[start:start+chunk_size] for start in range(0, len(array), chunk_size)]
+
+
+def parallel_map(function, items, shared=None, n_jobs=None, chunksize=None, progress=False):
+    """Applies function(item, **shared) to every item with a pool of processes.
+    The function and the shared arguments are sent to each worker once (at its initialization),
+    the items are distributed in chunks, and the results are returned in the order of the items.
+
+    Args:
+        function  (callable): Function to be mapped, with the item as first argument.
+        items     (iterable): Items to be processed.
+        shared    (dict):     Keyword arguments shared by every call (e.g. large arrays).
+        n_jobs    (int):      Number of processes (all the cores if None). With 1, no pool is created.
+        chunksize (int):      Number of items sent to a worker at once (balanced automatically if None).
+        progress  (bool):     Whether to print the progress.
+
+    Returns:
+        list: Results of the function, in the order of the items.
+    """
+
+    items  = list(items)
+    shared = {} if shared is None else shared
+    n_jobs = mp.cpu_count() if n_jobs is None else n_jobs
+    total  = len(items)
+
+    if chunksize is None:
+        # About four chunks per worker, to balance the load
+        chunksize = max(1, int(np.ceil(total / (4 * n_jobs))))
+
+    results = []
+    if (n_jobs == 1) or (total <= 1):
+        for item in items:
+            results.append(function(item, **shared))
+            if progress:
+                _print_progress(len(results), total)
+        return results
+
+    with mp.Pool(min(n_jobs, total), initializer=_initialize_worker, initargs=(function, shared)) as pool:
+        for result in pool.imap(_call, items, chunksize=chunksize):
+            results.append(result)
+            if progress:
+                _print_progress(len(results), total)
+    return results
@@ -0,0 +1,126 @@
+import numpy           as np
+import pandas          as pd
+import multiprocessing as mp
+
+from threadpoolctl      import threadpool_limits
+from libraries.models   import ModelStore, SurrogateModel, initialize_model, load_target, target_labels
+from libraries.parallel import parallel_map
+
+
+def _fit_target(target, input_folder, model_type, n_fu, store_directory, n_threads, parameters):
+    """Loads the data of one target and fits (or loads) its model, using at most n_threads threads.
+
+    Args:
+        target          (str):  Name of the target property.
+        input_folder    (str):  Folder containing the {target}.txt files.
+        model_type      (str):  Type of model (see models.initialize_model).
+        n_fu            (int):  Number of formula units of the simulated cells.
+        store_directory (str):  Folder of the model store (models are not stored if None).
+        n_threads       (int):  Number of threads of the fit (BLAS and Random Forest jobs).
+        parameters      (dict): Hyperparameters overriding the defaults.
+
+    Returns:
+        SurrogateModel: The fitted model.
+    """
+
+    X, y = load_target(input_folder, target, n_fu=n_fu)
+    label_name = target_labels.get(target)
+
+    if model_type == 'Random Forest':
+        parameters = {**parameters, 'n_jobs': n_threads}
+
+    with threadpool_limits(limits=n_threads):
+        if store_directory is not None:
+            return ModelStore(store_directory).load_or_fit(model_type, X, y, target=target, label_name=label_name,
+                                                           **parameters)
+
+        model = SurrogateModel(initialize_model(model_type, **parameters), target=target, label_name=label_name)
+        return model.fit(X, y)
+
+
+def train_targets(targets, input_folder, model_type, n_jobs=None, n_fu=4, store_directory=None, **parameters):
+    """Loads the data of every target once and fits one model per target, in parallel.
+
+    Args:
+        targets         (list):   Names of the target properties.
+        input_folder    (str):    Folder containing the {target}.txt files.
+        model_type      (str):    Type of model (see models.initialize_model).
+        n_jobs          (int):    Number of targets fitted at once (all the cores if None).
+        n_fu            (int):    Number of formula units of the simulated cells.
+        store_directory (str):    Folder of a models.ModelStore, to reuse models already trained.
+        **parameters    (object): Hyperparameters overriding the defaults.
+
+    Returns:
+        dict: Fitted SurrogateModel of each target.
+    """
+
+    n_cores = mp.cpu_count()
+    n_jobs  = min(n_cores if n_jobs is None else n_jobs, len(targets))
+
+    shared_data = {
+        'input_folder':    input_folder,
+        'model_type':      model_type,
+        'n_fu':            n_fu,
+        'store_directory': store_directory,
+        'n_threads':       max(1, n_cores // max(n_jobs, 1)),
+        'parameters':      parameters
+    }
+    fitted_models = parallel_map(_fit_target, targets, shared=shared_data, n_jobs=n_jobs, chunksize=1)
+    return dict(zip(targets, fitted_models))
+
+
+def predict_targets(surrogates, chunks):
+    """Predicts every target over a stream of chunks of compositions, in a single sweep.
+
+    Args:
+        surrogates (dict):     Fitted SurrogateModel of each target.
+        chunks     (iterable): Chunks of compositions, e.g. from grid.iterate_grid.
+
+    Yields:
+        tuple: Compositions of the chunk and predictions of shape (n_points, n_targets).
+    """
+
+    for chunk in chunks:
+        predictions = np.empty((len(chunk), len(surrogates)))
+        for i, surrogate in enumerate(surrogates.values()):
+            predictions[:, i] = surrogate.predict(chunk)
+        yield chunk, predictions
+
+
+def save_property_table(surrogates, chunks, file_name, columns=('x', 'y', 'z')):
+    """Writes the predictions of every target over a stream of chunks into one CSV table,
+    with one column per composition coordinate and per target.
+
+    Args:
+        surrogates (dict):     Fitted SurrogateModel of each target.
+        chunks     (iterable): Chunks of compositions, e.g. from grid.iterate_grid.
+        file_name  (str):      Path of the output table.
+        columns    (tuple):    Names of the composition columns.
+
+    Returns:
+        int: Number of rows written.
+    """
+
+    header = ','.join(list(columns) + list(surrogates))
+
+    n_rows = 0
+    with open(file_name, 'w') as output_file:
+        output_file.write(f'{header}\n')
+        for chunk, predictions in predict_targets(surrogates, chunks):
+            np.savetxt(output_file, np.column_stack([chunk, predictions]), delimiter=',')
+            n_rows += len(chunk)
+    return n_rows
+
+
+def load_property_table(file_name, columns=('x', 'y', 'z')):
+    """Loads a table of properties, indexed by composition.
+
+    Args:
+        file_name (str):   Path of the table.
+        columns   (tuple): Names of the composition columns.
+
+    Returns:
+        DataFrame: Properties of each composition.
+    """
+
+    return pd.read_csv(file_name).set_index(list(columns))
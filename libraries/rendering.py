@@ -0,0 +1,221 @@
+import numpy as np
+
+from matplotlib.figure  import Figure
+from libraries.parallel import parallel_map
+from libraries.utils    import footnotesize
+
+# Resolution of the rasterized layers of vector figures (as eps_dpi in the notebooks)
+eps_dpi = 100
+
+# Labels of the mixing sublattices
+composition_labels = (r'$Bi_x Sb_{1-x}$', r'$S_y Se_{1-y}$', r'$I_z Br_{1-z}$')
+
+
+def decimate_points(points, resolution=100, lower=0, upper=1):
+    """Keeps one point per voxel of a regular grid, removing points that overlap visually in a figure.
+
+    Args:
+        points     (ndarray): Points of shape (n_points, n_dimensions).
+        resolution (int):     Number of voxels along each axis.
+        lower      (float):   First value of each axis.
+        upper      (float):   Last value of each axis.
+
+    Returns:
+        ndarray: Sorted indexes of the kept points.
+    """
+
+    voxels = np.floor((np.asarray(points) - lower) / (upper - lower) * resolution).astype(np.int64)
+    voxels = np.clip(voxels, 0, resolution - 1)
+
+    linear = np.ravel_multi_index(voxels.T, (resolution,) * voxels.shape[1])
+    _, indexes = np.unique(linear, return_index=True)
+    return np.sort(indexes)
+
+
+def get_color_limits(values, vmin=None, vmax=None, scale_factor=1):
+    """Limits of a colorbar, rounding the extreme values outwards to multiples of scale_factor (as in the notebooks).
+
+    Args:
+        values       (ndarray): Values of the figure.
+        vmin         (float):   Minimum of the colorbar (computed if None).
+        vmax         (float):   Maximum of the colorbar (computed if None).
+        scale_factor (float):   Rounding of the limits.
+
+    Returns:
+        tuple: Minimum and maximum of the colorbar.
+    """
+
+    vmin = np.floor(np.min(values) / scale_factor) * scale_factor if vmin is None else vmin
+    vmax = np.ceil(np.max(values)  / scale_factor) * scale_factor if vmax is None else vmax
+    return vmin, vmax
+
+
+def _save_figure(fig, file_name, dpi):
+    """Saves a figure, with a tight bounding box.
+
+    Args:
+        fig       (Figure): Figure to be saved.
+        file_name (str):    Path of the figure (its extension defines the format).
+        dpi       (int):    Resolution of the figure (of the rasterized layers for vector formats).
+    """
+
+    fig.savefig(file_name, dpi=dpi, bbox_inches='tight')
+
+
+def render_ternary(file_name, X, Y, Z, labels=None, lines=(), cmap='summer', bar_name=None, ticks=None,
+                   figsize=(5, 5), dpi=eps_dpi, fontsize=footnotesize, rasterized=True):
+    """Renders a map projected over a ternary diagram (e.g. the convex-hull energies), as in convex-hull plot.ipynb.
+
+    Args:
+        file_name  (str):      Path of the figure.
+        X          (ndarray):  Horizontal coordinates of the grid.
+        Y          (ndarray):  Vertical coordinates of the grid.
+        Z          (ndarray):  Values over the grid (NaN outside of the diagram).
+        labels     (dict):     Coordinates (a, b) of the labelled phases.
+        lines      (iterable): Lines of the diagram, as ((x_0, x_1), (y_0, y_1)).
+        cmap       (str):      Colormap of the map.
+        bar_name   (str):      Label of the colorbar.
+        ticks      (iterable): Ticks of the colorbar.
+        figsize    (tuple):    Size of the figure.
+        dpi        (int):      Resolution of the figure.
+        fontsize   (int):      Size of the labels.
+        rasterized (bool):     Whether the filled contours are rasterized inside vector formats.
+
+    Returns:
+        str: Path of the figure.
+    """
+
+    fig = Figure(figsize=figsize)
+    ax  = fig.add_subplot()
+
+    sc = ax.contourf(X, Y, Z, cmap=cmap)
+    sc.set_rasterized(rasterized)
+
+    dt = 3e-2  # Displacement for text
+    for label, (a, b) in (labels or {}).items():
+        ax.plot(a, b, '.k')
+        ax.text(a+dt, b+dt, label, fontsize=fontsize)
+
+    for x_line, y_line in lines:
+        ax.plot(x_line, y_line, 'k', linewidth=1)
+
+    cbar = fig.colorbar(sc, ax=ax, orientation='horizontal', location='bottom', pad=0, shrink=0.5, ticks=ticks)
+    cbar.ax.tick_params(labelsize=fontsize)
+    if bar_name is not None:
+        cbar.set_label(bar_name, fontsize=fontsize)
+
+    dt = 1e-1
+    ax.set_xlim(0-dt, 1+dt)
+    ax.set_ylim(0-dt, 1+dt)
+    ax.axis('off')
+
+    _save_figure(fig, file_name, dpi)
+    return file_name
+
+
+def render_scatter(file_name, points, values, highlight=None, highlight_label=None, cmap='plasma', vmin=None,
+                   vmax=None, scale_factor=1, bar_name=None, axis_labels=composition_labels, decimation=None, figsize=(5, 5),
+                   dpi=eps_dpi, fontsize=footnotesize, rasterized=True):
+    """Renders a property over the compositions as a 3D scatter, as in solid-solutions.ipynb and cbm.ipynb.
+
+    Args:
+        file_name       (str):     Path of the figure.
+        points          (ndarray): Compositions of shape (n_points, 3).
+        values          (ndarray): Property of each composition.
+        highlight       (ndarray): Boolean mask of the compositions highlighted in red.
+        highlight_label (str):     Legend of the highlighted compositions.
+        cmap            (str):     Colormap of the property.
+        vmin            (float):   Minimum of the colorbar (minimum value rounded down to scale_factor if None).
+        vmax            (float):   Maximum of the colorbar (maximum value rounded up to scale_factor if None).
+        scale_factor    (float):   Rounding of the default limits of the colorbar, as in the notebooks.
+        bar_name        (str):     Label of the colorbar.
+        axis_labels     (tuple):   Labels of the axes.
+        decimation      (int):     Number of voxels along each axis for removing overlapping points (None for all).
+        figsize         (tuple):   Size of the figure.
+        dpi             (int):     Resolution of the figure (of the rasterized points for vector formats).
+        fontsize        (int):     Size of the labels.
+        rasterized      (bool):    Whether the points are rasterized inside vector formats.
+
+    Returns:
+        str: Path of the figure.
+    """
+
+    points = np.asarray(points)
+    values = np.asarray(values)
+    highlight = np.zeros(len(points), dtype=bool) if highlight is None else np.asarray(highlight)
+
+    # Setting minimum and maximum values for the colorbar (before decimating)
+
+    vmin, vmax = get_color_limits(values, vmin=vmin, vmax=vmax, scale_factor=scale_factor)
+
+    if decimation is not None:
+        kept = np.zeros(len(points), dtype=bool)
+        kept[decimate_points(points, resolution=decimation)] = True
+        kept[highlight] = True  # Highlighted compositions are never removed
+        points, values, highlight = points[kept], values[kept], highlight[kept]
+
+    fig = Figure(figsize=figsize)
+    ax  = fig.add_subplot(projection='3d')
+
+    sc = ax.scatter(points[:, 0], points[:, 1], points[:, 2], c=values, vmin=vmin, vmax=vmax, marker='o',
+                    cmap=cmap, rasterized=rasterized)
+
+    if np.any(highlight):
+        ax.scatter(points[highlight, 0], points[highlight, 1], points[highlight, 2], c='red', marker='o',
+                   label=highlight_label, rasterized=rasterized)
+        if highlight_label is not None:
+            ax.legend(loc='upper left', fontsize=fontsize)
+
+    cbar = fig.colorbar(sc, ax=ax, orientation='horizontal', location='bottom', pad=0.1, shrink=0.5,
+                        ticks=np.linspace(vmin, vmax, 4))
+    cbar.ax.tick_params(labelsize=fontsize)
+    if bar_name is not None:
+        cbar.set_label(bar_name, fontsize=fontsize)
+
+    for axis, label in zip('xyz', axis_labels):
+        getattr(ax, f'set_{axis}label')(label, fontsize=fontsize)
+        getattr(ax, f'set_{axis}lim')(0, 1)
+        ax.tick_params(axis=axis, labelsize=fontsize)
+
+    _save_figure(fig, file_name, dpi)
+    return file_name
+
+
+# Renderer of each kind of figure
+figure_types = {
+    'ternary': render_ternary,
+    'scatter': render_scatter
+}
+
+
+def render_figure(job):
+    """Renders the figure described by a job.
+
+    Args:
+        job (dict): Kind of figure ('ternary' or 'scatter') and the arguments of its renderer.
+
+    Returns:
+        str: Path of the figure.
+    """
+
+    job = dict(job)
+    kind = job.pop('kind')
+    if kind not in figure_types:
+        raise ValueError(f'Figure type not defined: {kind}.')
+    return figure_types[kind](**job)
+
+
+def render_figures(jobs, n_jobs=None, progress=False):
+    """Renders many figures (e.g. every target and format) at once, one process per figure. Figures are drawn
+    without pyplot (raster formats with Agg), so that no display is needed.
+
+    Args:
+        jobs     (iterable): Jobs of render_figure.
+        n_jobs   (int):      Number of processes (all the cores if None).
+        progress (bool):     Whether to print the progress.
+
+    Returns:
+        list: Paths of the figures, in the order of the jobs.
+    """
+
+    return parallel_map(render_figure, jobs, n_jobs=n_jobs, chunksize=1, progress=progress)
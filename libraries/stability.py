@@ -0,0 +1,174 @@
+import numpy as np
+
+from scipy.spatial   import ConvexHull
+from libraries.utils import get_composition_matrix, geometric_tolerance
+
+# Mixing sublattices of the Bi_x Sb_{1-x} S_y Se_{1-y} I_z Br_{1-z} solid solutions
+chalcohalide_sublattices = (('Bi', 'Sb'), ('S', 'Se'), ('I', 'Br'))
+
+
+def get_amounts(xyz_grid, sublattices=chalcohalide_sublattices, elements=None):
+    """Converts the mixing fractions of each sublattice into amounts of each element per formula unit.
+    For instance, (x, y, z) gives Bi_x Sb_{1-x} S_y Se_{1-y} I_z Br_{1-z}.
+
+    Args:
+        xyz_grid    (array-like): Mixing fractions, of shape (n_points, n_sublattices).
+        sublattices (tuple):      Pair of elements (first, second) of each sublattice.
+        elements    (list):       Ordering of the elements (that of the sublattices if None).
+
+    Returns:
+        ndarray: Amounts of shape (n_points, n_elements).
+    """
+
+    xyz_grid = np.asarray(xyz_grid, dtype=float).reshape(-1, len(sublattices))
+    if elements is None:
+        elements = [element for sublattice in sublattices for element in sublattice]
+
+    amounts = np.zeros((len(xyz_grid), len(elements)))
+    for i, (first, second) in enumerate(sublattices):
+        amounts[:, elements.index(first)]  += xyz_grid[:, i]
+        amounts[:, elements.index(second)] += 1 - xyz_grid[:, i]
+    return amounts
+
+
+class StabilityHull:
+    """Convex hull of a set of reference phases in composition space, built once for evaluating
+    the energy above the hull (eV/atom) of many compositions with linear algebra.
+    """
+
+    def __init__(self, reference_energies, elements=None):
+        """Builds the lower hull of the energies per atom of the reference phases.
+
+        Args:
+            reference_energies (dict): Total energies (eV/fu) of the reference phases, indexed by formula.
+            elements           (list): Ordering of the elements (order of appearance in the formulas if None).
+        """
+
+        self.names = list(reference_energies)
+
+        # Composition of every reference phase
+
+        self.elements, amounts = get_composition_matrix(self.names, elements)
+        n_atoms = np.sum(amounts, axis=1)
+
+        self.fractions = amounts / n_atoms[:, np.newaxis]
+        self.energies  = np.array([reference_energies[name] for name in self.names], dtype=float) / n_atoms
+
+        # Hull in the reduced space (the first fraction is redundant), with an extra point above every
+        # phase so that the hull is full-dimensional even if the references are not
+
+        n_elements = len(self.elements)
+        extra_point = np.append(np.full(n_elements - 1, 1 / n_elements), np.max(self.energies) + 1)
+
+        points = np.vstack([np.column_stack([self.fractions[:, 1:], self.energies]), extra_point])
+        hull   = ConvexHull(points, qhull_options='Qt')
+
+        # Facets facing downwards, without the extra point and not degenerate
+
+        lower  = (hull.equations[:, -1] < -geometric_tolerance) & np.all(hull.simplices < len(self.names), axis=1)
+        facets = hull.simplices[lower]
+
+        vertices = self.fractions[facets]
+        regular  = np.abs(np.linalg.det(vertices)) > geometric_tolerance
+        self.facets = facets[regular]
+
+        # Each facet is the plane E(x) = x · mu, mu being the chemical potentials of the elements in it
+
+        self._inverse_vertices   = np.linalg.inv(vertices[regular])
+        self.chemical_potentials = self._inverse_vertices @ self.energies[self.facets][:, :, np.newaxis]
+        self.chemical_potentials = self.chemical_potentials[:, :, 0]
+
+    @property
+    def stable_phases(self):
+        """Names of the reference phases lying on the hull.
+        """
+
+        return [self.names[index] for index in np.unique(self.facets)]
+
+    def _normalize(self, amounts):
+        """Converts amounts of each element into atomic fractions.
+
+        Args:
+            amounts (array-like): Amounts of shape (n_points, n_elements).
+
+        Returns:
+            tuple: Fractions of shape (n_points, n_elements) and number of atoms of each point.
+        """
+
+        amounts = np.asarray(amounts, dtype=float).reshape(-1, len(self.elements))
+        n_atoms = np.sum(amounts, axis=1)
+        return amounts / n_atoms[:, np.newaxis], n_atoms
+
+    def _locate(self, fractions, chunk_size):
+        """Computes the hull energy per atom and the facet of the hull under each composition.
+        Since the hull is convex, its energy is the maximum of the planes of its facets.
+
+        Args:
+            fractions  (ndarray): Atomic fractions of shape (n_points, n_elements).
+            chunk_size (int):     Number of points evaluated at once.
+
+        Returns:
+            tuple: Hull energies (eV/atom) and indexes of the facets.
+        """
+
+        hull_energies = np.empty(len(fractions))
+        facets        = np.empty(len(fractions), dtype=int)
+        for start in range(0, len(fractions), chunk_size):
+            planes = fractions[start:start+chunk_size] @ self.chemical_potentials.T
+
+            facets[start:start+chunk_size]        = np.argmax(planes, axis=1)
+            hull_energies[start:start+chunk_size] = np.max(planes, axis=1)
+        return hull_energies, facets
+
+    def get_hull_energies(self, amounts, chunk_size=65536):
+        """Computes the energy of the hull at each composition.
+
+        Args:
+            amounts    (array-like): Amounts of each element, of shape (n_points, n_elements).
+            chunk_size (int):        Number of points evaluated at once.
+
+        Returns:
+            ndarray: Hull energies (eV/atom).
+        """
+
+        fractions, _ = self._normalize(amounts)
+        return self._locate(fractions, chunk_size)[0]
+
+    def get_e_above_hull(self, amounts, energies, chunk_size=65536):
+        """Computes the energy above the hull of each composition (negative if below it),
+        as pymatgen's get_decomp_and_phase_separation_energy for entries not in the references.
+
+        Args:
+            amounts    (array-like): Amounts of each element, of shape (n_points, n_elements).
+            energies   (array-like): Total energies (eV) of each composition, for the given amounts.
+            chunk_size (int):        Number of points evaluated at once.
+
+        Returns:
+            ndarray: Energies above the hull (eV/atom).
+        """
+
+        fractions, n_atoms = self._normalize(amounts)
+        return np.asarray(energies, dtype=float).ravel() / n_atoms - self._locate(fractions, chunk_size)[0]
+
+    def get_decomposition(self, amounts):
+        """Decomposes each composition into the phases of the facet of the hull under it.
+
+        Args:
+            amounts (array-like): Amounts of each element, of shape (n_points, n_elements).
+
+        Returns:
+            list: Dictionary {phase: atomic fraction} for each composition.
+        """
+
+        fractions, _ = self._normalize(amounts)
+        _, facets = self._locate(fractions, len(fractions) or 1)
+
+        # Barycentric weights of the composition within its facet
+
+        weights = np.einsum('nij,ni->nj', self._inverse_vertices[facets], fractions)
+
+        decompositions = []
+        for facet, facet_weights in zip(facets, weights):
+            decompositions.append({self.names[index]: float(weight) for index, weight in zip(self.facets[facet], facet_weights)
+                                   if weight > geometric_tolerance})
+        return decompositions
@@ -0,0 +1,442 @@
+import numpy  as np
+import pandas as pd
+import os
+
+from glob                    import glob
+from xml.etree               import ElementTree
+from concurrent.futures      import ThreadPoolExecutor
+from libraries.summary_index import get_file_stamp
+from libraries.vasp_io       import read_outcar_phonons, read_outcar_elapsed_time, read_oszicar_energies, \
+                                    read_contcar_lattice, read_doscar, get_band_gap, \
+                                    read_vasprun_dielectric, read_outcar_dielectric
+
+# Energy of the limit of the visible range (eV)
+visible_eV = 3.26
+
+# Reduced Planck constant times the speed of light (eV cm)
+hbar_c = 1.973269804e-5
+
+
+def _list_subfolders(dir_path, flag=None):
+    """Folders of all the calculations within the directory of a type of calculation.
+
+    Args:
+        dir_path (str): Directory of the type of calculation (e.g. '../BiSI/convergence').
+        flag     (str): Functional and correction (not used).
+
+    Returns:
+        list: Paths of the calculation folders.
+    """
+
+    return [os.path.join(dir_path, folder) for folder in sorted(os.listdir(dir_path))
+            if os.path.isdir(os.path.join(dir_path, folder))]
+
+
+def _list_flag_folder(dir_path, flag):
+    """Folder of the calculation of the given functional and correction.
+
+    Args:
+        dir_path (str): Directory of the type of calculation (e.g. '../BiSI/band_gap').
+        flag     (str): Functional and correction (e.g. 'PS+D3').
+
+    Returns:
+        list: Path of the calculation folder.
+    """
+
+    return [os.path.join(dir_path, flag)]
+
+
+def _list_ncore_folders(dir_path, flag=None):
+    """Folders of the calculations with different NCORE (named after their value).
+
+    Args:
+        dir_path (str): Directory of the type of calculation (e.g. '../BiSI/phonon_spectra').
+        flag     (str): Functional and correction (not used).
+
+    Returns:
+        list: Paths of the calculation folders.
+    """
+
+    return [folder for folder in _list_subfolders(dir_path) if os.path.basename(folder).isdigit()]
+
+
+def _list_energy_folder(dir_path, flag):
+    """Folder where the energy of the system is computed, i.e. that of its absorption spectrum.
+
+    Args:
+        dir_path (str): Directory of the type of calculation (e.g. '../BiSI/energy').
+        flag     (str): Functional and correction (e.g. 'PS+D3').
+
+    Returns:
+        list: Path of the calculation folder.
+    """
+
+    return [os.path.join(os.path.dirname(dir_path), 'absorption_spectra', flag)]
+
+
+def _summarize_convergence(folder_path):
+    """Final energy of a convergence test, named as '{E_cutoff}eV_{KPoints}KP'.
+
+    Args:
+        folder_path (str): Calculation folder.
+
+    Returns:
+        dict: Cutoff energy, number of k-points and energy (eV), or None if not finished.
+    """
+
+    aux = os.path.basename(folder_path).split('eV_')
+    E_cutoff = float(aux[0])
+    KPoints  = int(aux[1].split('KP')[0])
+
+    energies = read_oszicar_energies(f'{folder_path}/OSZICAR')
+    if energies is None:
+        return None
+    return {'E_cutoff': E_cutoff, 'KPoints': KPoints, 'energy': energies['F']}
+
+
+def _summarize_relaxation(folder_path):
+    """Relaxed lattice parameters of a calculation, named as '{functional}+{correction}'.
+
+    Args:
+        folder_path (str): Calculation folder.
+
+    Returns:
+        dict: Functional, correction, scaling factor and lattice parameters, or None if not finished.
+    """
+
+    aux = os.path.basename(folder_path).split('+')
+    if len(aux) > 1:
+        functional = aux[0]
+        correction = aux[1]
+    else:
+        functional = aux[0]
+        correction = 'None'
+
+    try:
+        scale, lattice = read_contcar_lattice(f'{folder_path}/CONTCAR')
+    except ValueError:
+        return None
+
+    a, b, c = np.diag(lattice)
+    return {'functional': functional, 'correction': correction, 'scale': scale, 'a': a, 'b': b, 'c': c}
+
+
+def _summarize_gamma_point(folder_path):
+    """Phonon frequencies at the Gamma point.
+
+    Args:
+        folder_path (str): Calculation folder.
+
+    Returns:
+        dict: Minimum real frequency and imaginary frequencies (meV), or None if not finished.
+    """
+
+    real_frequencies, imaginary_frequencies = read_outcar_phonons(f'{folder_path}/OUTCAR')
+    if not (len(real_frequencies) + len(imaginary_frequencies)):
+        return None
+
+    return {
+        'minimum_frequency':     np.min(real_frequencies) if len(real_frequencies) else np.nan,
+        'n_imaginary':           len(imaginary_frequencies),
+        'imaginary_frequencies': imaginary_frequencies.tolist()
+    }
+
+
+def _summarize_phonon_spectra(folder_path):
+    """Elapsed time of a calculation with a given NCORE.
+
+    Args:
+        folder_path (str): Calculation folder.
+
+    Returns:
+        dict: NCORE and elapsed time (s), or None if not finished.
+    """
+
+    elapsed_time = read_outcar_elapsed_time(f'{folder_path}/OUTCAR')
+    if elapsed_time is None:
+        return None
+    return {'NCORE': int(os.path.basename(folder_path)), 'elapsed_time': elapsed_time}
+
+
+def _summarize_band_gap(folder_path):
+    """Band gap of a calculation, from its density of states.
+
+    Args:
+        folder_path (str): Calculation folder.
+
+    Returns:
+        dict: Band gap, valence band maximum and conduction band minimum (eV).
+    """
+
+    dos = read_doscar(f'{folder_path}/DOSCAR')
+
+    band_gap, valence_band, conduction_band = get_band_gap(dos['energies'], dos['integrated_dos'], dos['fermi_energy'])
+    return {'band_gap': band_gap, 'valence_band': valence_band, 'conduction_band': conduction_band}
+
+
+def _summarize_energy(folder_path):
+    """Final energy (E0) of a calculation.
+
+    Args:
+        folder_path (str): Calculation folder.
+
+    Returns:
+        dict: Energy (eV), or None if not finished.
+    """
+
+    energies = read_oszicar_energies(f'{folder_path}/OSZICAR', n_lines=2)
+    if energies is None:
+        return None
+    return {'energy': energies['E0']}
+
+
+def get_absorption_coefficient(energies, real, imag):
+    """Computes the absorption coefficient from the dielectric function, as
+    alpha = sqrt(2) E / (hbar c) sqrt(|epsilon| - epsilon_1), for each component.
+
+    Args:
+        energies (ndarray): Energies (eV).
+        real     (ndarray): Real part of the dielectric function, of shape (n_energies, n_components).
+        imag     (ndarray): Imaginary part of the dielectric function, of shape (n_energies, n_components).
+
+    Returns:
+        ndarray: Absorption coefficient (cm^-1), of shape (n_energies, n_components).
+    """
+
+    modulus = np.hypot(real, imag)
+    return np.sqrt(2) * np.asarray(energies)[:, np.newaxis] / hbar_c * np.sqrt(np.maximum(modulus - real, 0))
+
+
+def _summarize_absorption_spectra(folder_path):
+    """Absorption coefficient at the limit of the visible range, averaged over the three directions.
+    The dielectric function is read from the vasprun.xml, or from the OUTCAR if there is no vasprun.xml.
+
+    Args:
+        folder_path (str): Calculation folder.
+
+    Returns:
+        dict: Absorption coefficient (cm^-1).
+    """
+
+    try:
+        energies, real, imag = read_vasprun_dielectric(f'{folder_path}/vasprun.xml')
+    except (FileNotFoundError, ElementTree.ParseError):  # Missing or unfinished
+        energies, real, imag = read_outcar_dielectric(f'{folder_path}/OUTCAR')
+
+    absorption = get_absorption_coefficient(energies, real, imag)
+
+    visible_index = np.where(energies >= visible_eV)[0][0]
+    return {'absorption': np.mean(absorption[visible_index, :3])}
+
+
+# Folders of each type of calculation, how one of them is summarized into a record and the output file it reads
+calculation_types = {
+    'convergence':        (_list_subfolders,    _summarize_convergence,        'OSZICAR'),
+    'relaxation':         (_list_subfolders,    _summarize_relaxation,         'CONTCAR'),
+    'gamma_point':        (_list_flag_folder,   _summarize_gamma_point,        'OUTCAR'),
+    'phonon_spectra':     (_list_ncore_folders, _summarize_phonon_spectra,     'OUTCAR'),
+    'band_gap':           (_list_flag_folder,   _summarize_band_gap,           'DOSCAR'),
+    'energy':             (_list_energy_folder, _summarize_energy,             'OSZICAR'),
+    'consistent_energy':  (_list_energy_folder, _summarize_energy,             'OSZICAR'),
+    'absorption_spectra': (_list_flag_folder,   _summarize_absorption_spectra, 'vasprun.xml')
+}
+
+
+def get_calculation_folders(dir_path, calculation, flag):
+    """Folders of the calculations of a type within a directory.
+
+    Args:
+        dir_path    (str): Directory of the type of calculation (e.g. '../BiSI/convergence').
+        calculation (str): Type of calculation (see calculation_types).
+        flag        (str): Functional and correction (e.g. 'PS+D3').
+
+    Returns:
+        list: Paths of the calculation folders (empty if the directory does not exist).
+    """
+
+    if calculation not in calculation_types:
+        raise ValueError(f'Calculation type not defined: {calculation}.')
+
+    list_folders, _, _ = calculation_types[calculation]
+    try:
+        return list_folders(dir_path, flag)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def summarize_folder(folder_path, calculation, index=None):
+    """Summarizes one calculation folder.
+
+    Args:
+        folder_path (str):          Calculation folder.
+        calculation (str):          Type of calculation (see calculation_types).
+        index       (SummaryIndex): Index of the records already parsed (none are reused if None).
+
+    Returns:
+        dict: Folder, status ('finished', 'not-converged' or 'missing') and summarized values.
+    """
+
+    _, summarize, output_file = calculation_types[calculation]
+
+    # Reusing the record if the output file has not changed since it was parsed
+
+    output_path = os.path.abspath(os.path.join(folder_path, output_file))
+    stamp       = get_file_stamp(output_path) if index is not None else None
+    if stamp is not None:
+        record = index.load(output_path, calculation, stamp)
+        if record is not None:
+            return record
+
+    # Parsing the output
+
+    record = {'folder': os.path.basename(folder_path)}
+    try:
+        values = summarize(folder_path)
+    except (FileNotFoundError, NotADirectoryError):
+        record['status'] = 'missing'
+        return record
+    except (IndexError, ValueError):  # Incomplete output, or folder not named as expected
+        values = None
+
+    if values is None:
+        record['status'] = 'not-converged'
+    else:
+        record['status'] = 'finished'
+        record.update(values)
+
+    if stamp is not None:
+        index.save(output_path, calculation, stamp, record)
+    return record
+
+
+def summarize_calculations(dir_path, calculation, flag, index=None):
+    """Summarizes all the calculations of a type within a directory.
+
+    Args:
+        dir_path    (str):          Directory of the type of calculation (e.g. '../BiSI/convergence').
+        calculation (str):          Type of calculation (see calculation_types).
+        flag        (str):          Functional and correction (e.g. 'PS+D3').
+        index       (SummaryIndex): Index of the records already parsed (none are reused if None).
+
+    Returns:
+        list: Records of the calculation folders.
+    """
+
+    records = [summarize_folder(folder_path, calculation, index=index)
+               for folder_path in get_calculation_folders(dir_path, calculation, flag)]
+
+    if index is not None:
+        index.commit()
+    return records
+
+
+def summarize_campaign(systems, calculations, flag, root='..', n_jobs=None, index=None):
+    """Summarizes the calculations of many systems at once, reading the folders with a pool of threads,
+    as summarizing is bound by the reading of the (possibly networked) filesystem.
+
+    Args:
+        systems      (list):         Names or glob patterns of the systems, relative to root (e.g. ['Bi*', 'Sb*']).
+        calculations (list):         Types of calculation (see calculation_types).
+        flag         (str):          Functional and correction (e.g. 'PS+D3').
+        root         (str):          Directory containing the folders of the systems.
+        n_jobs       (int):          Number of threads (default of ThreadPoolExecutor if None).
+        index        (SummaryIndex): Index of the records already parsed (none are reused if None).
+
+    Returns:
+        DataFrame: One row per calculation folder, with the system, type of calculation, folder, status and values.
+            Systems without the directory of a type of calculation get one 'missing' row.
+    """
+
+    system_paths = sorted({system_path for pattern in systems
+                           for system_path in glob(os.path.join(root, pattern)) if os.path.isdir(system_path)})
+    directories  = [(system_path, calculation) for system_path in system_paths for calculation in calculations]
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        # Listing the folders of each system and type of calculation
+
+        folder_lists = list(executor.map(lambda directory: get_calculation_folders(os.path.join(*directory),
+                                                                                   directory[1], flag), directories))
+
+        # Summarizing all the folders at once
+
+        tasks     = [(folder_path, calculation) for (_, calculation), folder_paths in zip(directories, folder_lists)
+                     for folder_path in folder_paths]
+        summaries = iter(executor.map(lambda task: summarize_folder(*task, index=index), tasks))
+
+    # Gathering the records in the order of the systems and types of calculation
+
+    records = []
+    for (system_path, calculation), folder_paths in zip(directories, folder_lists):
+        header = {'system': os.path.basename(system_path), 'calculation': calculation}
+        if not len(folder_paths):
+            records.append({**header, 'folder': None, 'status': 'missing'})
+        for _ in folder_paths:
+            records.append({**header, **next(summaries)})
+
+    if index is not None:
+        index.commit()
+
+    if not len(records):
+        return pd.DataFrame(columns=['system', 'calculation', 'folder', 'status'])
+    return pd.DataFrame(records)
+
+
+def write_table(table, file_name):
+    """Writes a summary table, with the format given by the extension of the file (.csv, .json or .parquet).
+
+    Args:
+        table     (DataFrame): Summary of the calculations.
+        file_name (str):       Path of the output file.
+    """
+
+    extension = os.path.splitext(file_name)[1].lower()
+    if extension == '.csv':
+        table.to_csv(file_name, index=False)
+    elif extension == '.json':
+        table.to_json(file_name, orient='records', indent=1)
+    elif extension == '.parquet':
+        table.to_parquet(file_name, index=False)
+    else:
+        raise ValueError(f'Format of the table not defined: {extension}.')
+
+
+def print_records(records, calculation, element):
+    """Prints the summary of the calculations of a system, as text.
+
+    Args:
+        records     (list): Records of the calculation folders (from summarize_calculations).
+        calculation (str):  Type of calculation (see calculation_types).
+        element     (str):  Name of the system.
+    """
+
+    for record in records:
+        folder = record['folder']
+        if record['status'] == 'missing':
+            if calculation in ('convergence', 'relaxation'):
+                continue
+            print(f'### Caution, simulation not finished at {folder}')
+        elif record['status'] == 'not-converged':
+            print(f'### Caution, simulation not finished at {folder}')
+
+        elif calculation == 'convergence':
+            print(record['E_cutoff'], record['KPoints'], record['energy'])
+
+        elif calculation == 'relaxation':
+            print(record['functional'], record['correction'], record['scale'], record['a'], record['b'], record['c'])
+
+        elif calculation == 'gamma_point':
+            for frequency in record['imaginary_frequencies']:
+                print(f'Imaginary phonon frequency at {frequency} meV')
+            print(f'Minimum phonon frequency at {record["minimum_frequency"]} meV')
+
+        elif calculation == 'phonon_spectra':
+            print(f'NCORE = {record["NCORE"]} -> Elapsed time = {record["elapsed_time"]}')
+
+        elif calculation == 'band_gap':
+            print(f'Band gap: {record["band_gap"]}, Valence band: {record["valence_band"]}')
+
+        elif calculation in ('energy', 'consistent_energy'):
+            print(f'{element} {record["energy"]}')
+
+        elif calculation == 'absorption_spectra':
+            print(f'Absorption: {record["absorption"]}')
@@ -0,0 +1,112 @@
+import sqlite3
+import threading
+import json
+import os
+
+
+def get_file_stamp(file_name):
+    """Modification time and size of a file, which change whenever the file is rewritten or extended.
+
+    Args:
+        file_name (str): Path of the file.
+
+    Returns:
+        tuple: Modification time (ns) and size (bytes), or None if the file does not exist.
+    """
+
+    try:
+        stat = os.stat(file_name)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _to_builtin(item):
+    """Converts NumPy scalars into Python objects, for JSON.
+
+    Args:
+        item (object): NumPy scalar.
+
+    Returns:
+        object: Equivalent Python object.
+    """
+
+    return item.item()
+
+
+class SummaryIndex:
+    """Persistent index (SQLite database) of the records parsed from the output files of the calculations.
+    A record is reused as long as the modification time and size of its output file do not change,
+    so that only new or modified calculations are parsed again.
+    """
+
+    def __init__(self, file_name):
+        """Opens the index, creating it if needed.
+
+        Args:
+            file_name (str): Path of the database.
+        """
+
+        self.file_name  = file_name
+        self.connection = sqlite3.connect(file_name, check_same_thread=False)
+        self._lock      = threading.Lock()  # The connection is shared among the threads of the summaries
+
+        with self._lock:
+            self.connection.execute('CREATE TABLE IF NOT EXISTS records ('
+                                    'path TEXT, calculation TEXT, mtime_ns INTEGER, size INTEGER, record TEXT, '
+                                    'PRIMARY KEY (path, calculation))')
+            self.connection.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
+
+    def load(self, path, calculation, stamp):
+        """Loads the record of an output file, if it has not changed since it was parsed.
+
+        Args:
+            path        (str):   Path of the output file.
+            calculation (str):   Type of calculation.
+            stamp       (tuple): Current modification time and size of the file (from get_file_stamp).
+
+        Returns:
+            dict: Record of the calculation, or None if it is not indexed or out of date.
+        """
+
+        with self._lock:
+            row = self.connection.execute('SELECT mtime_ns, size, record FROM records WHERE path = ? AND calculation = ?',
+                                          (path, calculation)).fetchone()
+
+        if (row is None) or (tuple(row[:2]) != tuple(stamp)):
+            return None
+        return json.loads(row[2])
+
+    def save(self, path, calculation, stamp, record):
+        """Indexes the record of an output file (committed with commit).
+
+        Args:
+            path        (str):   Path of the output file.
+            calculation (str):   Type of calculation.
+            stamp       (tuple): Modification time and size of the file when it was parsed.
+            record      (dict):  Record of the calculation.
+        """
+
+        with self._lock:
+            self.connection.execute('INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)',
+                                    (path, calculation, *stamp, json.dumps(record, default=_to_builtin)))
+
+    def commit(self):
+        """Writes the indexed records to disk.
+        """
+
+        with self._lock:
+            self.connection.commit()
+
+    def close(self):
+        """Commits the indexed records and closes the database.
+        """
+
+        self.commit()
+        self.connection.close()
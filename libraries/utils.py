@@ -1,14 +1,26 @@
 import numpy             as np
 import matplotlib.pyplot as plt
 import multiprocessing   as mp
+import sklearn
 import re
 
+from itertools               import combinations
+from functools               import lru_cache
 from sklearn.model_selection import learning_curve
 from sklearn.preprocessing   import StandardScaler
+from libraries.cache         import ResultCache
 
 linewidth    = 0.5
 footnotesize = 8
 
+# Components of chemical formulas (see composition_concentration and parse_formula)
+_component_pattern = re.compile(r'[A-Z][^A-Z]*')
+_digits_pattern    = re.compile(r'(\d+)')
+_formula_pattern   = re.compile(r'([A-Z][a-z]*)\s*(\d+\.?\d*|\.\d+)?')
+
+# Absolute tolerance for the geometrical tests in the composition plane
+geometric_tolerance = 1e-10
+
 
 def xy_scaler(X_train, X_test, y_train):
     """Scales the data as z = (x - u) / s. The scalers are fitted with the train sets.
@@ -73,15 +85,62 @@ def composition_concentration(structure):
     composition   = []
     concentration = []
 
-    components = re.findall('[A-Z][^A-Z]*', structure)
+    components = _component_pattern.findall(structure)
     for component in components:
-        aux = re.split('(\d+)', component)
+        aux = _digits_pattern.split(component)
         composition.append(aux[0])
         if len(aux) > 1: concentration.append(aux[1])
         else:            concentration.append('1')
     return [' '.join(composition), ' '.join(concentration)]
 
 
+@lru_cache(maxsize=4096)
+def parse_formula(formula):
+    """Parses a chemical formula into its elements and their (possibly fractional) amounts, as in 'Bi0.5Sb0.5SI'.
+    Repeated elements are added up. Results are memoized, so repeated formulas are parsed once.
+
+    Args:
+        formula (str): Chemical formula (element symbols must start with a capital letter).
+
+    Returns:
+        tuple: Elements (tuple of str, in order of appearance) and their amounts (read-only float array).
+    """
+
+    element_amounts = {}
+    for element, amount in _formula_pattern.findall(formula):
+        element_amounts[element] = element_amounts.get(element, 0) + (float(amount) if amount else 1)
+
+    amounts = np.array(list(element_amounts.values()), dtype=float)
+    amounts.flags.writeable = False
+    return tuple(element_amounts), amounts
+
+
+def get_composition_matrix(formulas, elements=None):
+    """Converts a list of chemical formulas into a dense matrix with the amount of each element in each formula.
+
+    Args:
+        formulas (list): Chemical formulas.
+        elements (list): Order of the elements (columns); their order of appearance if None.
+
+    Returns:
+        tuple: Elements (list) and composition matrix of shape (n_formulas, n_elements).
+    """
+
+    parsed_formulas = [parse_formula(formula) for formula in formulas]
+    if elements is None:
+        elements = list(dict.fromkeys(element for formula_elements, _ in parsed_formulas for element in formula_elements))
+    element_indexes = {element: index for index, element in enumerate(elements)}
+
+    composition_matrix = np.zeros((len(parsed_formulas), len(elements)))
+    for row, (formula_elements, amounts) in enumerate(parsed_formulas):
+        try:
+            columns = [element_indexes[element] for element in formula_elements]
+        except KeyError as error:
+            raise ValueError(f'Element {error.args[0]} of {formulas[row]} not in {list(elements)}.')
+        composition_matrix[row, columns] = amounts
+    return list(elements), composition_matrix
+
+
 def sign(coord_1, coord_2, coord_3):
     """Determines the orientation of three points (coord_1, coord_2, coord_3).
 
@@ -97,6 +156,233 @@ def sign(coord_1, coord_2, coord_3):
     return (coord_1[0] - coord_3[0]) * (coord_2[1] - coord_3[1]) - (coord_2[0] - coord_3[0]) * (coord_1[1] - coord_3[1])
 
 
+def get_ab(pure_elements, composition, concentration):
+    """Places a compound in the plane of the pure elements, as the concentration-weighted average of their positions.
+
+    Args:
+        pure_elements (dict):  Positions [a, b] of the pure elements in the plane.
+        composition   (str):   Space-separated components of the formula (see composition_concentration).
+        concentration (str):   Space-separated concentrations of those components.
+
+    Returns:
+        tuple: Coordinates (a, b) of the compound.
+    """
+
+    composition   = composition.split()
+    concentration = np.array(concentration.split(), dtype=float)
+
+    positions = np.array([pure_elements[element] for element in composition], dtype=float)
+    a, b = concentration @ positions / np.sum(concentration)
+    return a, b
+
+
+def _get_vertices(elements, coordinates, element_i, element_j, element_k):
+    """Extracts the coordinates of the vertices of a triangle, given the names of its elements.
+
+    Args:
+        elements    (ndarray):    Names of all the elements.
+        coordinates (array-like): Coordinates of all the elements.
+        element_i   (str):        Name of the first vertex.
+        element_j   (str):        Name of the second vertex.
+        element_k   (str):        Name of the third vertex.
+
+    Returns:
+        tuple: Indexes of the vertices and an array of shape (1, 3, 2) with their coordinates.
+    """
+
+    coordinates = np.asarray(coordinates, dtype=float)
+
+    indexes = [np.where(elements == element)[0][0] for element in (element_i, element_j, element_k)]
+    return indexes, coordinates[indexes].reshape(1, 3, 2)
+
+
+def _in_triangles(points, vertices):
+    """Determines which points lie inside (or at the border of) which triangles.
+    Degenerate triangles (collinear vertices) are treated as segments.
+
+    Args:
+        points   (ndarray): Points to be tested, of shape (n_points, 2).
+        vertices (ndarray): Vertices of the triangles, of shape (n_triangles, 3, 2).
+
+    Returns:
+        ndarray: Boolean mask of shape (n_points, n_triangles).
+    """
+
+    r_i = (vertices[:, 0, 0], vertices[:, 0, 1])
+    r_j = (vertices[:, 1, 0], vertices[:, 1, 1])
+    r_k = (vertices[:, 2, 0], vertices[:, 2, 1])
+    r   = (points[:, 0, np.newaxis], points[:, 1, np.newaxis])
+
+    # Orientation of the point with respect to each edge
+
+    d_1 = sign(r, r_i, r_j)
+    d_2 = sign(r, r_j, r_k)
+    d_3 = sign(r, r_k, r_i)
+
+    has_neg = (d_1 < -geometric_tolerance) | (d_2 < -geometric_tolerance) | (d_3 < -geometric_tolerance)
+    has_pos = (d_1 >  geometric_tolerance) | (d_2 >  geometric_tolerance) | (d_3 >  geometric_tolerance)
+    inside  = ~(has_neg & has_pos)
+
+    # Collinear vertices: the point must lie on the line and within the segment
+
+    degenerate = np.abs(sign(r_i, r_j, r_k)) <= geometric_tolerance
+    if np.any(degenerate):
+        lower = np.min(vertices[degenerate], axis=1) - geometric_tolerance
+        upper = np.max(vertices[degenerate], axis=1) + geometric_tolerance
+
+        in_box = np.all((points[:, np.newaxis] >= lower) & (points[:, np.newaxis] <= upper), axis=2)
+        inside[:, degenerate] = in_box & ~has_neg[:, degenerate] & ~has_pos[:, degenerate]
+    return inside
+
+
+def _expected_energies(points, vertices, vertex_energies):
+    """Interpolates the energies of the vertices of each triangle at each point.
+    Regular triangles are interpolated with the plane through their vertices, while degenerate ones
+    (collinear vertices) are interpolated linearly between the two vertices enclosing the point.
+
+    Args:
+        points          (ndarray): Points to be evaluated, of shape (n_points, 2).
+        vertices        (ndarray): Vertices of the triangles, of shape (n_triangles, 3, 2).
+        vertex_energies (ndarray): Energies of the vertices, of shape (n_triangles, 3).
+
+    Returns:
+        ndarray: Expected energies of shape (n_points, n_triangles).
+    """
+
+    r_i = (vertices[:, 0, 0], vertices[:, 0, 1])
+    r_j = (vertices[:, 1, 0], vertices[:, 1, 1])
+    r_k = (vertices[:, 2, 0], vertices[:, 2, 1])
+
+    degenerate = np.abs(sign(r_i, r_j, r_k)) <= geometric_tolerance
+    energies   = np.empty((len(points), len(vertices)))
+
+    # Plane E = c_0 a + c_1 b + c_2 through the three vertices
+
+    regular = ~degenerate
+    if np.any(regular):
+        matrices = np.concatenate([vertices[regular], np.ones((np.sum(regular), 3, 1))], axis=2)
+        planes   = np.linalg.solve(matrices, vertex_energies[regular, :, np.newaxis])[:, :, 0]
+
+        energies[:, regular] = points[:, 0, np.newaxis] * planes[:, 0] + points[:, 1, np.newaxis] * planes[:, 1] + planes[:, 2]
+
+    # Segment: position along the dominant axis, and closest vertices at each side
+
+    if np.any(degenerate):
+        segments = vertices[degenerate]
+        extent   = np.ptp(segments, axis=1)
+        axis     = (extent[:, 1] > extent[:, 0]).astype(int)
+
+        t_vertices = np.take_along_axis(segments, axis[:, np.newaxis, np.newaxis], axis=2)[:, :, 0]
+        t_points   = points[:, axis]
+
+        below = t_vertices <= t_points[:, :, np.newaxis] + geometric_tolerance
+        above = t_vertices >= t_points[:, :, np.newaxis] - geometric_tolerance
+
+        idx_lo = np.argmax(np.where(below, t_vertices, -np.inf), axis=2)
+        idx_hi = np.argmin(np.where(above, t_vertices,  np.inf), axis=2)
+
+        n_segments = np.arange(len(segments))
+        r_lo = segments[n_segments, idx_lo]
+        r_hi = segments[n_segments, idx_hi]
+        E_lo = vertex_energies[degenerate][n_segments, idx_lo]
+        E_hi = vertex_energies[degenerate][n_segments, idx_hi]
+
+        d_lo  = np.linalg.norm(points[:, np.newaxis] - r_lo, axis=2)
+        d_hi  = np.linalg.norm(points[:, np.newaxis] - r_hi, axis=2)
+        d_sum = d_lo + d_hi
+
+        ratio = np.divide(d_lo, d_sum, out=np.zeros_like(d_sum), where=d_sum > 0)
+        energies[:, degenerate] = E_lo + (E_hi - E_lo) * ratio
+    return energies
+
+
+def is_in_triangle(elements, coordinates, element_i, element_j, element_k, test_r):
+    """Determines whether a point is inside (or at the border of) the triangle formed by three elements.
+    If the elements are collinear, the point must lie on the segment they define.
+
+    Args:
+        elements    (ndarray):    Names of all the elements.
+        coordinates (array-like): Coordinates of all the elements.
+        element_i   (str):        Name of the first vertex.
+        element_j   (str):        Name of the second vertex.
+        element_k   (str):        Name of the third vertex.
+        test_r      (list):       Coordinates of the point.
+
+    Returns:
+        bool: Whether the point is inside the triangle.
+    """
+
+    _, vertices = _get_vertices(elements, coordinates, element_i, element_j, element_k)
+    return bool(_in_triangles(np.array([test_r], dtype=float), vertices)[0, 0])
+
+
+def get_expected_energy(energies, elements, coordinates, element_i, element_j, element_k, test_r):
+    """Computes the formation energy expected at a point from the linear interpolation of the
+    formation energies of three elements.
+
+    Args:
+        energies    (DataFrame):  Formation energies, with a 'formation_energy' column indexed by element.
+        elements    (ndarray):    Names of all the elements.
+        coordinates (array-like): Coordinates of all the elements.
+        element_i   (str):        Name of the first vertex.
+        element_j   (str):        Name of the second vertex.
+        element_k   (str):        Name of the third vertex.
+        test_r      (list):       Coordinates of the point.
+
+    Returns:
+        float: Expected formation energy at the point.
+    """
+
+    _, vertices = _get_vertices(elements, coordinates, element_i, element_j, element_k)
+
+    vertex_energies = np.array([[energies.loc[element].formation_energy for element in (element_i, element_j, element_k)]], dtype=float)
+    return float(_expected_energies(np.array([test_r], dtype=float), vertices, vertex_energies)[0, 0])
+
+
+def get_convex_hull_energies(grid, coordinates, formation_energies, max_memory=2**27):
+    """Computes the lower-envelope formation energy at every point of a grid, i.e. the minimum
+    expected energy over all the triangles of phases containing each point. All triangles are
+    evaluated at once, and the grid is processed in chunks so that memory stays bounded.
+
+    Args:
+        grid               (array-like): Points to be evaluated, of shape (n_points, 2).
+        coordinates        (array-like): Coordinates of the phases, of shape (n_phases, 2).
+        formation_energies (array-like): Formation energies of the phases, of shape (n_phases,).
+        max_memory         (int):        Approximate memory (in bytes) used for each chunk.
+
+    Returns:
+        ndarray: Formation energy at each point (NaN for those outside every triangle).
+    """
+
+    grid               = np.asarray(grid, dtype=float).reshape(-1, 2)
+    coordinates        = np.asarray(coordinates, dtype=float)
+    formation_energies = np.asarray(formation_energies, dtype=float)
+
+    hull_energies = np.full(len(grid), np.nan)
+
+    # Every possible triangle without repetition
+
+    triangles = np.array(list(combinations(range(len(coordinates)), 3)), dtype=int)
+    if not len(triangles):
+        return hull_energies
+
+    vertices        = coordinates[triangles]
+    vertex_energies = formation_energies[triangles]
+
+    # About ten (n_points, n_triangles) arrays of float64 are alive at the same time
+
+    chunk_size = max(1, int(max_memory // (80 * len(triangles))))
+    for start in range(0, len(grid), chunk_size):
+        points = grid[start:start+chunk_size]
+
+        inside   = _in_triangles(points, vertices)
+        energies = np.where(inside, _expected_energies(points, vertices, vertex_energies), np.inf)
+
+        minimum = np.min(energies, axis=1)
+        hull_energies[start:start+chunk_size] = np.where(np.isfinite(minimum), minimum, np.nan)
+    return hull_energies
+
+
 class Limits:
     """Class to update and access the limits of each variable.
     """
@@ -109,72 +395,58 @@ class Limits:
         self.lower = None
 
 
-def plot_learning_curve(estimator, figure_name, X, y, axes=None, ylim=None, cv=None,
-                        n_jobs=mp.cpu_count(), dpi=400, scoring=None,
-                        train_sizes=np.linspace(0.1, 1.0, 5),):
-    """
-    Generate 3 plots: the test and training learning curve, the training
-    samples vs fit times curve, the fit times vs score curve.
+def within_limits(values, limits):
+    """Determines which values lie within the limits of a variable (both included).
 
-    Parameters
-    ----------
-    estimator : estimator instance
-        An estimator instance implementing `fit` and `predict` methods which
-        will be cloned for each validation.
+    Args:
+        values (ndarray): Values of the variable.
+        limits (Limits):  Limits of the variable (None for no limit).
 
-    title : str
-        Title for the chart.
+    Returns:
+        ndarray: Boolean mask of the valid values.
+    """
 
-    X : array-like of shape (n_samples, n_features)
-        Training vector, where ``n_samples`` is the number of samples and
-        ``n_features`` is the number of features.
+    values = np.asarray(values)
 
-    y : array-like of shape (n_samples) or (n_samples, n_features)
-        Target relative to ``X`` for classification or regression;
-        None for unsupervised learning.
+    mask = np.ones(values.shape, dtype=bool)
+    if limits.upper is not None:
+        mask &= values <= limits.upper
+    if limits.lower is not None:
+        mask &= values >= limits.lower
+    return mask
 
-    axes : array-like of shape (3,), default=None
-        Axes to use for plotting the curves.
 
-    ylim : tuple of shape (2,), default=None
-        Defines minimum and maximum y-values plotted, e.g. (ymin, ymax).
+def _get_cv_inputs(cv):
+    """Lists the splits of a cross-validation strategy given as an iterable (e.g. a generator), which can only be
+    consumed once and cannot be hashed otherwise.
 
-    cv : int, cross-validation generator or an iterable, default=None
-        Determines the cross-validation splitting strategy.
-        Possible inputs for cv are:
+    Args:
+        cv (object): None, number of folds, splitter or iterable of splits.
 
-          - None, to use the default 5-fold cross-validation,
-          - integer, to specify the number of folds.
-          - :term:`CV splitter`,
-          - An iterable yielding (train, test) splits as arrays of indices.
+    Returns:
+        object: The same strategy, with iterables of splits converted into lists.
+    """
 
-        For integer/None inputs, if ``y`` is binary or multiclass,
-        :class:`StratifiedKFold` used. If the estimator is not a classifier
-        or if ``y`` is neither binary nor multiclass, :class:`KFold` is used.
+    if (cv is None) or isinstance(cv, (int, np.integer)) or hasattr(cv, 'split'):
+        return cv
+    return [(np.asarray(train_index), np.asarray(test_index)) for train_index, test_index in cv]
 
-        Refer :ref:`User Guide <cross_validation>` for the various
-        cross-validators that can be used here.
 
-    n_jobs : int or None, default=None
-        Number of jobs to run in parallel.
-        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
-        ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
-        for more details.
+def _run_learning_curve(estimator, X, y, cv, n_jobs, scoring, train_sizes, incremental):
+    """Runs sklearn's learning_curve, returning its arrays by name.
 
-    scoring : str or callable, default=None
-        A str (see model evaluation documentation) or
-        a scorer callable object / function with signature
-        ``scorer(estimator, X, y)``.
+    Args:
+        estimator   (object):  Estimator implementing fit and predict.
+        X           (ndarray): Input samples.
+        y           (ndarray): Target values.
+        cv          (object):  Cross-validation strategy.
+        n_jobs      (int):     Number of jobs.
+        scoring     (str):     Scoring of the predictions.
+        train_sizes (ndarray): Relative or absolute sizes of the training sets.
+        incremental (bool):    Whether to train incrementally with partial_fit.
 
-    train_sizes : array-like of shape (n_ticks,)
-        Relative or absolute numbers of training examples that will be used to
-        generate the learning curve. If the ``dtype`` is float, it is regarded
-        as a fraction of the maximum size of the training set (that is
-        determined by the selected validation method), i.e. it has to be within
-        (0, 1]. Otherwise it is interpreted as absolute sizes of the training
-        sets. Note that for classification the number of samples usually have
-        to be big enough to contain at least one sample from each class.
-        (default: np.linspace(0.1, 1.0, 5))
+    Returns:
+        dict: Train sizes, train and test scores and fit times.
     """
 
     train_sizes, train_scores, test_scores, fit_times, _ = learning_curve(
@@ -185,8 +457,80 @@ def plot_learning_curve(estimator, figure_name, X, y, axes=None, ylim=None, cv=N
         cv=cv,
         n_jobs=n_jobs,
         train_sizes=train_sizes,
+        exploit_incremental_learning=incremental,
         return_times=True,
     )
+    return {
+        'train_sizes':  train_sizes,
+        'train_scores': train_scores,
+        'test_scores':  test_scores,
+        'fit_times':    fit_times
+    }
+
+
+def compute_learning_curve(estimator, X, y, cv=None, n_jobs=None, scoring=None,
+                           train_sizes=np.linspace(0.1, 1.0, 5), incremental=False, cache_directory=None):
+    """Computes the learning curve of an estimator (scores and fit times for increasing training sets), without
+    plotting it. Results are cached by the hyperparameters of the estimator, the data and the options, so that
+    figures can be drawn again without refitting. Estimators implementing partial_fit can be trained incrementally
+    from one train size to the next, but sklearn calls partial_fit once per train size (a single epoch for
+    MLPRegressor), so this is only meaningful for estimators that converge in one pass.
+
+    Args:
+        estimator       (object):     Estimator implementing fit and predict.
+        X               (array-like): Input samples.
+        y               (array-like): Target values.
+        cv              (object):     Cross-validation strategy (see sklearn's learning_curve).
+        n_jobs          (int):        Number of jobs (all the cores available when called if None).
+        scoring         (str):        Scoring of the predictions (see sklearn's learning_curve).
+        train_sizes     (array-like): Relative or absolute sizes of the training sets.
+        incremental     (bool):       Whether to train incrementally with partial_fit, instead of refitting.
+        cache_directory (str):        Folder of cached learning curves (no caching if None).
+
+    Returns:
+        dict: Train sizes, and train scores, test scores and fit times of shape (n_sizes, n_splits).
+    """
+
+    X  = np.asarray(X, dtype=float)
+    y  = np.asarray(y, dtype=float)
+    cv = _get_cv_inputs(cv)
+
+    n_jobs      = mp.cpu_count() if n_jobs is None else n_jobs
+    train_sizes = np.asarray(train_sizes)
+
+    arguments = (estimator, X, y, cv, n_jobs, scoring, train_sizes, incremental)
+    if cache_directory is None:
+        return _run_learning_curve(*arguments)
+
+    inputs = {
+        'estimator':   estimator,
+        'X':           X,
+        'y':           y,
+        'cv':          cv,
+        'scoring':     scoring,
+        'train_sizes': train_sizes,
+        'incremental': incremental,
+        'version':     sklearn.__version__
+    }
+    return ResultCache(cache_directory).get_or_compute(_run_learning_curve, inputs, *arguments)
+
+
+def plot_learning_curve_results(curve, figure_name, ylim=None, dpi=400):
+    """Draws the learning curve (saved as figure_name), the fit times against the training samples
+    and the scores against the fit times.
+
+    Args:
+        curve       (dict):  Result of compute_learning_curve.
+        figure_name (str):   Path of the figure of the learning curve.
+        ylim        (tuple): Minimum and maximum y-values of the learning curve.
+        dpi         (int):   Resolution of the figure.
+    """
+
+    train_sizes  = curve['train_sizes']
+    train_scores = curve['train_scores']
+    test_scores  = curve['test_scores']
+    fit_times    = curve['fit_times']
+
     train_scores_mean = np.mean(train_scores, axis=1)
     train_scores_std = np.std(train_scores,   axis=1)
     test_scores_mean = np.mean(test_scores,   axis=1)
@@ -222,7 +566,7 @@ def plot_learning_curve(estimator, figure_name, X, y, axes=None, ylim=None, cv=N
         train_sizes, test_scores_mean, 'o-', color='g', label='Cross-validation score'
     )
     plt.xlabel('Training examples', fontsize=footnotesize)
-    plt.ylabel('Loss ($\mu\mathregular{m^{-1}}$)',              fontsize=footnotesize)
+    plt.ylabel(r'Loss ($\mu\mathregular{m^{-1}}$)',              fontsize=footnotesize)
     plt.tick_params(axis='x', labelsize=footnotesize)
     plt.tick_params(axis='y', labelsize=footnotesize)
     plt.legend(loc='best', fontsize=footnotesize)
@@ -270,4 +614,82 @@ def plot_learning_curve(estimator, figure_name, X, y, axes=None, ylim=None, cv=N
     #plt.legend(loc='best', fontsize=footnotesize)
     #plt.savefig(figure_name, dpi=dpi, bbox_inches='tight')
     plt.show()
-    return train_sizes, train_scores, test_scores
\ No newline at end of file
+
+
+def plot_learning_curve(estimator, figure_name, X, y, axes=None, ylim=None, cv=None,
+                        n_jobs=None, dpi=400, scoring=None,
+                        train_sizes=np.linspace(0.1, 1.0, 5), cache_directory=None):
+    """
+    Generate 3 plots: the test and training learning curve, the training
+    samples vs fit times curve, the fit times vs score curve.
+    The curves are computed with compute_learning_curve and drawn with
+    plot_learning_curve_results.
+
+    Parameters
+    ----------
+    estimator : estimator instance
+        An estimator instance implementing `fit` and `predict` methods which
+        will be cloned for each validation.
+
+    title : str
+        Title for the chart.
+
+    X : array-like of shape (n_samples, n_features)
+        Training vector, where ``n_samples`` is the number of samples and
+        ``n_features`` is the number of features.
+
+    y : array-like of shape (n_samples) or (n_samples, n_features)
+        Target relative to ``X`` for classification or regression;
+        None for unsupervised learning.
+
+    axes : array-like of shape (3,), default=None
+        Axes to use for plotting the curves.
+
+    ylim : tuple of shape (2,), default=None
+        Defines minimum and maximum y-values plotted, e.g. (ymin, ymax).
+
+    cv : int, cross-validation generator or an iterable, default=None
+        Determines the cross-validation splitting strategy.
+        Possible inputs for cv are:
+
+          - None, to use the default 5-fold cross-validation,
+          - integer, to specify the number of folds.
+          - :term:`CV splitter`,
+          - An iterable yielding (train, test) splits as arrays of indices.
+
+        For integer/None inputs, if ``y`` is binary or multiclass,
+        :class:`StratifiedKFold` used. If the estimator is not a classifier
+        or if ``y`` is neither binary nor multiclass, :class:`KFold` is used.
+
+        Refer :ref:`User Guide <cross_validation>` for the various
+        cross-validators that can be used here.
+
+    n_jobs : int or None, default=None
+        Number of jobs to run in parallel.
+        ``None`` means all the cores available when the function is called.
+        ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
+        for more details.
+
+    scoring : str or callable, default=None
+        A str (see model evaluation documentation) or
+        a scorer callable object / function with signature
+        ``scorer(estimator, X, y)``.
+
+    train_sizes : array-like of shape (n_ticks,)
+        Relative or absolute numbers of training examples that will be used to
+        generate the learning curve. If the ``dtype`` is float, it is regarded
+        as a fraction of the maximum size of the training set (that is
+        determined by the selected validation method), i.e. it has to be within
+        (0, 1]. Otherwise it is interpreted as absolute sizes of the training
+        sets. Note that for classification the number of samples usually have
+        to be big enough to contain at least one sample from each class.
+        (default: np.linspace(0.1, 1.0, 5))
+
+    cache_directory : str, default=None
+        Folder of cached learning curves (no caching if None).
+    """
+
+    curve = compute_learning_curve(estimator, X, y, cv=cv, n_jobs=n_jobs, scoring=scoring,
+                                   train_sizes=train_sizes, cache_directory=cache_directory)
+    plot_learning_curve_results(curve, figure_name, ylim=ylim, dpi=dpi)
+    return curve['train_sizes'], curve['train_scores'], curve['test_scores']
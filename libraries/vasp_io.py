@@ -0,0 +1,529 @@
+import numpy as np
+import mmap
+import re
+import os
+
+from contextlib import contextmanager
+from itertools  import islice
+from xml.etree  import ElementTree
+
+# Frequency lines of the dynamical matrix, as '  1 f  =  ... 14.296 meV' or '  2 f/i=  ... 0.511 meV'
+_frequency_pattern = re.compile(rb'^\s*(\d+)\s+f(/i)?\s*=.*?(\S+)\s+meV[ \t\r]*$', re.MULTILINE)
+
+# Energies of the ionic steps of an OSZICAR
+_free_energy_pattern = re.compile(r'\bF=\s*(\S+)')
+_E0_pattern          = re.compile(r'\bE0=\s*(\S+)')
+
+# Header of the eigenvalues of the dynamical matrix in the OUTCAR
+_dynamical_matrix_header = b'Eigenvectors and eigenvalues of the dynamical matrix'
+
+# Headers of the dielectric function in the OUTCAR (LOPTICS), and the empty line after each block
+_dielectric_patterns = {
+    'imag': re.compile(rb'frequency dependent\s+IMAGINARY DIELECTRIC FUNCTION'),
+    'real': re.compile(rb'frequency dependent\s+REAL DIELECTRIC FUNCTION')
+}
+_empty_line_pattern = re.compile(rb'\n[ \t]*\r?\n')
+
+# Headers of the configurations of an XDATCAR, as 'Direct configuration=    10', and symbols of the species
+_configuration_pattern = re.compile(rb'configuration=\s*(\d+)')
+_species_pattern       = re.compile(r'^[A-Z][a-z]?$')
+
+
+@contextmanager
+def _map_file(file_name):
+    """Memory-maps a file for reading, so that it is searched without loading it into memory.
+
+    Args:
+        file_name (str): Path of the file.
+
+    Yields:
+        mmap or bytes: Read-only map of the file (empty bytes for empty files, which cannot be mapped).
+    """
+
+    with open(file_name, 'rb') as input_file:
+        try:
+            mapped_file = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            yield b''
+            return
+
+        try:
+            yield mapped_file
+        finally:
+            mapped_file.close()
+
+
+def read_outcar_phonons(file_name):
+    """Reads the phonon frequencies of the first dynamical matrix of an OUTCAR (IBRION = 5-8).
+    Only the eigenvalues block is scanned, so the memory used does not depend on the size of the file.
+
+    Args:
+        file_name (str): Path of the OUTCAR.
+
+    Returns:
+        tuple: Real and imaginary frequencies (meV), as float arrays in the order of the OUTCAR.
+    """
+
+    real      = []
+    imaginary = []
+    with _map_file(file_name) as outcar:
+        start = outcar.find(_dynamical_matrix_header)
+        if start == -1:
+            start = 0
+
+        for match in _frequency_pattern.finditer(outcar, start):
+            # The mode index starts again with the next block (e.g. the eigenvectors divided by sqrt(mass))
+            if (int(match.group(1)) == 1) and (len(real) + len(imaginary)):
+                break
+
+            frequency = float(match.group(3))
+            if match.group(2):
+                imaginary.append(frequency)
+            else:
+                real.append(frequency)
+    return np.array(real, dtype=float), np.array(imaginary, dtype=float)
+
+
+def read_outcar_elapsed_time(file_name):
+    """Reads the elapsed time of a calculation, written at the end of its OUTCAR.
+
+    Args:
+        file_name (str): Path of the OUTCAR.
+
+    Returns:
+        float: Elapsed time (s), or None if the calculation has not finished.
+    """
+
+    with _map_file(file_name) as outcar:
+        start = outcar.rfind(b'Elapsed time')
+        if start == -1:
+            return None
+
+        stop = outcar.find(b'\n', start)
+        line = outcar[start:stop if stop != -1 else len(outcar)]
+    return float(line.split()[-1])
+
+
+def read_last_lines(file_name, n_lines=1, block_size=4096):
+    """Reads the last lines of a file, seeking back from its end by blocks, so that only
+    the end of the file is read. Trailing empty lines are ignored.
+
+    Args:
+        file_name  (str): Path of the file.
+        n_lines    (int): Number of lines to read.
+        block_size (int): Number of bytes read at once.
+
+    Returns:
+        list: Last lines of the file (fewer if the file is shorter), without line breaks.
+    """
+
+    with open(file_name, 'rb') as input_file:
+        position = input_file.seek(0, 2)
+
+        tail = b''
+        while position > 0:
+            step     = min(block_size, position)
+            position = input_file.seek(position - step)
+            tail     = input_file.read(step) + tail
+
+            # One extra line break is needed to know that the first line is complete
+            if tail.rstrip().count(b'\n') >= n_lines:
+                break
+
+    lines = tail.decode(errors='replace').rstrip().splitlines()
+    return lines[-n_lines:] if len(lines) else []
+
+
+def _parse_ionic_step(line):
+    """Parses the energies of an ionic step of an OSZICAR, as '  1 F= -.35E+03 E0= -.35E+03  d E =-.35E+03'.
+
+    Args:
+        line (str): Line of the OSZICAR.
+
+    Returns:
+        dict: Free energy (F) and energy for sigma -> 0 (E0), in eV, or None if it is not an ionic step.
+    """
+
+    free_energy = _free_energy_pattern.search(line)
+    if free_energy is None:
+        return None
+
+    E0 = _E0_pattern.search(line)
+    return {
+        'F':  float(free_energy.group(1)),
+        'E0': float(E0.group(1)) if E0 is not None else np.nan
+    }
+
+
+def read_oszicar_energies(file_name, n_lines=1):
+    """Reads the energies of the final ionic step of an OSZICAR, from the last lines of the file.
+
+    Args:
+        file_name (str): Path of the OSZICAR.
+        n_lines   (int): Number of lines, from the end, where the final ionic step is looked for.
+
+    Returns:
+        dict: Free energy (F) and energy for sigma -> 0 (E0), in eV, or None if the last lines
+            contain no ionic step (i.e., the calculation has not finished).
+    """
+
+    for line in reversed(read_last_lines(file_name, n_lines)):
+        energies = _parse_ionic_step(line)
+        if energies is not None:
+            return energies
+    return None
+
+
+def read_contcar_lattice(file_name):
+    """Reads the scaling factor and lattice vectors of a POSCAR/CONTCAR, without reading the positions.
+
+    Args:
+        file_name (str): Path of the CONTCAR.
+
+    Returns:
+        tuple: Scaling factor and lattice vectors (as rows of a 3x3 array, without scaling).
+    """
+
+    with open(file_name, 'r') as contcar_file:
+        header = list(islice(contcar_file, 5))
+
+    if len(header) < 5:
+        raise ValueError(f'Incomplete header in {file_name}.')
+
+    scale   = float(header[1].split()[0])
+    lattice = np.array([line.split()[:3] for line in header[2:5]], dtype=float)
+    return scale, lattice
+
+
+def read_doscar(file_name, projected=False):
+    """Reads the density of states of a DOSCAR, loading each block at once from the NEDOS of its header.
+    Spin-polarized calculations (ISPIN = 2) have one column per spin channel.
+
+    Args:
+        file_name (str):  Path of the DOSCAR.
+        projected (bool): Whether to read the projected densities of states of each atom (LORBIT).
+
+    Returns:
+        dict: Fermi energy (eV), energies (eV), total and integrated densities of states of shape (NEDOS, n_spins),
+            and projected densities of states of shape (n_atoms, NEDOS, n_columns) (None if not read or not written).
+    """
+
+    with open(file_name, 'r') as DOSCAR_file:
+        header = list(islice(DOSCAR_file, 6))
+        if len(header) < 6:
+            raise ValueError(f'Incomplete header in {file_name}.')
+
+        n_atoms      = int(header[0].split()[0])
+        NEDOS        = int(header[5].split()[2])
+        fermi_energy = float(header[5].split()[3])
+
+        total_block = np.loadtxt(islice(DOSCAR_file, NEDOS), ndmin=2)
+        if len(total_block) != NEDOS:
+            raise ValueError(f'Incomplete density of states in {file_name}.')
+
+        # Columns: energy, density of each spin channel, integrated density of each spin channel
+        n_spins = (total_block.shape[1] - 1) // 2
+
+        # Blocks of each atom, each one after a header as that of the total density of states
+        projected_dos = None
+        if projected:
+            atom_blocks = []
+            for _ in range(n_atoms):
+                if next(DOSCAR_file, None) is None:  # Not written
+                    break
+
+                atom_block = np.loadtxt(islice(DOSCAR_file, NEDOS), ndmin=2)
+                if len(atom_block) != NEDOS:
+                    raise ValueError(f'Incomplete projected density of states in {file_name}.')
+                atom_blocks.append(atom_block[:, 1:])
+
+            if len(atom_blocks):
+                projected_dos = np.stack(atom_blocks)
+
+    return {
+        'fermi_energy':   fermi_energy,
+        'energies':       total_block[:, 0],
+        'total_dos':      total_block[:, 1:1+n_spins],
+        'integrated_dos': total_block[:, 1+n_spins:1+2*n_spins],
+        'projected_dos':  projected_dos
+    }
+
+
+def get_band_gap(energies, integrated_dos, fermi_energy, tolerance=1e-3):
+    """Finds the band gap as the contiguous range of energies around the Fermi level where the
+    integrated density of states (summed over spin channels) does not change, within a tolerance.
+
+    Args:
+        energies       (ndarray): Energies of the density of states (eV).
+        integrated_dos (ndarray): Integrated density of states, of shape (NEDOS,) or (NEDOS, n_spins).
+        fermi_energy   (float):   Fermi energy (eV).
+        tolerance      (float):   Maximum change of the integrated density of states within the gap (states).
+
+    Returns:
+        tuple: Band gap, valence band maximum and conduction band minimum (eV); the conduction
+            band minimum (and the gap) is NaN if no state is found above the Fermi level.
+    """
+
+    integrated_dos = np.asarray(integrated_dos, dtype=float)
+    if integrated_dos.ndim > 1:
+        integrated_dos = np.sum(integrated_dos, axis=1)
+
+    fermi_index = np.argmin(np.abs(energies - fermi_energy))
+
+    # Limits of the range of constant integrated density of states containing the Fermi level
+    changes = np.flatnonzero(np.abs(integrated_dos - integrated_dos[fermi_index]) > tolerance)
+    below   = changes[changes < fermi_index]
+    above   = changes[changes > fermi_index]
+
+    vbm_index = below[-1] + 1 if len(below) else 0
+    cbm_index = above[0]      if len(above) else None
+
+    valence_band    = energies[vbm_index]
+    conduction_band = energies[cbm_index] if cbm_index is not None else np.nan
+    return conduction_band - valence_band, valence_band, conduction_band
+
+
+def _parse_rows(text, n_columns):
+    """Parses whitespace-separated rows of numbers at once.
+
+    Args:
+        text      (str or bytes): Rows of numbers.
+        n_columns (int):          Number of columns of each row.
+
+    Returns:
+        ndarray: Array of shape (n_rows, n_columns).
+    """
+
+    return np.array(text.split(), dtype=float).reshape(-1, n_columns)
+
+
+def read_vasprun_dielectric(file_name):
+    """Reads the (first) frequency-dependent dielectric function of a vasprun.xml, parsing the file
+    incrementally and discarding every other element, so that large files are not kept in memory.
+
+    Args:
+        file_name (str): Path of the vasprun.xml.
+
+    Returns:
+        tuple: Energies (eV) and real and imaginary parts of the dielectric function, of shape
+            (n_energies, 6) with the xx, yy, zz, xy, yz and zx components.
+    """
+
+    inside = False
+    for event, element in ElementTree.iterparse(file_name, events=('start', 'end')):
+        if element.tag != 'dielectricfunction':
+            if (event == 'end') and not inside:
+                element.clear()
+            continue
+
+        if event == 'start':
+            inside = True
+            continue
+
+        parts = {}
+        for part in ('imag', 'real'):
+            rows = ' '.join(row.text for row in element.find(part).iter('r'))
+            parts[part] = _parse_rows(rows, 7)
+        return parts['real'][:, 0], parts['real'][:, 1:], parts['imag'][:, 1:]
+
+    raise ValueError(f'No dielectric function in {file_name}.')
+
+
+def read_outcar_dielectric(file_name):
+    """Reads the frequency-dependent dielectric function of an OUTCAR (LOPTICS), searching its blocks
+    through a memory map.
+
+    Args:
+        file_name (str): Path of the OUTCAR.
+
+    Returns:
+        tuple: Energies (eV) and real and imaginary parts of the dielectric function, of shape
+            (n_energies, 6) with the xx, yy, zz, xy, yz and zx components.
+    """
+
+    parts = {}
+    with _map_file(file_name) as outcar:
+        for part, pattern in _dielectric_patterns.items():
+            header = pattern.search(outcar)
+            if header is None:
+                raise ValueError(f'No dielectric function in {file_name}.')
+
+            # The rows are after the title, the names of the columns and a line of dashes, until an empty line
+            start = outcar.find(b'---', header.end())
+            start = outcar.find(b'\n', start) + 1
+            stop  = _empty_line_pattern.search(outcar, start)
+            parts[part] = _parse_rows(outcar[start:stop.start() if stop is not None else len(outcar)], 7)
+    return parts['real'][:, 0], parts['real'][:, 1:], parts['imag'][:, 1:]
+
+
+def _parse_incar_value(value):
+    """Converts the value of an INCAR tag into a bool, int or float when possible.
+
+    Args:
+        value (str): Value of the tag.
+
+    Returns:
+        object: Converted value, or the string itself.
+    """
+
+    if value.upper() in ('.TRUE.', 'T', '.T.'):
+        return True
+    if value.upper() in ('.FALSE.', 'F', '.F.'):
+        return False
+
+    for converter in (int, float):
+        try:
+            return converter(value)
+        except ValueError:
+            pass
+    return value
+
+
+def read_incar(file_name):
+    """Reads the tags of an INCAR, ignoring comments (after # or !).
+
+    Args:
+        file_name (str): Path of the INCAR.
+
+    Returns:
+        dict: Values of the tags (with uppercase names), converted into bool, int or float when possible.
+    """
+
+    tags = {}
+    with open(file_name, 'r') as INCAR_file:
+        for line in INCAR_file:
+            line = re.split(r'[#!]', line)[0]
+            for statement in line.split(';'):
+                if '=' in statement:
+                    tag, value = statement.split('=', 1)
+                    tags[tag.strip().upper()] = _parse_incar_value(value.strip())
+    return tags
+
+
+def get_time_axis(n_frames, incar):
+    """Times of the configurations of a molecular dynamics trajectory, written every NBLOCK steps of POTIM.
+
+    Args:
+        n_frames (int):  Number of configurations.
+        incar    (dict): Tags of the INCAR of the calculation (from read_incar).
+
+    Returns:
+        ndarray: Time of each configuration (fs).
+    """
+
+    for tag in ('POTIM', 'NBLOCK'):
+        if isinstance(incar.get(tag, ''), (bool, str)):
+            raise ValueError(f'{tag} not defined in the INCAR.')
+    return np.arange(n_frames) * incar['POTIM'] * incar['NBLOCK']
+
+
+def _read_xdatcar_header(header, file_name):
+    """Validates and parses the header of an XDATCAR (title, scaling factor, lattice vectors, species and counts).
+
+    Args:
+        header    (list): First seven lines of the XDATCAR.
+        file_name (str):  Path of the XDATCAR, for the error messages.
+
+    Returns:
+        tuple: Lattice vectors (scaled, as rows of a 3x3 array), species and number of atoms of each species.
+    """
+
+    if len(header) < 7:
+        raise ValueError(f'Incomplete header in {file_name}.')
+
+    try:
+        scale = float(header[1].split()[0])
+    except (ValueError, IndexError):
+        raise ValueError(f'Invalid scaling factor in {file_name}.')
+
+    try:
+        cell = np.array([line.split()[:3] for line in header[2:5]], dtype=float).reshape(3, 3)
+    except ValueError:
+        raise ValueError(f'Invalid lattice vectors in {file_name}.')
+
+    species = header[5].split()
+    try:
+        counts = [int(count) for count in header[6].split()]
+    except ValueError:
+        raise ValueError(f'Invalid number of atoms in {file_name}.')
+
+    if not all(_species_pattern.match(name) for name in species) or (len(species) != len(counts)) \
+            or not len(counts) or (min(counts) < 1):
+        raise ValueError(f'Invalid composition in {file_name}.')
+
+    # A negative scaling factor is the volume of the cell
+    if scale < 0:
+        scale = (-scale / abs(np.linalg.det(cell))) ** (1 / 3)
+    return scale * cell, species, counts
+
+
+def read_xdatcar(file_name, cache_file=None):
+    """Reads the configurations of a (fixed-cell) XDATCAR into one contiguous float32 array, after counting them,
+    so that no Python object is created per atom. The configurations can be stored in a .npy file, which is then
+    memory-mapped (for random access to trajectories larger than memory) and reused while it is newer than the XDATCAR.
+
+    Args:
+        file_name  (str): Path of the XDATCAR.
+        cache_file (str): Path of the .npy file of the configurations (kept in memory if None).
+
+    Returns:
+        dict: Lattice vectors (scaled), species, number of atoms of each species, ionic step of each configuration
+            and positions (direct coordinates) of shape (n_frames, n_atoms, 3).
+    """
+
+    with open(file_name, 'r') as XDATCAR_file:
+        cell, species, counts = _read_xdatcar_header(list(islice(XDATCAR_file, 7)), file_name)
+
+    # Counting the configurations
+
+    with _map_file(file_name) as xdatcar:
+        steps = np.array([int(step) for step in _configuration_pattern.findall(xdatcar)], dtype=int)
+
+    n_frames = len(steps)
+    n_atoms  = sum(counts)
+    shape    = (n_frames, n_atoms, 3)
+
+    xdatcar_data = {
+        'cell':    cell,
+        'species': species,
+        'counts':  counts,
+        'steps':   steps
+    }
+
+    # Reusing the stored configurations
+
+    if (cache_file is not None) and os.path.exists(cache_file) \
+            and (os.path.getmtime(cache_file) >= os.path.getmtime(file_name)):
+        positions = np.load(cache_file, mmap_mode='r')
+        if positions.shape == shape:
+            xdatcar_data['positions'] = positions
+            return xdatcar_data
+
+    # Reading the configurations
+
+    if cache_file is None:
+        positions = np.empty(shape, dtype=np.float32)
+    else:
+        positions = np.lib.format.open_memmap(cache_file, mode='w+', dtype=np.float32, shape=shape)
+
+    with open(file_name, 'r') as XDATCAR_file:
+        for _ in islice(XDATCAR_file, 7):
+            pass
+
+        for frame in range(n_frames):
+            if 'configuration=' not in next(XDATCAR_file, ''):
+                raise ValueError(f'Invalid header of configuration {frame} in {file_name}.')
+
+            try:
+                frame_positions = np.loadtxt(islice(XDATCAR_file, n_atoms), usecols=(0, 1, 2), ndmin=2)
+            except ValueError:
+                frame_positions = None
+
+            if (frame_positions is None) or (len(frame_positions) != n_atoms):
+                raise ValueError(f'Incomplete configuration {frame} in {file_name}.')
+            positions[frame] = frame_positions
+
+    if cache_file is not None:
+        positions.flush()
+    xdatcar_data['positions'] = positions
+    return xdatcar_data
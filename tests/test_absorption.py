@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.vasp_io   import read_vasprun_dielectric, read_outcar_dielectric
+from libraries.summaries import get_absorption_coefficient, summarize_folder, hbar_c
+
+class TestAbsorption(unittest.TestCase):
+    """Class for testing the computation of absorption spectra from the dielectric function.
+    """
+
+    def setUp(self):
+        """Writes the dielectric function in a vasprun.xml and an OUTCAR, in a temporary folder.
+        """
+
+        self.folder = tempfile.TemporaryDirectory()
+
+        self.energies = np.linspace(0, 5, 11)
+        self.real     = np.column_stack([4 - self.energies / 2] * 3 + [np.zeros(11)] * 3)
+        self.imag     = np.column_stack([self.energies ** 2 / 5] * 3 + [np.zeros(11)] * 3)
+
+        def write_rows(output_file, part, row_format):
+            for energy, values in zip(self.energies, part):
+                output_file.write(row_format.format(' '.join(f'{value:11.6f}' for value in [energy, *values])))
+
+        with open(os.path.join(self.folder.name, 'vasprun.xml'), 'w') as vasprun_file:
+            vasprun_file.write('<?xml version="1.0" encoding="ISO-8859-1"?>\n<modeling>\n <calculation>\n')
+            vasprun_file.write('  <dielectricfunction comment="density-density">\n')
+            for name, part in [('imag', self.imag), ('real', self.real)]:
+                vasprun_file.write(f'   <{name}>\n    <array>\n     <dimension dim="1">gridpoints</dimension>\n')
+                vasprun_file.write('     <field>energy</field>\n     <set>\n')
+                write_rows(vasprun_file, part, '      <r> {} </r>\n')
+                vasprun_file.write(f'     </set>\n    </array>\n   </{name}>\n')
+            vasprun_file.write('  </dielectricfunction>\n </calculation>\n</modeling>\n')
+
+        with open(os.path.join(self.folder.name, 'OUTCAR'), 'w') as outcar_file:
+            for title, part in [('IMAGINARY', self.imag), ('     REAL', self.real)]:
+                outcar_file.write(f'\n  frequency dependent {title} DIELECTRIC FUNCTION (independent particle)\n')
+                outcar_file.write('     E(ev)      X         Y         Z        XY        YZ        ZX\n')
+                outcar_file.write('  ' + '-' * 98 + '\n')
+                write_rows(outcar_file, part, '  {}\n')
+            outcar_file.write('\n\n')
+
+    def tearDown(self):
+        """Removes the temporary folder.
+        """
+
+        self.folder.cleanup()
+
+    def test_dielectric_function(self):
+        """Checks that the vasprun.xml and OUTCAR readers give the same dielectric function.
+        """
+
+        for reader, file_name in [(read_vasprun_dielectric, 'vasprun.xml'), (read_outcar_dielectric, 'OUTCAR')]:
+            energies, real, imag = reader(os.path.join(self.folder.name, file_name))
+
+            np.testing.assert_allclose(energies, self.energies)
+            np.testing.assert_allclose(real, self.real, atol=1e-6)
+            np.testing.assert_allclose(imag, self.imag, atol=1e-6)
+
+    def test_absorption_coefficient(self):
+        """Checks the absorption coefficient of transparent and absorbing media.
+        """
+
+        absorption = get_absorption_coefficient(np.array([1., 1.]), np.array([[1.], [0.]]), np.array([[0.], [2.]]))
+        np.testing.assert_allclose(absorption[:, 0], [0, 2 / hbar_c])
+
+    def test_summary(self):
+        """Checks the absorption coefficient at the limit of the visible range, with and without vasprun.xml.
+        """
+
+        expected = get_absorption_coefficient(self.energies, self.real, self.imag)[7, 0]  # First energy above 3.26 eV
+
+        record = summarize_folder(self.folder.name, 'absorption_spectra')
+        self.assertAlmostEqual(record['absorption'] / expected, 1)
+
+        os.remove(os.path.join(self.folder.name, 'vasprun.xml'))
+        record = summarize_folder(self.folder.name, 'absorption_spectra')
+        self.assertAlmostEqual(record['absorption'] / expected, 1)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+import unittest
+import numpy as np
+
+from scipy.spatial             import cKDTree
+from scipy.stats               import norm
+from sklearn.ensemble          import RandomForestRegressor
+from libraries.active_learning import expected_improvement, boundary_uncertainty, exclude_tried, select_compositions
+from libraries.grid            import iterate_grid, get_grid
+from libraries.models          import SurrogateModel
+from libraries.utils           import Limits
+
+class TestActiveLearning(unittest.TestCase):
+    """Class for testing the selection of the next compositions to be computed.
+    """
+
+    def setUp(self):
+        """Fits a forest to a property that increases along x.
+        """
+
+        rng = np.random.default_rng(0)
+        self.X = rng.random((80, 2))
+        self.y = 2 * self.X[:, 0] + 0.1 * self.X[:, 1]
+        self.model = SurrogateModel(RandomForestRegressor(n_estimators=30, random_state=0)).fit(self.X, self.y)
+
+        self.limits = Limits()
+        self.limits.lower = 1
+
+    def test_expected_improvement(self):
+        """Checks the expected improvement against its closed form, for maximization and minimization.
+        """
+
+        mean = np.array([0.5, 1.0, 1.5])
+        std  = np.array([0.2, 0.1, 0.3])
+
+        z = (mean - 1.2) / std
+        np.testing.assert_allclose(expected_improvement(mean, std, 1.2), (mean - 1.2) * norm.cdf(z) + std * norm.pdf(z))
+        np.testing.assert_allclose(expected_improvement(-mean, std, -1.2, maximize=False),
+                                   expected_improvement(mean, std, 1.2))
+
+    def test_boundary_uncertainty(self):
+        """Checks that the score is positive only when a boundary lies within the confidence interval.
+        """
+
+        scores = boundary_uncertainty(np.array([0.9, 1.5, 3.0]), np.array([0.1, 0.1, 1.0]), limits=self.limits,
+                                      thresholds=[2.5], beta=2)
+
+        np.testing.assert_allclose(scores, [0.1, -0.3, 1.5])
+
+    def test_exclude_tried(self):
+        """Checks that compositions already tried are excluded.
+        """
+
+        compositions = get_grid(2, 0.5)
+
+        np.testing.assert_array_equal(exclude_tried(compositions, [[0, 0.5], [1, 1]]),
+                                      [True, False, True, True, True, True, True, True, False])
+        np.testing.assert_array_equal(exclude_tried(compositions, cKDTree([[0, 0.5], [1, 1]])),
+                                      exclude_tried(compositions, [[0, 0.5], [1, 1]]))
+
+    def test_streaming_selection(self):
+        """Checks that selecting over chunks agrees with selecting over the whole grid, excluding the tried ones.
+        """
+
+        tried = get_grid(2, 0.1)[::7]
+        streamed = select_compositions(self.model, iterate_grid(2, 0.02, chunk_size=100), 10, limits=self.limits,
+                                       tried=tried)
+        whole    = select_compositions(self.model, [get_grid(2, 0.02)], 10, limits=self.limits, tried=tried)
+
+        np.testing.assert_allclose(streamed['score'], whole['score'])  # Compositions may differ among ties
+        self.assertTrue(np.all(np.diff(streamed['score']) <= 0))
+        self.assertTrue(np.all(exclude_tried(streamed['compositions'], tried)))
+        self.assertTrue(np.all(np.abs(streamed['compositions'][:, 0] - 0.5) < 0.2))
+
+    def test_expected_improvement_selection(self):
+        """Checks that the expected improvement selects compositions at large x, for a maximized property.
+        """
+
+        selection = select_compositions(self.model, iterate_grid(2, 0.05), 5, acquisition='ei', best=self.y.max())
+
+        self.assertEqual(len(selection['compositions']), 5)
+        self.assertTrue(np.all(selection['compositions'][:, 0] > 0.8))
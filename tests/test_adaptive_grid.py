@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+import unittest
+import numpy as np
+
+from libraries.grid  import refine_grid, get_grid
+from libraries.utils import Limits, within_limits
+
+class TestAdaptiveGrid(unittest.TestCase):
+    """Class for testing the adaptive refinement of composition grids around the limits of a property.
+    """
+
+    def setUp(self):
+        """Property that is accepted inside a circle (radius below 0.3 around the center of the square).
+        """
+
+        self.precision = 1 / 128
+        self.limits = Limits()
+        self.limits.upper = 0.3
+        self.n_evaluations = 0
+
+    def radius(self, points):
+        """Distance to the center of the square, counting the evaluations.
+        """
+
+        self.n_evaluations += len(points)
+        return np.linalg.norm(points - 0.5, axis=1)
+
+    def test_boundary(self):
+        """Checks that every cell of the fine grid crossed by the boundary is fully evaluated,
+        with far fewer evaluations than the uniform grid.
+        """
+
+        points, values = refine_grid(self.radius, 2, self.precision, 4, limits=self.limits, chunk_size=100)
+
+        n_fine = 129
+        fine_values = np.linalg.norm(get_grid(2, self.precision) - 0.5, axis=1).reshape(n_fine, n_fine)
+        accepted    = within_limits(fine_values, self.limits)
+        crossed = (accepted[:-1, :-1] != accepted[1:, :-1]) | (accepted[:-1, :-1] != accepted[:-1, 1:])
+
+        indexes = set(map(tuple, np.rint(points / self.precision).astype(int)))
+        for i, j in zip(*np.nonzero(crossed)):
+            self.assertTrue({(i, j), (i+1, j), (i, j+1)} <= indexes)
+
+        self.assertEqual(self.n_evaluations, len(points))
+        self.assertLess(len(points), n_fine**2 / 3)
+        np.testing.assert_allclose(values, np.linalg.norm(points - 0.5, axis=1))
+
+    def test_no_boundary(self):
+        """Checks that only the coarse grid is evaluated when no boundary is crossed.
+        """
+
+        points, _ = refine_grid(self.radius, 2, self.precision, 4, thresholds=[2])
+
+        np.testing.assert_allclose(points, get_grid(2, self.precision * 16))
+
+    def test_undefined(self):
+        """Checks that cells partially undefined (NaN) are refined like cells crossed by a boundary.
+        """
+
+        def function(points):
+            return np.where(points[:, 0] < 0.4, np.nan, 1.0)
+
+        points, values = refine_grid(function, 1, self.precision, 3)
+
+        np.testing.assert_allclose(np.sort(points[:, 0])[:3], [0, 0.0625, 0.125])
+        self.assertIn(0.3984375, points[:, 0])
+        self.assertIn(0.40625, points[:, 0])
+        self.assertTrue(np.all(np.isnan(values) == (points[:, 0] < 0.4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+import unittest
+import numpy  as np
+import pandas as pd
+
+from scipy.spatial   import ConvexHull
+from libraries.utils import get_convex_hull_energies
+
+class TestConvexHullEnergies(unittest.TestCase):
+    """Class for testing the vectorized computation of the lower-envelope formation energies.
+    """
+
+    def setUp(self):
+        """Defines a ternary system with a collinear triplet of phases.
+        """
+
+        self.elements    = np.array(['A', 'B', 'C', 'AB', 'A2B', 'ABC'])
+        self.coordinates = np.array([[0,   0],
+                                     [1,   0],
+                                     [0.5, np.sqrt(3) / 2],
+                                     [0.5, 0],
+                                     [1/3, 0],
+                                     [0.5, np.sqrt(3) / 6]])
+        self.energies = pd.DataFrame([0, 0, 0, -0.3, -0.1, -0.5],
+                                     columns=['formation_energy'],
+                                     index=self.elements)
+
+        x_grid = np.arange(-0.1, 1.1, 0.05)
+        self.grid = np.array([[a, b] for a in x_grid for b in x_grid])
+
+    def lower_envelope(self, points):
+        """Brute-force lower envelope of the phases: the maximum over the lower facets of their 3D convex hull
+        (with the energy as third coordinate), NaN outside of the convex hull of the phases.
+        """
+
+        hull   = ConvexHull(np.column_stack([self.coordinates, self.energies.formation_energy.values]))
+        facets = hull.equations[hull.equations[:, 2] < -1e-12]
+        envelope = np.max(-(points @ facets[:, :2].T + facets[:, 3]) / facets[:, 2], axis=1)
+
+        planar = ConvexHull(self.coordinates).equations
+        inside = np.all(points @ planar[:, :2].T + planar[:, 2] <= 1e-12, axis=1)
+        return np.where(inside, envelope, np.nan)
+
+    def test_lower_envelope(self):
+        """Checks that the vectorized engine reproduces the lower envelope computed with scipy's ConvexHull.
+        """
+
+        expected = self.lower_envelope(self.grid)
+        energies = get_convex_hull_energies(self.grid, self.coordinates, self.energies.formation_energy.values)
+
+        np.testing.assert_array_equal(np.isnan(energies), np.isnan(expected))
+        np.testing.assert_allclose(energies, expected, atol=1e-12)
+
+    def test_hand_computed(self):
+        """Checks energies computed by hand: A2B lies above the A-AB tie line, so it is not on the hull.
+        """
+
+        points = [[0.5, 0], [1/3, 0], [0.75, 0], [0.5, np.sqrt(3) / 6], [0.25, np.sqrt(3) / 12]]
+        energies = get_convex_hull_energies(points, self.coordinates, self.energies.formation_energy.values)
+
+        np.testing.assert_allclose(energies, [-0.3, -0.2, -0.15, -0.5, -0.25], atol=1e-12)
+
+    def test_chunks(self):
+        """Checks that the chunk size does not change the results.
+        """
+
+        energies       = get_convex_hull_energies(self.grid, self.coordinates, self.energies.formation_energy.values)
+        energies_chunk = get_convex_hull_energies(self.grid, self.coordinates, self.energies.formation_energy.values,
+                                                  max_memory=1)
+
+        np.testing.assert_array_equal(energies, energies_chunk)
+
+    def test_outside(self):
+        """Checks that points outside every triangle are not assigned an energy.
+        """
+
+        energies = get_convex_hull_energies([[-0.5, -0.5], [0.5, 0]],
+                                            self.coordinates, self.energies.formation_energy.values)
+
+        self.assertTrue(np.isnan(energies[0]))
+        self.assertAlmostEqual(energies[1], -0.3)
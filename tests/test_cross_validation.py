@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+import unittest
+import numpy as np
+
+from sklearn.model_selection import ShuffleSplit
+from libraries.cross_validation import cross_validate
+from libraries.models           import initialize_model
+from libraries.utils            import xy_scaler, y_descaler
+
+class TestCrossValidation(unittest.TestCase):
+    """Class for testing the parallel cross-validation driver.
+    """
+
+    def setUp(self):
+        """Defines the data and a reproducible splitter.
+        """
+
+        rng = np.random.default_rng(0)
+        self.X  = rng.random((50, 3))
+        self.y  = 1 + self.X @ [1, -2, 0.5]
+        self.cv = ShuffleSplit(n_splits=4, test_size=0.2, random_state=0)
+        self.parameters = {'n_estimators': 5, 'random_state': 0}
+
+    def test_sequential_loop(self):
+        """Checks that the metrics and predictions agree with the sequential loop of the notebooks.
+        """
+
+        train_MAE = 0
+        test_MAE  = 0
+        y_pred_cv = []
+        for train_index, test_index in self.cv.split(self.X):
+            X_train, X_test, y_train, y_scaler = xy_scaler(self.X[train_index], self.X[test_index], self.y[train_index])
+
+            model = initialize_model('Random Forest', **self.parameters)
+            model.fit(X_train, y_train)
+
+            y_temp, y_train, y_pred = y_descaler([model.predict(X_train), y_train, model.predict(X_test)], y_scaler)
+
+            train_MAE += np.linalg.norm(y_train - y_temp) / len(test_index)
+            test_MAE  += np.linalg.norm(y_pred - self.y[test_index]) / len(test_index)
+            y_pred_cv.append(y_pred)
+
+        results = cross_validate('Random Forest', self.X, self.y, self.cv, n_jobs=2, **self.parameters)
+
+        self.assertAlmostEqual(results['train_MAE'], train_MAE / 4)
+        self.assertAlmostEqual(results['test_MAE'],  test_MAE  / 4)
+        np.testing.assert_allclose(results['y_pred'], np.concatenate(y_pred_cv))
+
+    def test_serial(self):
+        """Checks that running the folds serially or in parallel gives the same results.
+        """
+
+        serial   = cross_validate('Random Forest', self.X, self.y, self.cv, n_jobs=1, **self.parameters)
+        parallel = cross_validate('Random Forest', self.X, self.y, self.cv, n_jobs=4, threads_per_fold=1,
+                                  **self.parameters)
+
+        for name in serial:
+            np.testing.assert_allclose(serial[name], parallel[name])
+        self.assertEqual(len(parallel['y_test']), 4 * 10)
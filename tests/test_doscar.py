@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.vasp_io import read_doscar, get_band_gap
+
+class TestDoscar(unittest.TestCase):
+    """Class for testing the reading of DOSCAR files and the extraction of band gaps.
+    """
+
+    def setUp(self):
+        """Defines a density of states with a gap between -0.4 and 1.3 eV.
+        """
+
+        self.folder = tempfile.TemporaryDirectory()
+
+        self.energies = np.round(np.linspace(-5, 5, 101), 3)
+        self.dos      = np.where((self.energies > -0.45) & (self.energies < 1.25), 0, 1.0)
+        self.integrated_dos = np.cumsum(self.dos) * 0.1
+
+    def tearDown(self):
+        """Removes the temporary folder.
+        """
+
+        self.folder.cleanup()
+
+    def _write_doscar(self, columns, projected_columns=None, n_atoms=2):
+        """Writes a DOSCAR with the given columns of total (and projected) density of states.
+
+        Args:
+            columns           (list): Columns of the total density of states, after the energies.
+            projected_columns (list): Columns of the projected density of states of each atom (not written if None).
+            n_atoms           (int):  Number of atoms.
+
+        Returns:
+            str: Path of the DOSCAR.
+        """
+
+        block_header = f'      5.00000000     -5.00000000    {len(self.energies)}      0.10000000      1.00000000\n'
+
+        file_name = os.path.join(self.folder.name, 'DOSCAR')
+        with open(file_name, 'w') as DOSCAR_file:
+            DOSCAR_file.write(f'   {n_atoms}   {n_atoms}   {int(projected_columns is not None)}   0\n')
+            DOSCAR_file.write('  0.1E+02  0.1E+02  0.1E+02  0.1E+02  0.5E-15\n  1.0E-04\n  CAR\n unknown system\n')
+            DOSCAR_file.write(block_header)
+            np.savetxt(DOSCAR_file, np.column_stack([self.energies] + columns), fmt='%12.4E')
+
+            if projected_columns is not None:
+                for _ in range(n_atoms):
+                    DOSCAR_file.write(block_header)
+                    np.savetxt(DOSCAR_file, np.column_stack([self.energies] + projected_columns), fmt='%12.4E')
+        return file_name
+
+    def test_band_gap(self):
+        """Checks the band gap and band edges, with the projected densities of states of each atom.
+        """
+
+        file_name = self._write_doscar([self.dos, self.integrated_dos], projected_columns=[self.dos / 3] * 3)
+        dos = read_doscar(file_name, projected=True)
+
+        self.assertEqual(dos['fermi_energy'], 0.1)
+        self.assertEqual(dos['total_dos'].shape, (101, 1))
+        self.assertEqual(dos['projected_dos'].shape, (2, 101, 3))
+
+        band_gap, valence_band, conduction_band = get_band_gap(dos['energies'], dos['integrated_dos'],
+                                                               dos['fermi_energy'])
+        self.assertAlmostEqual(valence_band,    -0.5)
+        self.assertAlmostEqual(conduction_band,  1.3)
+        self.assertAlmostEqual(band_gap,         1.8)
+
+    def test_spin_polarized(self):
+        """Checks that both spin channels are read and added up for the band gap.
+        """
+
+        dos_down = np.where(self.energies < 1.05, self.dos, 1.0)  # Smaller gap for the spin-down channel
+
+        file_name = self._write_doscar([self.dos, dos_down, self.integrated_dos, np.cumsum(dos_down) * 0.1])
+        dos = read_doscar(file_name)
+
+        self.assertEqual(dos['integrated_dos'].shape, (101, 2))
+        self.assertIsNone(dos['projected_dos'])
+
+        self.assertAlmostEqual(get_band_gap(dos['energies'], dos['integrated_dos'][:, 0], dos['fermi_energy'])[0], 1.8)
+        self.assertAlmostEqual(get_band_gap(dos['energies'], dos['integrated_dos'],       dos['fermi_energy'])[0], 1.6)
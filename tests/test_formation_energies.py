@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.convex_hull import load_formation_energies
+
+# Table of total energies of the phases, for two functionals
+chemical_potentials_text = """element nfu total_energy_PS_D3 total_energy_HSE06
+Bi     2  -8.0   -9.0
+S      32 -130.0 -140.0
+I      8  -12.0  -13.0
+BiSI   4  -60.0  -70.0
+Bi2S3  4  -90.0  -100.0
+"""
+
+class TestFormationEnergies(unittest.TestCase):
+    """Class for testing the computation of formation energies from a table of total energies.
+    """
+
+    def setUp(self):
+        """Writes the table in a temporary folder.
+        """
+
+        self.folder = tempfile.TemporaryDirectory()
+
+        self.file_name = os.path.join(self.folder.name, 'chemical_potentials.txt')
+        with open(self.file_name, 'w') as table_file:
+            table_file.write(chemical_potentials_text)
+
+    def tearDown(self):
+        """Removes the temporary folder.
+        """
+
+        self.folder.cleanup()
+
+    def test_formation_energies(self):
+        """Checks the formation energies (eV/atom) of the elements and compounds for each functional.
+        """
+
+        energies = load_formation_energies(self.file_name, 'PS_D3')
+
+        np.testing.assert_allclose(energies.loc['BiSI', 'energy'], -15)
+        np.testing.assert_allclose(energies['formation_energy'], [0, 0, 0, (-15 + 4 + 4.0625 + 1.5) / 3,
+                                                                  (-22.5 + 8 + 3 * 4.0625) / 5])
+
+        energies = load_formation_energies(self.file_name, 'HSE06')
+        np.testing.assert_allclose(energies.loc['BiSI', 'formation_energy'], (-17.5 + 4.5 + 4.375 + 1.625) / 3)
+
+    def test_missing_reference(self):
+        """Checks that phases without the energy of their elements are rejected.
+        """
+
+        with open(self.file_name, 'a') as table_file:
+            table_file.write('BiSeI  4  -62.0  -72.0\n')
+        self.assertRaises(ValueError, load_formation_energies, self.file_name, 'PS_D3')
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.grid  import iterate_grid, get_grid, count_grid_points, evaluate_chunks, save_chunks
+from libraries.utils import Limits
+
+class TestGrid(unittest.TestCase):
+    """Class for testing the streaming generation of composition grids.
+    """
+
+    def test_nested_loops(self):
+        """Checks that the grid follows the order of nested loops over the axes.
+        """
+
+        precision = 0.05
+        x_grid = np.arange(0, 1+precision, precision)
+
+        xyz_grid = []
+        for i in x_grid:
+            for j in x_grid:
+                for k in x_grid:
+                    xyz_grid.append([i, j, k])
+
+        np.testing.assert_array_equal(get_grid(3, precision), xyz_grid)
+
+    def test_chunks(self):
+        """Checks that chunks are contiguous, bounded in size and cover the whole grid.
+        """
+
+        chunks = list(iterate_grid(2, 0.1, lower=-1, upper=1, chunk_size=50))
+
+        self.assertTrue(all(len(chunk) <= 50 and chunk.flags['C_CONTIGUOUS'] for chunk in chunks))
+        self.assertEqual(sum(len(chunk) for chunk in chunks), count_grid_points(2, 0.1, lower=-1, upper=1))
+        np.testing.assert_array_equal(np.concatenate(chunks), get_grid(2, 0.1, lower=-1, upper=1))
+
+    def test_simplex(self):
+        """Checks that the simplex restriction keeps the points with fractions adding up to one, at most.
+        """
+
+        simplex_grid = get_grid(3, 0.25, simplex=True)
+
+        self.assertEqual(len(simplex_grid), 35)
+        self.assertTrue(np.all(np.sum(simplex_grid, axis=1) <= 1 + 1e-12))
+
+    def test_pipeline(self):
+        """Checks that the evaluated points within the limits are written to a file.
+        """
+
+        limits = Limits()
+        limits.upper = 1
+
+        chunks = iterate_grid(2, 0.25, chunk_size=7)
+        valid  = evaluate_chunks(chunks, lambda chunk: np.sum(chunk, axis=1), limits=limits)
+
+        with tempfile.TemporaryDirectory() as folder:
+            file_name = os.path.join(folder, 'results.txt')
+            n_rows  = save_chunks(valid, file_name)
+            results = np.loadtxt(file_name)
+
+        self.assertEqual(n_rows, 15)
+        np.testing.assert_array_equal(results[:, :2], get_grid(2, 0.25, simplex=True))
+        np.testing.assert_array_equal(results[:, 2], np.sum(results[:, :2], axis=1))
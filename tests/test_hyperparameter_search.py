@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.hyperparameter_search import search_hyperparameters, sample_configurations, _run_network_fold
+from libraries.models                import initialize_model
+
+class TestHyperparameterSearch(unittest.TestCase):
+    """Class for testing the search of hyperparameters by successive halving.
+    """
+
+    def setUp(self):
+        """Defines a smooth property over the (x, y, z) compositions.
+        """
+
+        rng = np.random.default_rng(0)
+        self.X = rng.random((60, 3))
+        self.y = 1 + 2 * self.X[:, 0] - self.X[:, 1] * self.X[:, 2]
+
+    def test_sampling(self):
+        """Checks that sampled configurations are different and limited to the size of the search space.
+        """
+
+        configurations = sample_configurations('Random Forest', 20, random_state=0)
+
+        self.assertEqual(len(configurations), 20)
+        self.assertEqual(len({tuple(configuration.items()) for configuration in configurations}), 20)
+        self.assertEqual(len(sample_configurations('Random Forest', 1000)), 4 * 3 * 3 * 2 * 2)
+
+    def test_successive_halving(self):
+        """Checks the rounds of the search, that the best configuration is the best of the last round,
+        and that cached trials are reused.
+        """
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            options = dict(n_configurations=9, eta=3, min_budget=5, max_budget=45, n_splits=3, n_jobs=2,
+                           cache_directory=cache_directory)
+            result = search_hyperparameters('Random Forest', self.X, self.y, **options)
+
+            budgets = [trial['budget'] for trial in result['trials']]
+            self.assertEqual(budgets, [5] * 9 + [15] * 3 + [45])
+            self.assertEqual(result['score'], result['trials'][-1]['score'])
+            self.assertEqual(result['parameters']['n_estimators'], 45)
+            initialize_model('Random Forest', **result['parameters'])
+
+            n_entries = len(os.listdir(cache_directory))
+            self.assertEqual(search_hyperparameters('Random Forest', self.X, self.y, **options), result)
+            self.assertEqual(len(os.listdir(cache_directory)), n_entries)
+
+    def test_early_stopping(self):
+        """Checks that networks stop when their validation error does not improve, and that the test set is not
+        used to choose the stopping epoch (corrupting its targets only changes the reported error).
+        """
+
+        split = (np.arange(40), np.arange(40, 60))
+        parameters = {'hidden_layer_sizes': (8,), 'learning_rate_init': 0.1, 'random_state': 0}
+
+        error, epoch = _run_network_fold(split, self.X, self.y, parameters, 5000, 5, 3, random_state=0)
+
+        y_corrupted = self.y.copy()
+        y_corrupted[split[1]] = np.random.default_rng(1).normal(size=len(split[1]))
+        corrupted_error, corrupted_epoch = _run_network_fold(split, self.X, y_corrupted, parameters, 5000, 5, 3,
+                                                             random_state=0)
+
+        self.assertTrue(np.isfinite(error))
+        self.assertLess(epoch, 5000)
+        self.assertEqual(corrupted_epoch, epoch)
+        self.assertGreater(corrupted_error, error)
+
+    def test_network_search(self):
+        """Checks that the number of epochs of the best network is within the budget.
+        """
+
+        result = search_hyperparameters('Convolutional Neural Network', self.X, self.y, n_configurations=4, eta=2,
+                                        min_budget=10, max_budget=20, n_splits=2, n_jobs=1, check_every=5)
+
+        self.assertEqual(len(result['trials']), 4 + 2)
+        self.assertLessEqual(result['parameters']['max_iter'], 20)
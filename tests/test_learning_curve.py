@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+import matplotlib
+
+matplotlib.use('Agg')
+
+from sklearn.ensemble         import RandomForestRegressor
+from sklearn.neural_network   import MLPRegressor
+from sklearn.model_selection  import KFold, learning_curve
+from libraries.utils          import compute_learning_curve, plot_learning_curve
+
+class TestLearningCurve(unittest.TestCase):
+    """Class for testing the computation and caching of learning curves, apart from their plotting.
+    """
+
+    def setUp(self):
+        """Defines a smooth property over the (x, y, z) compositions.
+        """
+
+        rng = np.random.default_rng(0)
+        self.X  = rng.random((60, 3))
+        self.y  = 1 + 2 * self.X[:, 0] - self.X[:, 1] * self.X[:, 2]
+        self.cv = KFold(n_splits=3, shuffle=True, random_state=0)
+
+    def test_sklearn_arrays(self):
+        """Checks that the arrays are those of sklearn's learning_curve.
+        """
+
+        estimator = RandomForestRegressor(n_estimators=10, random_state=0)
+
+        curve = compute_learning_curve(estimator, self.X, self.y, cv=self.cv, n_jobs=1)
+        train_sizes, train_scores, test_scores = learning_curve(estimator, self.X, self.y, cv=self.cv, n_jobs=1)
+
+        np.testing.assert_array_equal(curve['train_sizes'], train_sizes)
+        np.testing.assert_allclose(curve['train_scores'], train_scores)
+        np.testing.assert_allclose(curve['test_scores'], test_scores)
+        self.assertEqual(curve['fit_times'].shape, test_scores.shape)
+
+    def test_cache(self):
+        """Checks that cached curves are reused, and that incremental training is used when requested.
+        """
+
+        estimator = MLPRegressor(hidden_layer_sizes=(8,), random_state=0)
+        splits    = list(self.cv.split(self.X))
+
+        with tempfile.TemporaryDirectory() as cache_directory:
+            curve = compute_learning_curve(estimator, self.X, self.y, cv=iter(splits), n_jobs=1,
+                                           incremental=True, cache_directory=cache_directory)
+            self.assertEqual(len(os.listdir(cache_directory)), 1)
+
+            cached = compute_learning_curve(estimator, self.X, self.y, cv=iter(splits), n_jobs=1,
+                                            incremental=True, cache_directory=cache_directory)
+            self.assertEqual(len(os.listdir(cache_directory)), 1)
+            np.testing.assert_array_equal(cached['fit_times'], curve['fit_times'])
+
+        _, _, test_scores = learning_curve(estimator, self.X, self.y, cv=splits, n_jobs=1,
+                                           exploit_incremental_learning=True)
+        np.testing.assert_allclose(curve['test_scores'], test_scores)
+
+    def test_plot_wrapper(self):
+        """Checks that the plotting wrapper saves the figure and returns the computed arrays.
+        """
+
+        estimator = RandomForestRegressor(n_estimators=10, random_state=0)
+
+        with tempfile.TemporaryDirectory() as folder:
+            figure_name = os.path.join(folder, 'learning_curve.pdf')
+            train_sizes, train_scores, test_scores = plot_learning_curve(estimator, figure_name, self.X, self.y,
+                                                                         cv=self.cv, n_jobs=1)
+            self.assertTrue(os.path.exists(figure_name))
+
+        curve = compute_learning_curve(estimator, self.X, self.y, cv=self.cv, n_jobs=1)
+        np.testing.assert_allclose(test_scores, curve['test_scores'])
+        self.assertEqual(len(train_sizes), 5)
+
+    def test_network_refitted(self):
+        """Checks that networks are refitted at each train size by default, as in sklearn's learning_curve.
+        """
+
+        estimator = MLPRegressor(hidden_layer_sizes=(8,), max_iter=300, random_state=0)
+
+        with tempfile.TemporaryDirectory() as folder:
+            _, train_scores, test_scores = plot_learning_curve(estimator, os.path.join(folder, 'curve.png'),
+                                                               self.X, self.y, cv=self.cv, n_jobs=1)
+
+        _, expected_train, expected_test = learning_curve(estimator, self.X, self.y, cv=self.cv, n_jobs=1)
+        np.testing.assert_allclose(train_scores, expected_train)
+        np.testing.assert_allclose(test_scores, expected_test)
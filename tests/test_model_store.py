@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.models import ModelStore, initialize_model, get_model_parameters
+
+class TestModelStore(unittest.TestCase):
+    """Class for testing the storage and warm-start loading of fitted models.
+    """
+
+    def setUp(self):
+        """Creates an empty store in a temporary folder and some training data.
+        """
+
+        self.folder = tempfile.TemporaryDirectory()
+        self.store  = ModelStore(self.folder.name)
+
+        rng = np.random.default_rng(0)
+        self.X = rng.random((40, 3))
+        self.y = self.X @ [1, -2, 0.5]
+
+    def tearDown(self):
+        """Removes the temporary folder.
+        """
+
+        self.folder.cleanup()
+
+    def n_models(self):
+        """Number of models in the store.
+        """
+
+        return len([file_name for file_name in os.listdir(self.folder.name) if file_name.endswith('.pkl')])
+
+    def test_initialize_model(self):
+        """Checks the default and overridden hyperparameters.
+        """
+
+        model = initialize_model('Random Forest', n_estimators=10)
+
+        self.assertEqual(model.n_estimators, 10)
+        self.assertEqual(get_model_parameters('Convolutional Neural Network')['hidden_layer_sizes'], (32, 32))
+        with self.assertRaises(ValueError):
+            initialize_model('Linear Regression')
+
+    def test_warm_start(self):
+        """Checks that a model trained with the same data and hyperparameters is loaded, not refitted.
+        """
+
+        model  = self.store.load_or_fit('Random Forest', self.X, self.y, target='band_gap', n_estimators=5)
+        loaded = self.store.load_or_fit('Random Forest', self.X, self.y, target='band_gap', n_estimators=5, n_jobs=1)
+
+        self.assertEqual(self.n_models(), 1)
+        self.assertEqual(loaded.target, 'band_gap')
+        np.testing.assert_array_equal(loaded.predict(self.X), model.predict(self.X))
+
+    def test_refit(self):
+        """Checks that models are refitted when the data or the hyperparameters change.
+        """
+
+        self.store.load_or_fit('Random Forest', self.X, self.y, n_estimators=5)
+        self.store.load_or_fit('Random Forest', self.X, self.y, n_estimators=6)
+        self.store.load_or_fit('Random Forest', self.X, 2 * self.y, n_estimators=5)
+
+        self.assertEqual(self.n_models(), 3)
@@ -0,0 +1,92 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.vasp_io import read_outcar_phonons, read_outcar_elapsed_time
+
+# Excerpt of the OUTCAR of a finite-differences calculation (IBRION = 6, NWRITE = 3)
+outcar_text = """ running on    4 total cores
+ Eigenvectors and eigenvalues of the dynamical matrix
+ ----------------------------------------------------
+
+
+   1 f  =    7.012345 THz    44.059723 2PiTHz  233.905617 cm-1    29.000832 meV
+             X         Y         Z           dx          dy          dz
+      0.000000  0.000000  0.000000     0.707107    0.000000    0.000000
+
+   2 f  =    3.456789 THz    21.719800 2PiTHz  115.305000 cm-1    14.296300 meV
+             X         Y         Z           dx          dy          dz
+      0.000000  0.000000  0.000000     0.000000    0.707107    0.000000
+
+   3 f/i=    0.123456 THz     0.775696 2PiTHz    4.118000 cm-1     0.510600 meV
+             X         Y         Z           dx          dy          dz
+      0.000000  0.000000  0.000000     0.000000    0.000000    0.707107
+
+ Eigenvectors after division by SQRT(mass)
+
+   1 f  =    7.012345 THz    44.059723 2PiTHz  233.905617 cm-1    29.000832 meV
+   2 f  =    3.456789 THz    21.719800 2PiTHz  115.305000 cm-1    14.296300 meV
+   3 f/i=    0.123456 THz     0.775696 2PiTHz    4.118000 cm-1     0.510600 meV
+
+ General timing and accounting informations for this job:
+ ========================================================
+
+                  Total CPU time used (sec):     1234.567
+                            User time (sec):     1200.000
+                          System time (sec):       34.567
+                         Elapsed time (sec):     1250.125
+"""
+
+class TestOutcar(unittest.TestCase):
+    """Class for testing the reading of phonon frequencies and timing from OUTCAR files.
+    """
+
+    def setUp(self):
+        """Writes a finished and an unfinished OUTCAR in a temporary folder.
+        """
+
+        self.folder = tempfile.TemporaryDirectory()
+
+        self.finished = os.path.join(self.folder.name, 'OUTCAR')
+        with open(self.finished, 'w') as outcar_file:
+            outcar_file.write(outcar_text)
+
+        self.unfinished = os.path.join(self.folder.name, 'OUTCAR_unfinished')
+        with open(self.unfinished, 'w') as outcar_file:
+            outcar_file.write(outcar_text.split(' Eigenvectors after')[0])
+
+    def tearDown(self):
+        """Removes the temporary folder.
+        """
+
+        self.folder.cleanup()
+
+    def test_phonons(self):
+        """Checks that the frequencies of the first block are split into real and imaginary ones.
+        """
+
+        real, imaginary = read_outcar_phonons(self.finished)
+
+        np.testing.assert_array_equal(real,      [29.000832, 14.2963])
+        np.testing.assert_array_equal(imaginary, [0.5106])
+        self.assertEqual(np.min(real), 14.2963)  # Compared numerically, not as strings
+
+    def test_elapsed_time(self):
+        """Checks the elapsed time of finished and unfinished calculations.
+        """
+
+        self.assertEqual(read_outcar_elapsed_time(self.finished), 1250.125)
+        self.assertIsNone(read_outcar_elapsed_time(self.unfinished))
+
+    def test_empty_file(self):
+        """Checks that empty files are read as unfinished calculations.
+        """
+
+        empty = os.path.join(self.folder.name, 'OUTCAR_empty')
+        open(empty, 'w').close()
+
+        real, imaginary = read_outcar_phonons(empty)
+        self.assertEqual((len(real), len(imaginary)), (0, 0))
+        self.assertIsNone(read_outcar_elapsed_time(empty))
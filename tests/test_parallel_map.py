@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+import unittest
+import numpy as np
+
+from libraries.parallel import parallel_map, split_in_chunks
+
+
+def weighted_sum(chunk, weights, offset=0):
+    """Function to be mapped, using shared arguments.
+    """
+
+    return chunk @ weights + offset
+
+
+class TestParallelMap(unittest.TestCase):
+    """Class for testing the parallel map with shared arguments.
+    """
+
+    def setUp(self):
+        """Defines the data to be split and the shared arguments.
+        """
+
+        self.data   = np.arange(300, dtype=float).reshape(100, 3)
+        self.shared = {'weights': np.array([1, 2, 3]), 'offset': 1}
+
+    def test_chunks(self):
+        """Checks that the chunks cover the array in order.
+        """
+
+        chunks = split_in_chunks(self.data, 7)
+
+        self.assertEqual(len(chunks), 15)
+        np.testing.assert_array_equal(np.concatenate(chunks), self.data)
+
+    def test_order(self):
+        """Checks that the results keep the order of the items.
+        """
+
+        chunks  = split_in_chunks(self.data, 7)
+        results = parallel_map(weighted_sum, chunks, shared=self.shared, n_jobs=2, chunksize=2)
+
+        np.testing.assert_array_equal(np.concatenate(results), self.data @ [1, 2, 3] + 1)
+
+    def test_serial(self):
+        """Checks that the serial and parallel executions agree.
+        """
+
+        chunks   = split_in_chunks(self.data, 10)
+        serial   = parallel_map(weighted_sum, chunks, shared=self.shared, n_jobs=1)
+        parallel = parallel_map(weighted_sum, chunks, shared=self.shared, n_jobs=3)
+
+        np.testing.assert_array_equal(np.concatenate(serial), np.concatenate(parallel))
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+import unittest
+import numpy as np
+
+from libraries.utils import parse_formula, get_composition_matrix
+
+class TestParseFormula(unittest.TestCase):
+    """Class for testing the parsing of chemical formulas into elements and amounts.
+    """
+
+    def test_integer_amounts(self):
+        """Checks formulas with implicit and multi-digit amounts, as in composition_concentration.
+        """
+
+        elements, amounts = parse_formula('A3B12CDe32')
+
+        self.assertEqual(elements, ('A', 'B', 'C', 'De'))
+        np.testing.assert_array_equal(amounts, [3, 12, 1, 32])
+
+    def test_fractional_amounts(self):
+        """Checks fractional amounts and white spaces.
+        """
+
+        elements, amounts = parse_formula('Bi0.5 Sb.5 S Se0.25I2')
+
+        self.assertEqual(elements, ('Bi', 'Sb', 'S', 'Se', 'I'))
+        np.testing.assert_array_equal(amounts, [0.5, 0.5, 1, 0.25, 2])
+
+    def test_repeated_elements(self):
+        """Checks that repeated elements are added up and that memoized results cannot be modified.
+        """
+
+        elements, amounts = parse_formula('CH3COOH')
+
+        self.assertEqual(elements, ('C', 'H', 'O'))
+        np.testing.assert_array_equal(amounts, [2, 4, 2])
+        self.assertFalse(amounts.flags.writeable)
+        self.assertIs(parse_formula('CH3COOH')[1], amounts)
+
+    def test_composition_matrix(self):
+        """Checks the composition matrix for a given ordering of the elements, and unknown elements.
+        """
+
+        elements, matrix = get_composition_matrix(['BiSI', 'Sb2S3', 'Bi0.5Sb0.5SBr'], ['Bi', 'Sb', 'S', 'I', 'Br'])
+
+        self.assertEqual(elements, ['Bi', 'Sb', 'S', 'I', 'Br'])
+        np.testing.assert_array_equal(matrix, [[1,   0,   1, 1, 0],
+                                               [0,   2,   3, 0, 0],
+                                               [0.5, 0.5, 1, 0, 1]])
+
+        self.assertEqual(get_composition_matrix(['SbI3', 'BiI3'])[0], ['Sb', 'I', 'Bi'])
+        self.assertRaises(ValueError, get_composition_matrix, ['BiSeI'], ['Bi', 'S', 'I'])
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.pipeline import train_targets, save_property_table, load_property_table
+from libraries.grid     import iterate_grid, get_grid
+
+class TestPipeline(unittest.TestCase):
+    """Class for testing the multi-target training and prediction.
+    """
+
+    def setUp(self):
+        """Writes the data files of two targets in a temporary folder.
+        """
+
+        self.folder = tempfile.TemporaryDirectory()
+
+        rng = np.random.default_rng(0)
+        X = rng.random((30, 3))
+        np.savetxt(os.path.join(self.folder.name, 'band_gap.txt'),  np.column_stack([X, 1 + X[:, 0]]))
+        np.savetxt(os.path.join(self.folder.name, 'energy_PS.txt'), np.column_stack([X, -40 - 4 * X[:, 1]]))
+
+    def tearDown(self):
+        """Removes the temporary folder.
+        """
+
+        self.folder.cleanup()
+
+    def test_train_targets(self):
+        """Checks that one model is fitted per target, with the units of the notebooks.
+        """
+
+        surrogates = train_targets(['band_gap', 'energy_PS'], self.folder.name, 'Random Forest', n_jobs=2,
+                                   n_estimators=5, random_state=0)
+
+        self.assertEqual(list(surrogates), ['band_gap', 'energy_PS'])
+        self.assertEqual(surrogates['energy_PS'].target, 'energy_PS')
+        self.assertTrue(np.all(surrogates['energy_PS'].predict([[0.5, 0.5, 0.5]]) > -11.1))
+
+    def test_property_table(self):
+        """Checks that the table contains the predictions of every target over the whole grid.
+        """
+
+        surrogates = train_targets(['band_gap', 'energy_PS'], self.folder.name, 'Random Forest', n_jobs=1,
+                                   n_estimators=5, random_state=0)
+
+        file_name = os.path.join(self.folder.name, 'properties.csv')
+        n_rows = save_property_table(surrogates, iterate_grid(3, 0.25, chunk_size=20), file_name)
+        table  = load_property_table(file_name)
+
+        self.assertEqual(n_rows, 125)
+        self.assertEqual(list(table.columns), ['band_gap', 'energy_PS'])
+        np.testing.assert_allclose(table['band_gap'].values, surrogates['band_gap'].predict(get_grid(3, 0.25)))
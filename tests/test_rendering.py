@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.rendering import decimate_points, get_color_limits, render_figures
+
+class TestRendering(unittest.TestCase):
+    """Class for testing the parallel rendering of figures.
+    """
+
+    def setUp(self):
+        """Defines a property over random compositions and over a ternary grid.
+        """
+
+        rng = np.random.default_rng(0)
+        self.points = rng.random((5000, 3))
+        self.values = np.sum(self.points, axis=1)
+
+        axis = np.linspace(0, 1, 30)
+        self.X, self.Y = np.meshgrid(axis, axis)
+        self.Z = np.where(self.Y < np.sqrt(3) * np.minimum(self.X, 1 - self.X), self.X * self.Y, np.nan)
+
+    def test_decimation(self):
+        """Checks that one point is kept per occupied voxel.
+        """
+
+        points  = np.array([[0.01, 0.01], [0.02, 0.03], [0.6, 0.1], [0.61, 0.12], [1, 1]])
+        indexes = decimate_points(points, resolution=10)
+
+        np.testing.assert_array_equal(indexes, [0, 2, 4])
+        np.testing.assert_array_equal(decimate_points(self.points, resolution=1), [0])
+
+    def test_color_limits(self):
+        """Checks that the limits of the colorbar are rounded outwards to the scale factor.
+        """
+
+        values = np.array([0.12, 0.3, 0.47])
+
+        np.testing.assert_allclose(get_color_limits(values, scale_factor=1e-1), [0.1, 0.5])
+        np.testing.assert_allclose(get_color_limits(values), [0, 1])
+        np.testing.assert_allclose(get_color_limits(values, vmin=-1, scale_factor=1e-1), [-1, 0.5])
+
+    def test_render_figures(self):
+        """Checks that figures are rendered in parallel, and that rasterizing the points reduces vector files.
+        """
+
+        with tempfile.TemporaryDirectory() as folder:
+            jobs = [
+                {'kind': 'scatter', 'file_name': f'{folder}/vector.pdf', 'points': self.points,
+                 'values': self.values, 'rasterized': False},
+                {'kind': 'scatter', 'file_name': f'{folder}/rasterized.pdf', 'points': self.points,
+                 'values': self.values, 'highlight': self.values > 2.5, 'highlight_label': 'Highlighted'},
+                {'kind': 'scatter', 'file_name': f'{folder}/decimated.png', 'points': self.points,
+                 'values': self.values, 'decimation': 10},
+                {'kind': 'ternary', 'file_name': f'{folder}/ternary.eps', 'X': self.X, 'Y': self.Y, 'Z': self.Z,
+                 'labels': {'Sb': (0, 0)}, 'lines': [((0, 1), (0, 0))], 'bar_name': 'Energy'}
+            ]
+
+            file_names = render_figures(jobs, n_jobs=2)
+
+            self.assertEqual(file_names, [job['file_name'] for job in jobs])
+            self.assertTrue(all(os.path.getsize(file_name) > 0 for file_name in file_names))
+            self.assertLess(os.path.getsize(f'{folder}/rasterized.pdf'), os.path.getsize(f'{folder}/vector.pdf') / 5)
+
+    def test_unknown_figure(self):
+        """Checks that unknown kinds of figures are not allowed.
+        """
+
+        with self.assertRaises(ValueError):
+            render_figures([{'kind': 'histogram', 'file_name': 'histogram.pdf'}], n_jobs=1)
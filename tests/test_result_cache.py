@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy  as np
+import pandas as pd
+
+from libraries.cache import ResultCache, get_fingerprint
+
+class TestResultCache(unittest.TestCase):
+    """Class for testing the content-addressed cache of results.
+    """
+
+    def setUp(self):
+        """Creates an empty cache in a temporary folder.
+        """
+
+        self.folder = tempfile.TemporaryDirectory()
+        self.cache  = ResultCache(self.folder.name)
+
+    def tearDown(self):
+        """Removes the temporary folder.
+        """
+
+        self.folder.cleanup()
+
+    def test_fingerprint(self):
+        """Checks that fingerprints depend on the content, but not on the order of dictionaries.
+        """
+
+        energies = pd.DataFrame([0, -0.3], columns=['formation_energy'], index=['A', 'AB'])
+
+        self.assertEqual(get_fingerprint({'a': 1, 'b': np.arange(3)}), get_fingerprint({'b': np.arange(3), 'a': 1}))
+        self.assertNotEqual(get_fingerprint(np.arange(3)), get_fingerprint(np.arange(3, dtype=float)))
+        self.assertNotEqual(get_fingerprint(energies), get_fingerprint(energies * 2))
+
+    def test_round_trip(self):
+        """Checks that stored arrays are loaded back, and that other inputs are not found.
+        """
+
+        key = self.cache.get_key(grid=np.arange(4), flag='PS')
+        self.cache.save(key, results=np.ones((2, 3)))
+
+        np.testing.assert_array_equal(self.cache.load(key)['results'], np.ones((2, 3)))
+        self.assertIsNone(self.cache.load(self.cache.get_key(grid=np.arange(4), flag='PS_D3')))
+
+    def test_get_or_compute(self):
+        """Checks that results are computed only once for the same inputs.
+        """
+
+        calls = []
+        def function(value):
+            calls.append(value)
+            return {'results': np.full(3, value)}
+
+        for _ in range(2):
+            arrays = self.cache.get_or_compute(function, {'value': 2}, 2)
+
+        self.assertEqual(calls, [2])
+        np.testing.assert_array_equal(arrays['results'], [2, 2, 2])
+
+    def test_eviction(self):
+        """Checks that the least recently used entries are removed when exceeding the maximum size.
+        """
+
+        self.cache.save('old', results=np.zeros(1000))
+        os.utime(os.path.join(self.folder.name, 'old.npz'), (0, 0))
+
+        self.cache.max_size = 10000
+        self.cache.save('new', results=np.zeros(1000))
+
+        self.assertIsNone(self.cache.load('old'))
+        self.assertIsNotNone(self.cache.load('new'))
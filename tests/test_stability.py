@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+import unittest
+import numpy as np
+
+from libraries.stability import StabilityHull, get_amounts
+
+class TestStability(unittest.TestCase):
+    """Class for testing the batched computation of energies above the convex hull.
+    """
+
+    def setUp(self):
+        """Defines a binary system A-B with one stable and one unstable compound.
+        """
+
+        self.hull = StabilityHull({
+            'A':   -1,
+            'B':   -2,
+            'AB':  -4,
+            'A3B': -4
+        })
+
+    def test_stable_phases(self):
+        """Checks that the unstable compound is not part of the hull.
+        """
+
+        self.assertEqual(sorted(self.hull.stable_phases), ['A', 'AB', 'B'])
+
+    def test_amounts(self):
+        """Checks the conversion from mixing fractions to amounts of each element.
+        """
+
+        amounts = get_amounts([[0.25, 1]], sublattices=(('A', 'B'), ('C', 'D')))
+
+        np.testing.assert_allclose(amounts, [[0.25, 0.75, 1, 0]])
+
+    def test_hull_energies(self):
+        """Checks the energy of the hull at and between the stable phases.
+        """
+
+        energies = self.hull.get_hull_energies([[1, 0], [1, 1], [3, 1], [1, 3]])
+
+        np.testing.assert_allclose(energies, [-1, -2, -1.5, -2])
+
+    def test_e_above_hull(self):
+        """Checks energies above and below the hull, for formula units of different size.
+        """
+
+        amounts = get_amounts([[0.75], [0.5]], sublattices=(('A', 'B'),), elements=self.hull.elements)
+        e_above_hull = self.hull.get_e_above_hull(amounts, [-1, -2.5])
+
+        np.testing.assert_allclose(e_above_hull, [0.5, -0.5])
+
+    def test_decomposition(self):
+        """Checks the decomposition into the phases of the hull.
+        """
+
+        decomposition = self.hull.get_decomposition([[3, 1]])[0]
+
+        self.assertEqual(sorted(decomposition), ['A', 'AB'])
+        self.assertAlmostEqual(decomposition['A'],  0.5)
+        self.assertAlmostEqual(decomposition['AB'], 0.5)
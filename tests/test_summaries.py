@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.summaries import summarize_calculations, summarize_campaign, write_table
+
+class TestSummaries(unittest.TestCase):
+    """Class for testing the summary of the calculations of many systems.
+    """
+
+    def setUp(self):
+        """Creates the folders of the convergence tests and relaxations of two systems in a temporary folder.
+        """
+
+        self.root = tempfile.TemporaryDirectory()
+
+        ionic_step = '   1 F= -.35010306E+03 E0= -.35009999E+03  d E =-.350103E+03\n'
+        electronic_step = 'DAV:   1    -0.35E+03   -0.35E+03   -0.1E+04  3600   0.1E+03\n'
+        contcar = 'BiSI\n 1.0\n 8.1 0.0 0.0\n 0.0 4.2 0.0\n 0.0 0.0 11.3\n'
+
+        self._write('BiSI/convergence/500eV_4KP/OSZICAR', electronic_step + ionic_step)
+        self._write('BiSI/convergence/600eV_6KP/OSZICAR', electronic_step)
+        self._write('BiSI/relaxation/PS+D3/CONTCAR',      contcar)
+        self._write('SbSI/convergence/500eV_4KP/OSZICAR', ionic_step)
+        os.makedirs(os.path.join(self.root.name, 'SbSI/convergence/600eV_6KP'))
+
+    def tearDown(self):
+        """Removes the temporary folder.
+        """
+
+        self.root.cleanup()
+
+    def _write(self, file_name, text):
+        """Writes a file within the temporary folder, creating its directories.
+
+        Args:
+            file_name (str): Path of the file, relative to the temporary folder.
+            text      (str): Content of the file.
+        """
+
+        file_name = os.path.join(self.root.name, file_name)
+        os.makedirs(os.path.dirname(file_name), exist_ok=True)
+        with open(file_name, 'w') as output_file:
+            output_file.write(text)
+
+    def test_calculations(self):
+        """Checks the records of the convergence tests of one system.
+        """
+
+        records = summarize_calculations(os.path.join(self.root.name, 'BiSI/convergence'), 'convergence', 'PS+D3')
+
+        self.assertEqual([record['status'] for record in records], ['finished', 'not-converged'])
+        self.assertEqual((records[0]['E_cutoff'], records[0]['KPoints'], records[0]['energy']), (500, 4, -350.10306))
+
+    def test_campaign(self):
+        """Checks the status of every calculation of the campaign, including missing ones.
+        """
+
+        summary = summarize_campaign(['*SI'], ['convergence', 'relaxation'], 'PS+D3', root=self.root.name, n_jobs=4)
+
+        self.assertEqual(list(summary['system']),      ['BiSI'] * 3 + ['SbSI'] * 3)
+        self.assertEqual(list(summary['calculation']), (['convergence'] * 2 + ['relaxation']) * 2)
+        self.assertEqual(list(summary['status']),      ['finished', 'not-converged', 'finished',
+                                                        'finished', 'missing', 'missing'])
+        np.testing.assert_allclose(summary['a'][2], 8.1)
+
+        file_name = os.path.join(self.root.name, 'summary.csv')
+        write_table(summary, file_name)
+        with open(file_name, 'r') as summary_file:
+            self.assertEqual(len(summary_file.readlines()), 7)
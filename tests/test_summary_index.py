@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+
+from libraries.summaries     import summarize_calculations
+from libraries.summary_index import SummaryIndex
+
+class TestSummaryIndex(unittest.TestCase):
+    """Class for testing the incremental summary of calculations with an index of the parsed outputs.
+    """
+
+    def setUp(self):
+        """Creates the folder of a convergence test in a temporary folder.
+        """
+
+        self.root = tempfile.TemporaryDirectory()
+
+        self.dir_path = os.path.join(self.root.name, 'BiSI/convergence')
+        self.oszicar  = os.path.join(self.dir_path, '500eV_4KP/OSZICAR')
+        os.makedirs(os.path.dirname(self.oszicar))
+        self._write_energy('-.35010306E+03')
+
+    def tearDown(self):
+        """Removes the temporary folder.
+        """
+
+        self.root.cleanup()
+
+    def _write_energy(self, energy):
+        """Writes the OSZICAR of the convergence test, with a final ionic step.
+
+        Args:
+            energy (str): Free energy of the ionic step, with the format of the OSZICAR.
+        """
+
+        with open(self.oszicar, 'w') as oszicar_file:
+            oszicar_file.write(f'   1 F= {energy} E0= {energy}  d E =-.350103E+03\n')
+
+    def _summarize(self):
+        """Summarizes the convergence tests with the index of the temporary folder.
+
+        Returns:
+            list: Records of the calculation folders.
+        """
+
+        with SummaryIndex(os.path.join(self.root.name, 'summaries.sqlite')) as index:
+            return summarize_calculations(self.dir_path, 'convergence', 'PS+D3', index=index)
+
+    def test_unchanged_outputs(self):
+        """Checks that outputs with the same modification time and size are not parsed again.
+        """
+
+        self.assertEqual(self._summarize()[0]['energy'], -350.10306)
+
+        stat = os.stat(self.oszicar)
+        self._write_energy('-.35010307E+03')
+        os.utime(self.oszicar, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        self.assertEqual(self._summarize()[0]['energy'], -350.10306)
+
+    def test_modified_outputs(self):
+        """Checks that modified outputs are parsed again.
+        """
+
+        self.assertEqual(self._summarize()[0]['energy'], -350.10306)
+
+        stat = os.stat(self.oszicar)
+        self._write_energy('-.35010307E+03')
+        os.utime(self.oszicar, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        self.assertEqual(self._summarize()[0]['energy'], -350.10307)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+import unittest
+import numpy as np
+
+from sklearn.base     import clone
+from sklearn.ensemble import RandomForestRegressor
+from libraries.cache  import get_fingerprint
+from libraries.models import SurrogateModel, initialize_model
+from libraries.utils  import xy_scaler, y_descaler
+
+class TestSurrogateModel(unittest.TestCase):
+    """Class for testing the model bundled with its fitted scalers.
+    """
+
+    def setUp(self):
+        """Defines a smooth property over the (x, y, z) compositions.
+        """
+
+        rng = np.random.default_rng(0)
+        self.X = rng.random((60, 3))
+        self.y = 1 + 2 * self.X[:, 0] - self.X[:, 1] * self.X[:, 2]
+        self.compositions = rng.random((7, 3))
+
+    def test_scaler_path(self):
+        """Checks that predictions agree with scaling through utils.xy_scaler and utils.y_descaler.
+        """
+
+        X_train, X_test, y_train, y_scaler = xy_scaler(self.X, self.compositions, self.y)
+        estimator = RandomForestRegressor(n_estimators=10, random_state=0).fit(X_train, y_train)
+        expected  = y_descaler([estimator.predict(X_test)], y_scaler)[0]
+
+        model = SurrogateModel(RandomForestRegressor(n_estimators=10, random_state=0), target='band_gap')
+        model.fit(self.X, self.y)
+
+        np.testing.assert_allclose(model.predict(self.compositions), expected)
+
+    def test_single_composition(self):
+        """Checks that single compositions are predicted as in a batch.
+        """
+
+        model = SurrogateModel(RandomForestRegressor(n_estimators=10, random_state=0)).fit(self.X, self.y)
+
+        batch  = model.predict(self.compositions)
+        single = [model.predict([composition])[0] for composition in self.compositions]
+
+        np.testing.assert_allclose(single, batch)
+
+    def test_not_fitted(self):
+        """Checks that predicting before fitting is not allowed.
+        """
+
+        model = SurrogateModel(RandomForestRegressor())
+
+        with self.assertRaises(ValueError):
+            model.predict(self.compositions)
+
+    def test_forest_distribution(self):
+        """Checks that the mean across the trees (from the flat table of leaves) is the prediction of the forest,
+        and that the spread matches the predictions of each tree.
+        """
+
+        model = SurrogateModel(RandomForestRegressor(n_estimators=20, random_state=0)).fit(self.X, self.y)
+
+        mean, std = model.predict_distribution(self.compositions)
+
+        X_scaled = model.X_scaler.transform(self.compositions)
+        trees = np.column_stack([tree.predict(X_scaled) for tree in model.estimator.estimators_])
+        np.testing.assert_allclose(mean, model.predict(self.compositions))
+        np.testing.assert_allclose(std, np.std(trees, axis=1) * model.y_scaler.scale_[0])
+
+    def test_ensemble_distribution(self):
+        """Checks that the bootstrap ensemble predicts its mean, with a spread among its networks.
+        """
+
+        estimator = initialize_model('Bootstrap Ensemble', n_members=4, hidden_layer_sizes=(8,), max_iter=200,
+                                     random_state=0)
+        model = SurrogateModel(estimator).fit(self.X, self.y)
+
+        mean, std = model.predict_distribution(self.compositions)
+
+        np.testing.assert_allclose(mean, model.predict(self.compositions))
+        self.assertTrue(np.all(std > 0))
+
+    def test_ensemble_estimator(self):
+        """Checks that the bootstrap ensemble can be cloned, and that identical ensembles share their fingerprint.
+        """
+
+        estimator = initialize_model('Bootstrap Ensemble', n_members=3, random_state=0)
+        cloned    = clone(estimator)
+
+        self.assertEqual(cloned.get_params(), estimator.get_params())
+        self.assertEqual(get_fingerprint(estimator), get_fingerprint(initialize_model('Bootstrap Ensemble',
+                                                                                      n_members=3, random_state=0)))
+        self.assertNotEqual(get_fingerprint(estimator), get_fingerprint(cloned.set_params(n_members=4)))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.vasp_io import read_last_lines, read_oszicar_energies, read_contcar_lattice
+
+# Excerpt of an OSZICAR with two ionic steps
+oszicar_text = """       N       E                     dE             d eps       ncg     rms          rms(c)
+DAV:   1    -0.350000000000E+03   -0.35000E+03   -0.10000E+04  3600   0.100E+03
+   1 F= -.35010306E+03 E0= -.35009999E+03  d E =-.350103E+03  mag=     0.0000
+DAV:   1    -0.351000000000E+03   -0.10000E+01   -0.20000E+01  3600   0.100E+01
+   2 F= -.35120000E+03 E0= -.35119000E+03  d E =-.110000E+01  mag=     0.0000
+"""
+
+# Header of a CONTCAR, followed by the positions
+contcar_text = """BiSI
+   1.00000000000000
+     8.1000000000000000    0.0000000000000000    0.0000000000000000
+     0.0000000000000000    4.2000000000000002    0.0000000000000000
+     0.0000000000000000    0.0000000000000000   11.3000000000000007
+   Bi   S    I
+     4     4     4
+Direct
+"""
+
+class TestTailReaders(unittest.TestCase):
+    """Class for testing the readers of the last lines of OSZICAR files and the header of CONTCAR files.
+    """
+
+    def setUp(self):
+        """Writes the files in a temporary folder.
+        """
+
+        self.folder = tempfile.TemporaryDirectory()
+
+        self.oszicar = os.path.join(self.folder.name, 'OSZICAR')
+        with open(self.oszicar, 'w') as oszicar_file:
+            oszicar_file.write(oszicar_text + '\n')
+
+        self.contcar = os.path.join(self.folder.name, 'CONTCAR')
+        with open(self.contcar, 'w') as contcar_file:
+            contcar_file.write(contcar_text)
+
+    def tearDown(self):
+        """Removes the temporary folder.
+        """
+
+        self.folder.cleanup()
+
+    def test_last_lines(self):
+        """Checks the last lines for blocks smaller and larger than the lines, ignoring trailing empty lines.
+        """
+
+        expected = oszicar_text.splitlines()[-2:]
+        for block_size in [7, 4096]:
+            self.assertEqual(read_last_lines(self.oszicar, 2, block_size=block_size), expected)
+        self.assertEqual(read_last_lines(self.oszicar, 100), oszicar_text.splitlines())
+
+    def test_oszicar_energies(self):
+        """Checks the energies of the final ionic step, and unfinished steps.
+        """
+
+        self.assertEqual(read_oszicar_energies(self.oszicar), {'F': -351.2, 'E0': -351.19})
+
+        with open(self.oszicar, 'w') as oszicar_file:
+            oszicar_file.write(oszicar_text + 'DAV:   1    -0.352000000000E+03   -0.10000E+01   -0.20000E+01  3600   0.100E+01\n')
+        self.assertIsNone(read_oszicar_energies(self.oszicar))
+        self.assertEqual(read_oszicar_energies(self.oszicar, n_lines=2)['E0'], -351.19)
+
+    def test_contcar_lattice(self):
+        """Checks the scaling factor and lattice vectors, and incomplete headers.
+        """
+
+        scale, lattice = read_contcar_lattice(self.contcar)
+        self.assertEqual(scale, 1)
+        np.testing.assert_allclose(np.diag(lattice), [8.1, 4.2, 11.3])
+
+        open(self.contcar, 'w').close()
+        self.assertRaises(ValueError, read_contcar_lattice, self.contcar)
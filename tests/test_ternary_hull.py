@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+import unittest
+import numpy  as np
+import pandas as pd
+
+from libraries.convex_hull import TernaryHull
+from libraries.utils       import get_convex_hull_energies
+
+class TestTernaryHull(unittest.TestCase):
+    """Class for testing the lower convex hull of a ternary system.
+    """
+
+    def setUp(self):
+        """Defines a ternary system with one phase above the hull.
+        """
+
+        x = 1 / 2
+        y = np.sqrt(3) / 2
+
+        self.pure_elements = {
+            'Se': [0, 0],
+            'Sb': [1, 0],
+            'I':  [x, y]
+        }
+        self.phases = ['SbSeI', 'Sb2Se3', 'SbI3', 'SbSe']
+        self.formation_energies = pd.Series({
+            'Se':      0,
+            'Sb':      0,
+            'I':       0,
+            'SbSeI':  -0.45,
+            'Sb2Se3': -0.35,
+            'SbI3':   -0.3,
+            'SbSe':   -0.1
+        })
+        self.hull = TernaryHull(self.pure_elements, self.phases, self.formation_energies)
+
+    def test_stable_phases(self):
+        """Checks that the phase above the hull is not part of it.
+        """
+
+        self.assertEqual(sorted(self.hull.stable_phases), sorted(['Se', 'Sb', 'I', 'SbSeI', 'Sb2Se3', 'SbI3']))
+
+    def test_vertices(self):
+        """Checks that the hull energy at the stable phases is their formation energy.
+        """
+
+        energies = self.hull.get_energy([[0.5, np.sqrt(3) / 6], [0.4, 0], [1, 0]])
+
+        np.testing.assert_allclose(energies, [-0.45, -0.35, 0], atol=1e-12)
+
+    def test_facet(self):
+        """Checks the phases of the facet containing a point.
+        """
+
+        phases = self.hull.get_facet_phases([[0.3, 0.1], [2, 2]])
+
+        self.assertEqual(sorted(phases[0]), sorted(['Se', 'Sb2Se3', 'SbSeI']))
+        self.assertIsNone(phases[1])
+
+    def test_brute_force(self):
+        """Checks that the hull reproduces the minimum over every triangle of phases.
+        """
+
+        x_grid = np.arange(-0.2, 1.2, 0.01)
+        grid   = np.array([[a, b] for a in x_grid for b in x_grid])
+
+        expected = get_convex_hull_energies(grid, self.hull.coordinates, self.hull.energies)
+        energies = self.hull.get_energy(grid)
+
+        np.testing.assert_allclose(energies, expected, atol=1e-12)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+import unittest
+import tempfile
+import os
+import numpy as np
+
+from libraries.vasp_io import read_xdatcar, read_incar, get_time_axis
+
+# Folder of the XDATCAR and INCAR files
+data_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+class TestXdatcar(unittest.TestCase):
+    """Class for testing the reading of molecular dynamics trajectories and their time axis.
+    """
+
+    def test_xdatcar(self):
+        """Checks the header and configurations of a valid XDATCAR.
+        """
+
+        xdatcar_data = read_xdatcar(os.path.join(data_folder, 'XDATCAR_ok', 'XDATCAR'))
+
+        self.assertEqual(xdatcar_data['species'], ['Li', 'La', 'Zr', 'O'])
+        self.assertEqual(xdatcar_data['counts'],  [110, 48, 32, 192])
+        np.testing.assert_array_equal(xdatcar_data['cell'],  np.diag([13.2, 13.2, 25.3]))
+        np.testing.assert_array_equal(xdatcar_data['steps'], [0, 10])
+
+        positions = xdatcar_data['positions']
+        self.assertEqual((positions.shape, positions.dtype), ((2, 382, 3), np.float32))
+        np.testing.assert_allclose(positions[0, 0],  [0.5, 0, 0.875])
+        np.testing.assert_allclose(positions[1, -1], [0.14757696, 0.27470628, 0.91521662], rtol=1e-6)
+
+    def test_invalid_xdatcar(self):
+        """Checks that XDATCAR files with invalid headers or incomplete configurations are rejected.
+        """
+
+        for folder in ['XDATCAR_scale_wrong', 'XDATCAR_cell_wrong', 'XDATCAR_composition_wrong', 'XDATCAR_pos_wrong']:
+            with self.subTest(folder=folder):
+                self.assertRaises(ValueError, read_xdatcar, os.path.join(data_folder, folder, 'XDATCAR'))
+
+    def test_memory_map(self):
+        """Checks that the configurations stored in a .npy file are memory-mapped and reused.
+        """
+
+        file_name = os.path.join(data_folder, 'XDATCAR_ok', 'XDATCAR')
+        expected  = read_xdatcar(file_name)['positions']
+
+        with tempfile.TemporaryDirectory() as folder:
+            cache_file = os.path.join(folder, 'positions.npy')
+            for _ in range(2):  # Written, then reused
+                positions = read_xdatcar(file_name, cache_file=cache_file)['positions']
+                self.assertIsInstance(positions, np.memmap)
+                np.testing.assert_array_equal(positions, expected)
+            del positions
+
+    def test_time_axis(self):
+        """Checks the time axis from POTIM and NBLOCK, and that both are required.
+        """
+
+        incar = read_incar(os.path.join(data_folder, 'INCAR_both_ok', 'INCAR'))
+        self.assertEqual((incar['POTIM'], incar['NBLOCK'], incar['LWAVE']), (1.5, 10, False))
+        np.testing.assert_allclose(get_time_axis(3, incar), [0, 15, 30])
+
+        for folder in ['INCAR_POTIM_missing', 'INCAR_NBLOCK_missing']:
+            with self.subTest(folder=folder):
+                incar = read_incar(os.path.join(data_folder, folder, 'INCAR'))
+                self.assertRaises(ValueError, get_time_axis, 3, incar)